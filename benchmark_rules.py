@@ -0,0 +1,144 @@
+"""
+Rule Scanner Benchmark
+
+This script compares the fused single-pass rule scanner against the previous
+one-scan-per-rule implementation on large documents and checks that both
+produce the same evaluation results.
+
+Usage:
+    python benchmark_rules.py [--sizes 50 200 1000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import timeit
+from typing import Any, Dict, List
+
+from rule_scanner import scan_rules
+
+
+SAMPLE_PARAGRAPHS = [
+    "<h2>House cleaning prices in Amsterdam</h2>",
+    "Our professional cleaning team offers competitive rates starting at €25,- per hour.",
+    "- Basic cleaning: €25-30 per hour",
+    "- Deep cleaning: € 35,50 per hour ,depending on the size of the house.",
+    "1. Weekly service: 15% discount on hourly rates",
+    "We provide transparent pricing with no hidden fees.Contact us today  for a quote.",
+    "The price for a one-time cleaning is 75 to 150 euro depending on house size.",
+    "Moving costs in the US start at $ 400 for a small apartment .",
+    "Expenses for materials are included in the tariff!",
+    "Local cleaners serve every district of the city, including Noord and Zuid.",
+    ("A clean home makes a real difference to how you feel at the end of a long "
+     "working day, and our team understands that every household has its own "
+     "rhythm, its own priorities and its own idea of what clean really means"),
+    ("Before the first visit we walk through the house with you, agree on the "
+     "rooms that need the most attention and write down any special requests "
+     "so that every cleaner who visits knows exactly what you expect"),
+    ("Our cleaners are trained in house and are supported by a small team of "
+     "supervisors who check in regularly, answer questions and make sure that "
+     "the quality of the work stays consistent from week to week"),
+    ("Many of our customers started with a single deep clean after moving into "
+     "a new home and then decided to keep a regular schedule because it saved "
+     "them time and gave them more freedom on weekends"),
+]
+
+
+def legacy_rule_results(text: str) -> Dict[str, Any]:
+    """Evaluate the rules with one regex scan per rule, as before fusion."""
+    text_lower = text.lower()
+
+    issues = text.count('  ')
+    issues += len(re.findall(r'[a-z]\.[A-Z]', text))
+    issues += len(re.findall(r'\s+[,.!?]', text))
+
+    price_terms = ['cost', 'price', 'fee', 'expense', '€', '$']
+    price_score = sum(1 for term in price_terms if term in text_lower)
+    price_patterns = [r'€\s*\d+', r'\$\s*\d+', r'price.*\d+']
+    pattern_matches = sum(
+        1 for pattern in price_patterns
+        if re.search(pattern, text, re.IGNORECASE)
+    )
+
+    heading_counts = [
+        len(re.findall(rf'<h{level}[^>]*>', text, re.IGNORECASE))
+        for level in (1, 2, 3)
+    ]
+
+    format_patterns = [r'€\s*\d+,-', r'€\s*\d+\.\d+,-', r'€\s*\d+,\d+']
+    correct_prices = any(re.search(pattern, text) for pattern in format_patterns)
+    percent = bool(re.search(r'\d+%', text))
+    bullet_patterns = [r'^\s*[-•*]\s+', r'^\s*\d+\.\s+']
+    bullets = any(re.search(pattern, text, re.MULTILINE) for pattern in bullet_patterns)
+
+    return {
+        "issues": issues,
+        "price_score": price_score,
+        "pattern_matches": pattern_matches,
+        "heading_counts": heading_counts,
+        "correct_prices": correct_prices,
+        "percent": percent,
+        "bullets": bullets
+    }
+
+
+def fused_rule_results(text: str) -> Dict[str, Any]:
+    """Evaluate the rules with the fused single-pass scanner."""
+    hits = scan_rules(text, text.lower())
+
+    return {
+        "issues": hits.double_spaces + hits.sentence_joins + hits.space_before_punctuation,
+        "price_score": len(hits.price_terms),
+        "pattern_matches": hits.euro_amount + hits.dollar_amount + hits.price_amount,
+        "heading_counts": [hits.heading_counts[level] for level in (1, 2, 3)],
+        "correct_prices": hits.euro_formatted,
+        "percent": hits.percent,
+        "bullets": hits.bullets
+    }
+
+
+def build_document(size_kb: int, seed: int = 42) -> str:
+    """Build a pseudo-random document of roughly size_kb kilobytes."""
+    rng = random.Random(seed)
+    paragraphs: List[str] = []
+    length = 0
+
+    while length < size_kb * 1024:
+        paragraph = rng.choice(SAMPLE_PARAGRAPHS)
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 1
+
+    return "\n".join(paragraphs)
+
+
+def main() -> None:
+    """Run the benchmark and print timings per document size."""
+    parser = argparse.ArgumentParser(description='Benchmark the fused rule scanner')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 1000],
+                        help='Document sizes in KB (default: 50 200 1000)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timed runs per size; the best run is reported')
+    args = parser.parse_args()
+
+    print(f"{'Size':>8} | {'Per-rule scans':>15} | {'Fused scan':>11} | {'Speedup':>7}")
+    print(f"{'-' * 8}-|-{'-' * 15}-|-{'-' * 11}-|-{'-' * 7}")
+
+    for size_kb in args.sizes:
+        text = build_document(size_kb)
+
+        legacy = legacy_rule_results(text)
+        fused = fused_rule_results(text)
+        if legacy != fused:
+            raise AssertionError(f"Results differ at {size_kb} KB: {legacy} != {fused}")
+
+        legacy_time = min(timeit.repeat(
+            lambda: legacy_rule_results(text), number=1, repeat=args.repeat))
+        fused_time = min(timeit.repeat(
+            lambda: fused_rule_results(text), number=1, repeat=args.repeat))
+
+        print(f"{size_kb:>6}KB | {legacy_time * 1000:>12.1f} ms | "
+              f"{fused_time * 1000:>8.1f} ms | {legacy_time / fused_time:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Circuit Breaker Module
+
+This module stops calls to a degraded service for a while once it keeps
+failing or answering too slowly, so callers fall back at once instead of
+each waiting out its own failure. After a cool-down a few probe calls are
+let through; the circuit closes again when a probe succeeds.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Constants
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_LATENCY_THRESHOLD_SECONDS = 30.0
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_HALF_OPEN_PROBES = 1
+
+
+class CircuitOpenError(Exception):
+    """The circuit is open, so the call was not made."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed / open / half-open circuit breaker.
+
+    Attributes:
+        name: Service name used in error messages
+        failure_threshold: Consecutive failures that open the circuit
+        latency_threshold: Seconds after which a successful call still counts
+            as a failure, or None to ignore latency
+        open_seconds: How long the circuit stays open before probing
+        half_open_probes: Calls let through at once while half-open
+        is_failure: Decides whether an exception means the service is
+            degraded (default: every exception); other errors count as
+            successful calls
+        is_ignored: Decides whether an exception says nothing about the
+            service either way (e.g. a timeout set by the caller's own
+            deadline); such calls are neither failures nor successes
+        state: Current state (closed, open or half-open)
+        calls: Calls made through the breaker
+        failures: Calls that failed or exceeded the latency threshold
+        rejected: Calls refused while the circuit was open
+        transitions: (wall-clock time, old state, new state, reason) of each
+            state change
+    """
+
+    def __init__(self, name: str,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 latency_threshold: Optional[float] = DEFAULT_LATENCY_THRESHOLD_SECONDS,
+                 open_seconds: float = DEFAULT_OPEN_SECONDS,
+                 half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+                 is_failure: Optional[Callable[[Exception], bool]] = None,
+                 is_ignored: Optional[Callable[[Exception], bool]] = None):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.latency_threshold = latency_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self.is_failure = is_failure or (lambda error: True)
+        self.is_ignored = is_ignored or (lambda error: False)
+        self.state = CLOSED
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.transitions: List[Tuple[float, str, str, str]] = []
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str, reason: str) -> None:
+        """Change state and record why; call with the lock held."""
+        self.transitions.append((time.time(), self.state, state, reason))
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._consecutive_failures = 0
+        self._probes = 0
+
+    def _cooled_down(self) -> bool:
+        """Check whether an open circuit may be probed; call with the lock held."""
+        return time.monotonic() - self._opened_at >= self.open_seconds
+
+    def check(self) -> None:
+        """
+        Fail fast if a call would be refused, without taking a probe slot.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and still cooling down
+        """
+        with self._lock:
+            if self.state == OPEN and not self._cooled_down():
+                self.rejected += 1
+                raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def _admit(self) -> bool:
+        """Let a call through or refuse it; returns True if it is a probe."""
+        with self._lock:
+            if self.state == OPEN:
+                if not self._cooled_down():
+                    self.rejected += 1
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                self._transition(HALF_OPEN, f"probing after {self.open_seconds:.0f}s")
+
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"{self.name} circuit is half-open, probe in flight")
+                self._probes += 1
+                self.calls += 1
+                return True
+
+            self.calls += 1
+            return False
+
+    def _release(self, probe: bool) -> None:
+        """Free a probe slot without recording an outcome."""
+        with self._lock:
+            if probe and self.state == HALF_OPEN:
+                self._probes -= 1
+
+    def _record(self, probe: bool, failure: Optional[str]) -> None:
+        """Update the state with the outcome of a call."""
+        with self._lock:
+            if probe and self.state == HALF_OPEN:
+                self._probes -= 1
+
+            if failure is None:
+                self._consecutive_failures = 0
+                if probe and self.state == HALF_OPEN:
+                    self._transition(CLOSED, "probe succeeded")
+                return
+
+            self.failures += 1
+            self._consecutive_failures += 1
+            if probe and self.state == HALF_OPEN:
+                self._transition(OPEN, f"probe failed: {failure}")
+            elif (self.state == CLOSED
+                  and self._consecutive_failures >= self.failure_threshold):
+                self._transition(
+                    OPEN, f"{self._consecutive_failures} consecutive failures, "
+                          f"last: {failure}")
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """
+        Make a call unless the circuit is open.
+
+        Args:
+            func: Call to make
+
+        Returns:
+            Result of the call
+
+        Raises:
+            CircuitOpenError: If the circuit refused the call
+            Exception: Whatever the call raised
+        """
+        probe = self._admit()
+        start = time.monotonic()
+        try:
+            result = func()
+        except Exception as e:
+            if self.is_ignored(e):
+                self._release(probe)
+            else:
+                self._record(probe, type(e).__name__ if self.is_failure(e) else None)
+            raise
+
+        elapsed = time.monotonic() - start
+        if self.latency_threshold is not None and elapsed > self.latency_threshold:
+            self._record(probe, f"took {elapsed:.1f}s")
+        else:
+            self._record(probe, None)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker counters for this process.
+
+        Returns:
+            Dictionary with state, calls, failures, rejected and transitions
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "calls": self.calls,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "transitions": list(self.transitions)
+            }
@@ -0,0 +1,324 @@
+"""
+Document Model Module
+
+This module turns a Google Docs API document into a compact model of its
+text, headings, links, list items and tables in a single pass over the body,
+so evaluators can query document structure that the flattened text loses.
+Responses can also be parsed as they stream in, one body element at a time,
+without ever holding the whole JSON tree.
+"""
+
+import io
+import json
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+
+# Constants
+HEADING_STYLE_PREFIX = "HEADING_"
+MAX_HEADING_LEVEL = 6
+# ijson prefix of the top-level structural elements of the body
+BODY_ELEMENT_PREFIX = "body.content.item"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class DocumentModel:
+    """
+    Structured view of a Google Doc.
+
+    Attributes:
+        revision_id: Revision ID of the fetched content, if requested
+        text: Plain text of the body, including table cell text
+        headings: (level, text) pairs for HEADING_1 to HEADING_6 paragraphs
+        heading_counts: Number of headings per level (1 to 6)
+        links: (url, link_text) pairs, one per run of text with the same link
+        list_items: Text of every bulleted or numbered paragraph
+        tables: Tables as rows of cell texts
+    """
+
+    def __init__(self):
+        self.revision_id: Optional[str] = None
+        self.text = ""
+        self.headings: List[Tuple[int, str]] = []
+        self.heading_counts: Dict[int, int] = {
+            level: 0 for level in range(1, MAX_HEADING_LEVEL + 1)
+        }
+        self.links: List[Tuple[str, str]] = []
+        self.list_items: List[str] = []
+        self.tables: List[List[List[str]]] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the model to JSON-serialisable data.
+
+        Returns:
+            Dictionary with every attribute of the model
+        """
+        return {
+            "revision_id": self.revision_id,
+            "text": self.text,
+            "headings": self.headings,
+            "links": self.links,
+            "list_items": self.list_items,
+            "tables": self.tables
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocumentModel":
+        """
+        Rebuild a model from to_dict data.
+
+        Args:
+            data: Dictionary produced by to_dict
+
+        Returns:
+            DocumentModel equal to the one that was converted
+        """
+        model = cls()
+        model.revision_id = data.get("revision_id")
+        model.text = data.get("text", "")
+        model.headings = [(level, text) for level, text in data.get("headings", [])]
+        for level, _ in model.headings:
+            model.heading_counts[level] += 1
+        model.links = [(url, text) for url, text in data.get("links", [])]
+        model.list_items = data.get("list_items", [])
+        model.tables = data.get("tables", [])
+        return model
+
+
+def build_document_model(document: Dict[str, Any]) -> DocumentModel:
+    """
+    Build a document model from a documents().get response.
+
+    Args:
+        document: Google Docs API document resource
+
+    Returns:
+        DocumentModel for the document
+    """
+    model = DocumentModel()
+    model.revision_id = document.get('revisionId')
+    text = io.StringIO()
+    body_content = document.get('body', {}).get('content', [])
+
+    _collect_content(body_content, model, text)
+    model.text = text.getvalue()
+
+    return model
+
+
+def parse_document_stream(chunks: Iterable[bytes]) -> DocumentModel:
+    """
+    Build a document model from a documents().get response body in chunks.
+
+    Args:
+        chunks: Consecutive pieces of the JSON response body
+
+    Returns:
+        DocumentModel for the document
+    """
+    parser = DocumentStreamParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def iter_chunks(content: bytes, size: int = STREAM_CHUNK_SIZE) -> Iterable[memoryview]:
+    """Split an in-memory response body into chunks without copying it."""
+    view = memoryview(content)
+    for offset in range(0, len(view), size):
+        yield view[offset:offset + size]
+
+
+class DocumentStreamParser:
+    """
+    Incremental documents().get parser.
+
+    With ijson installed, each top-level body element is assembled and added
+    to the model as soon as its JSON is complete and then dropped, so memory
+    is bounded by the largest single paragraph or table rather than by the
+    document. Without ijson the body is buffered and parsed at close.
+    """
+
+    def __init__(self):
+        self.model = DocumentModel()
+        self._text = io.StringIO()
+        self._element: Any = None
+        try:
+            import ijson
+        except ImportError:
+            self._ijson = None
+            self._chunks: List[bytes] = []
+            return
+
+        self._ijson = ijson
+        self._events = ijson.sendable_list()
+        self._coroutine = ijson.parse_coro(self._events, use_float=True)
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Parse the next piece of the response body.
+
+        Args:
+            chunk: Bytes following the previously fed ones
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if self._ijson is None:
+            self._chunks.append(bytes(chunk))
+            return
+
+        try:
+            self._coroutine.send(bytes(chunk))
+        except self._ijson.JSONError as e:
+            raise ValueError(f"Invalid document JSON: {e}") from e
+        self._consume_events()
+
+    def close(self) -> DocumentModel:
+        """
+        Finish parsing once the whole body has been fed.
+
+        Returns:
+            DocumentModel for the document
+
+        Raises:
+            ValueError: If the body is not complete, valid JSON
+        """
+        if self._ijson is None:
+            return build_document_model(json.loads(b''.join(self._chunks)))
+
+        try:
+            self._coroutine.close()
+        except self._ijson.JSONError as e:
+            raise ValueError(f"Invalid document JSON: {e}") from e
+        self._consume_events()
+        self.model.text = self._text.getvalue()
+        return self.model
+
+    def _consume_events(self) -> None:
+        """Route parsed events to the model and the element being assembled."""
+        for prefix, event, value in self._events:
+            if self._element is not None:
+                self._element.event(event, value)
+                if prefix == BODY_ELEMENT_PREFIX and event == 'end_map':
+                    _collect_content([self._element.value], self.model, self._text)
+                    self._element = None
+            elif prefix == BODY_ELEMENT_PREFIX and event == 'start_map':
+                self._element = self._ijson.ObjectBuilder()
+                self._element.event(event, value)
+            elif prefix == 'revisionId' and event == 'string':
+                self.model.revision_id = value
+        del self._events[:]
+
+
+def _collect_content(content: List[Dict[str, Any]], model: DocumentModel,
+                     text: TextIO) -> None:
+    """
+    Add a list of structural elements to the model.
+
+    Args:
+        content: Structural elements of the body or of a table cell
+        model: Model being built
+        text: Buffer receiving the text of the whole document, in order
+    """
+    for element in content:
+        if 'paragraph' in element:
+            _collect_paragraph(element['paragraph'], model, text)
+        elif 'table' in element:
+            model.tables.append(_collect_table(element['table'], model, text))
+
+
+def _collect_paragraph(paragraph: Dict[str, Any], model: DocumentModel,
+                       text: TextIO) -> None:
+    """
+    Add a paragraph's text, heading, links and list item to the model.
+
+    Args:
+        paragraph: Paragraph structural element
+        model: Model being built
+        text: Buffer receiving the text of the whole document, in order
+    """
+    runs: List[str] = []
+    link_url: Optional[str] = None
+    link_runs: List[str] = []
+
+    for element in paragraph.get('elements', []):
+        text_run = element.get('textRun')
+        if text_run is None:
+            continue
+
+        content = text_run.get('content', '')
+        runs.append(content)
+
+        # Docs splits a link into several runs when its styling changes
+        url = _link_url(text_run.get('textStyle', {}).get('link'))
+        if url != link_url and link_url is not None:
+            model.links.append((link_url, ''.join(link_runs).strip()))
+            link_runs = []
+        link_url = url
+        if url is not None:
+            link_runs.append(content)
+
+    if link_url is not None:
+        model.links.append((link_url, ''.join(link_runs).strip()))
+
+    paragraph_text = ''.join(runs)
+    text.write(paragraph_text)
+    stripped = paragraph_text.strip()
+
+    style = paragraph.get('paragraphStyle', {}).get('namedStyleType', '')
+    if style.startswith(HEADING_STYLE_PREFIX) and stripped:
+        level = int(style[len(HEADING_STYLE_PREFIX):])
+        model.headings.append((level, stripped))
+        model.heading_counts[level] += 1
+
+    if 'bullet' in paragraph and stripped:
+        model.list_items.append(stripped)
+
+
+def _collect_table(table: Dict[str, Any], model: DocumentModel,
+                   text: TextIO) -> List[List[str]]:
+    """
+    Add a table's cells to the model.
+
+    Args:
+        table: Table structural element
+        model: Model being built
+        text: Buffer receiving the text of the whole document, in order
+
+    Returns:
+        Table as rows of stripped cell texts
+    """
+    rows = []
+
+    for table_row in table.get('tableRows', []):
+        cells = []
+        for table_cell in table_row.get('tableCells', []):
+            cell_text = io.StringIO()
+            _collect_content(table_cell.get('content', []), model, cell_text)
+            cell = cell_text.getvalue()
+            text.write(cell)
+            cells.append(cell.strip())
+        rows.append(cells)
+
+    return rows
+
+
+def _link_url(link: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Get the target of a text style link.
+
+    Args:
+        link: textStyle.link object, if any
+
+    Returns:
+        External URL, '#'-prefixed heading or bookmark ID, or None
+    """
+    if not link:
+        return None
+    if 'url' in link:
+        return link['url']
+    for key in ('headingId', 'bookmarkId'):
+        if key in link:
+            return f"#{link[key]}"
+    return None
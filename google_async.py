@@ -0,0 +1,295 @@
+"""
+Async Google Client Module
+
+This module reads Google Docs and Sheets over httpx on an asyncio event loop,
+so hundreds of fetches can be in flight from one thread. It covers only the
+endpoints the proofreader uses and reuses the OAuth credentials of the
+synchronous googleapiclient services.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional
+
+import httpx
+
+from quota_scheduler import QuotaScheduler
+from token_cache import TokenCache
+
+
+# Constants
+DOCS_API_URL = "https://docs.googleapis.com/v1"
+SHEETS_API_URL = "https://sheets.googleapis.com/v4"
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_TIMEOUT_SECONDS = 60.0
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class GoogleAPIError(Exception):
+    """
+    Failed Google API call.
+
+    Attributes:
+        status: HTTP status code, or None if no response was received
+        retry_after: Server-requested delay in seconds, or None
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Decide whether a failed async call is worth retrying.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        None if the call must not be retried, otherwise the delay in seconds
+        requested by the server (0 if none)
+    """
+    if not isinstance(error, GoogleAPIError) or error.status not in RETRYABLE_STATUSES:
+        return None
+    return error.retry_after or 0.0
+
+
+class AsyncGoogleClient:
+    """
+    Async client for documents.get and spreadsheets (values) reads.
+
+    Requests share one pooled httpx.AsyncClient, so connections are kept
+    alive and concurrency is capped at max_connections. The client must be
+    used from a single event loop, preferably as an async context manager.
+    """
+
+    def __init__(self, credentials: Any,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 scheduler: Optional[QuotaScheduler] = None,
+                 timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 token_cache: Optional[TokenCache] = None):
+        self.credentials = credentials
+        self.scheduler = scheduler
+        self.token_cache = token_cache
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections)
+        )
+        self._refresh_lock = asyncio.Lock()
+        # httpcore scans its whole request queue for every connection event,
+        # so queue requests here rather than in the connection pool
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def __aenter__(self) -> "AsyncGoogleClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._http.aclose()
+
+    async def _authorization(self) -> str:
+        """Get the bearer token, refreshing the shared credentials if needed."""
+        if not self.credentials.valid:
+            async with self._refresh_lock:
+                if not self.credentials.valid:
+                    import google_auth_httplib2
+                    import httplib2
+
+                    # google-auth refreshes synchronously; keep it off the loop
+                    request = google_auth_httplib2.Request(httplib2.Http())
+                    if self.token_cache is not None:
+                        refresh = functools.partial(
+                            self.token_cache.refresh, self.credentials, request)
+                    else:
+                        refresh = functools.partial(self.credentials.refresh, request)
+                    await asyncio.get_running_loop().run_in_executor(None, refresh)
+        return f"Bearer {self.credentials.token}"
+
+    @staticmethod
+    def _status_error(url: str, response: httpx.Response) -> GoogleAPIError:
+        """Build the error for a response with a failure status."""
+        try:
+            delay = float(response.headers.get("retry-after", 0))
+        except ValueError:
+            delay = 0.0
+        return GoogleAPIError(
+            f"{url} returned {response.status_code}: {response.text[:200]}",
+            response.status_code, delay)
+
+    async def _send(self, url: str, params: Any) -> Dict[str, Any]:
+        """Make one GET request and decode its JSON body."""
+        headers = {"Authorization": await self._authorization()}
+        try:
+            async with self._slots:
+                response = await self._http.get(url, params=params, headers=headers)
+        except httpx.HTTPError as e:
+            raise GoogleAPIError(f"{url}: {e}") from e
+
+        if response.status_code >= 400:
+            raise self._status_error(url, response)
+        return response.json()
+
+    async def _send_stream(self, url: str, params: Any,
+                           parser_factory: Callable[[], Any]) -> Any:
+        """Make one GET request and feed its body to a parser as it arrives."""
+        headers = {"Authorization": await self._authorization()}
+        try:
+            async with self._slots:
+                async with self._http.stream(
+                        "GET", url, params=params, headers=headers) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        raise self._status_error(url, response)
+
+                    parser = parser_factory()
+                    async for chunk in response.aiter_bytes():
+                        parser.feed(chunk)
+                    return parser.close()
+        except httpx.HTTPError as e:
+            raise GoogleAPIError(f"{url}: {e}") from e
+
+    async def _call(self, api: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Make a request, paced and retried by the scheduler if there is one."""
+        if self.scheduler is None:
+            return await send()
+        return await self.scheduler.run_async(api, send, retry_after)
+
+    async def _get(self, api: str, url: str, params: Any) -> Dict[str, Any]:
+        """Make a GET request and decode its JSON body."""
+        return await self._call(api, lambda: self._send(url, params))
+
+    async def get_document(self, doc_id: str, fields: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Read a Google Doc (documents.get).
+
+        Args:
+            doc_id: Google Document ID
+            fields: Field mask, or None for the whole document
+
+        Returns:
+            Decoded document resource
+        """
+        params = {"fields": fields} if fields else {}
+        return await self._get("docs", f"{DOCS_API_URL}/documents/{doc_id}", params)
+
+    async def get_document_stream(self, doc_id: str, parser_factory: Callable[[], Any],
+                                  fields: Optional[str] = None) -> Any:
+        """
+        Read a Google Doc (documents.get), parsing the body as it streams in.
+
+        Args:
+            doc_id: Google Document ID
+            parser_factory: Creates a parser with feed(chunk) and close()
+                methods, e.g. document_model.DocumentStreamParser; a new one
+                is created for every attempt
+            fields: Field mask, or None for the whole document
+
+        Returns:
+            Result of the parser's close()
+        """
+        params = {"fields": fields} if fields else {}
+        url = f"{DOCS_API_URL}/documents/{doc_id}"
+        return await self._call(
+            "docs", lambda: self._send_stream(url, params, parser_factory))
+
+    async def get_spreadsheet(self, sheet_id: str,
+                              fields: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Read spreadsheet metadata (spreadsheets.get).
+
+        Args:
+            sheet_id: Google Sheet ID
+            fields: Field mask, or None for all metadata
+
+        Returns:
+            Decoded spreadsheet resource
+        """
+        params = {"fields": fields} if fields else {}
+        return await self._get("sheets", f"{SHEETS_API_URL}/spreadsheets/{sheet_id}", params)
+
+    async def batch_get_values(self, sheet_id: str, ranges: List[str],
+                               fields: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Read several ranges of a spreadsheet (spreadsheets.values.batchGet).
+
+        Args:
+            sheet_id: Google Sheet ID
+            ranges: Ranges in A1 notation
+            fields: Field mask, or None for the whole response
+
+        Returns:
+            Decoded response with one valueRanges entry per range
+        """
+        params = [("ranges", a1_range) for a1_range in ranges]
+        if fields:
+            params.append(("fields", fields))
+        url = f"{SHEETS_API_URL}/spreadsheets/{sheet_id}/values:batchGet"
+        return await self._get("sheets", url, params)
+
+
+class AsyncGoogleRunner:
+    """
+    Event loop thread owning one AsyncGoogleClient for the whole run.
+
+    Any thread can run coroutines on the loop, so all async reads share the
+    client's connection pool and are in flight on the same loop.
+    """
+
+    def __init__(self, client_factory: Callable[[], AsyncGoogleClient]):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="google-async", daemon=True)
+        self._thread.start()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self.client = self.run(self._create(client_factory))
+
+    @staticmethod
+    async def _create(client_factory: Callable[[], AsyncGoogleClient]) -> AsyncGoogleClient:
+        """Create the client on the loop it will be used from."""
+        return client_factory()
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """
+        Start a coroutine on the loop.
+
+        Args:
+            coroutine: Coroutine to run, e.g. one using self.client
+
+        Returns:
+            Future of the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coroutine: Coroutine to run, e.g. one using self.client
+
+        Returns:
+            Result of the coroutine
+        """
+        return self.submit(coroutine).result()
+
+    def close(self) -> None:
+        """Close the client's connections and stop the loop; safe to call twice."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self.run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,108 @@
+"""
+Google Transport Pool Module
+
+This module hands out authorized HTTP transports to worker threads, so
+Google API requests can run in parallel even though a single httplib2.Http
+is not thread-safe. Transports share one credentials object, and with it
+the refreshed access token, and keep their connections alive between uses.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from token_cache import TokenCache
+
+
+# Constants
+DEFAULT_POOL_SIZE = 8
+
+
+class GoogleHttpPool:
+    """
+    Bounded pool of authorized httplib2 transports.
+
+    A transport is used by one thread at a time. Idle transports are reused
+    most-recently-released first, so their keep-alive connections are still
+    open; at most size transports are ever created.
+    """
+
+    def __init__(self, credentials: Any, size: int = DEFAULT_POOL_SIZE,
+                 token_cache: Optional[TokenCache] = None):
+        self.credentials = credentials
+        self.token_cache = token_cache
+        self.size = max(1, size)
+        self.created = 0
+        self.checkouts = 0
+        self.waits = 0
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def _new_transport(self) -> Any:
+        """Create an authorized transport with its own connection cache."""
+        import google_auth_httplib2
+        import httplib2
+
+        return google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+
+    def _checkout(self) -> Any:
+        """Take an idle transport, create one, or wait for one to be released."""
+        with self._lock:
+            self.checkouts += 1
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            if self.created < self.size:
+                self.created += 1
+                return self._new_transport()
+            self.waits += 1
+
+        return self._idle.get()
+
+    def _ensure_fresh(self, transport: Any) -> None:
+        """Refresh the shared access token once, instead of once per thread."""
+        if self.credentials.valid:
+            return
+
+        import google_auth_httplib2
+
+        with self._refresh_lock:
+            if not self.credentials.valid:
+                request = google_auth_httplib2.Request(transport.http)
+                if self.token_cache is not None:
+                    self.token_cache.refresh(self.credentials, request)
+                else:
+                    self.credentials.refresh(request)
+
+    @contextmanager
+    def transport(self) -> Iterator[Any]:
+        """
+        Borrow a transport for the duration of a with-block.
+
+        Yields:
+            google_auth_httplib2.AuthorizedHttp for this thread's exclusive use
+        """
+        transport = self._checkout()
+        try:
+            self._ensure_fresh(transport)
+            yield transport
+        finally:
+            self._idle.put(transport)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters for this process.
+
+        Returns:
+            Dictionary with size, created, checkouts and waits
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self.created,
+                "checkouts": self.checkouts,
+                "waits": self.waits
+            }
@@ -0,0 +1,188 @@
+"""
+Keyword Cache Module
+
+This module caches parsed keyword lists per spreadsheet tab, in memory for
+the current process and on disk in SQLite keyed by the spreadsheet's Drive
+modifiedTime, so documents sharing a keyword spreadsheet resolve their
+keywords without re-reading it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from revision_store import DEFAULT_STATE_PATH
+
+
+# Constants
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+# Keyword lists of one spreadsheet by tab title, in tab order
+KeywordSheet = Dict[str, List[str]]
+
+
+def tab_keywords(sheet: Optional[KeywordSheet], tab: Optional[str] = None) -> List[str]:
+    """
+    Get the keywords of one tab of a keyword spreadsheet.
+
+    Args:
+        sheet: Keyword lists by tab title, or None if the sheet could not be read
+        tab: Tab title, or None for the first tab
+
+    Returns:
+        List of keywords or empty list if the tab does not exist
+    """
+    if not sheet:
+        return []
+    if tab is None:
+        return next(iter(sheet.values()))
+    return sheet.get(tab, [])
+
+
+class KeywordSheetCache:
+    """
+    Two-level cache of parsed keyword spreadsheets.
+
+    Spreadsheets read in this process are reused without any network call.
+    Spreadsheets read by earlier runs are reused from disk as long as their
+    Drive modifiedTime is unchanged.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_STATE_PATH):
+        self.path = path
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.fetches = 0
+        self._sheets: Dict[str, KeywordSheet] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if path is None:
+            return
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS keyword_lists ("
+                " sheet_id TEXT NOT NULL,"
+                " tab TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " modified_time TEXT NOT NULL,"
+                " keywords TEXT NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " PRIMARY KEY (sheet_id, tab))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's SQLite connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT_SECONDS)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_loaded(self, sheet_id: str) -> Optional[KeywordSheet]:
+        """
+        Get a spreadsheet already read or loaded in this process.
+
+        Args:
+            sheet_id: Google Sheet ID
+
+        Returns:
+            Keyword lists by tab or None if the sheet is not loaded
+        """
+        with self._lock:
+            sheet = self._sheets.get(sheet_id)
+            if sheet is not None:
+                self.memory_hits += 1
+            return sheet
+
+    def get_stored(self, sheet_id: str, modified_time: str) -> Optional[KeywordSheet]:
+        """
+        Load a spreadsheet from disk if it has not been modified since it was stored.
+
+        Args:
+            sheet_id: Google Sheet ID
+            modified_time: Current Drive modifiedTime of the spreadsheet
+
+        Returns:
+            Keyword lists by tab or None if there is no up-to-date copy
+        """
+        if self.path is None:
+            return None
+
+        try:
+            rows = self._connection().execute(
+                "SELECT tab, keywords FROM keyword_lists "
+                "WHERE sheet_id = ? AND modified_time = ? ORDER BY position",
+                (sheet_id, modified_time)
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Keyword cache read failed: {e}")
+            return None
+
+        if not rows:
+            return None
+
+        sheet = {tab: json.loads(keywords) for tab, keywords in rows}
+        with self._lock:
+            self._sheets[sheet_id] = sheet
+            self.disk_hits += 1
+        return sheet
+
+    def put(self, sheet_id: str, sheet: KeywordSheet,
+            modified_time: Optional[str] = None) -> None:
+        """
+        Store a freshly read spreadsheet.
+
+        Args:
+            sheet_id: Google Sheet ID
+            sheet: Keyword lists by tab, in tab order
+            modified_time: Drive modifiedTime the sheet was read at; without
+                it the sheet is only kept in memory
+        """
+        with self._lock:
+            self._sheets[sheet_id] = sheet
+            self.fetches += 1
+
+        if self.path is None or not modified_time:
+            return
+
+        now = time.time()
+        try:
+            with self._connection() as conn:
+                conn.execute("DELETE FROM keyword_lists WHERE sheet_id = ?", (sheet_id,))
+                conn.executemany(
+                    "INSERT INTO keyword_lists "
+                    "(sheet_id, tab, position, modified_time, keywords, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (sheet_id, tab, position, modified_time,
+                         json.dumps(keywords, ensure_ascii=False), now)
+                        for position, (tab, keywords) in enumerate(sheet.items())
+                    ]
+                )
+        except sqlite3.Error as e:
+            print(f"Keyword cache write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters for this process.
+
+        Returns:
+            Dictionary with memory_hits, disk_hits and fetches
+        """
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "fetches": self.fetches
+            }
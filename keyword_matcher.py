@@ -0,0 +1,152 @@
+"""
+Keyword Matcher Module
+
+This module provides an Aho-Corasick automaton that finds every keyword of a
+keyword list in a single pass over the text, so matching cost no longer grows
+with the number of keywords.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+
+# Constants
+MATCHER_CACHE_SIZE = 64
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive multi-keyword matcher with whole-word matching.
+
+    A keyword only matches when it is not directly preceded or followed by a
+    letter, digit or underscore, so "cost" does not match inside "costly".
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+
+        # Trie transitions, failure links and (keyword, length) outputs per state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int]]] = [[]]
+
+        for keyword in self.keywords:
+            pattern = keyword.strip().lower()
+            if pattern:
+                self._add_pattern(keyword, pattern)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, keyword: str, pattern: str) -> None:
+        """Insert a lower-cased pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((keyword, len(pattern)))
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find_all(self, text_lower: str) -> Dict[str, List[int]]:
+        """
+        Find whole-word occurrences of every keyword.
+
+        Args:
+            text_lower: Lower-cased text to search
+
+        Returns:
+            Dictionary mapping each keyword to the start offsets of its
+            non-overlapping matches in text_lower
+        """
+        positions: Dict[str, List[int]] = {keyword: [] for keyword in self.keywords}
+        last_end: Dict[str, int] = {}
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        text_length = len(text_lower)
+        state = 0
+
+        for index, char in enumerate(text_lower):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            end = index + 1
+            if end < text_length and _is_word_char(text_lower[end]):
+                continue
+
+            for keyword, length in output[state]:
+                start = end - length
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if start < last_end.get(keyword, 0):
+                    continue
+                positions[keyword].append(start)
+                last_end[keyword] = end
+
+        return positions
+
+    def count(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count whole-word occurrences of every keyword.
+
+        Args:
+            text_lower: Lower-cased text to search
+
+        Returns:
+            Dictionary mapping each keyword to its match count
+        """
+        return {
+            keyword: len(starts)
+            for keyword, starts in self.find_all(text_lower).items()
+        }
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character is part of a word."""
+    return char.isalnum() or char == '_'
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _cached_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Build and memoise a matcher for a keyword tuple."""
+    return KeywordMatcher(keywords)
+
+
+def get_keyword_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """
+    Get a compiled matcher for a keyword list, reusing earlier builds.
+
+    Args:
+        keywords: List of keywords
+
+    Returns:
+        KeywordMatcher for the keywords
+    """
+    return _cached_matcher(tuple(keywords))
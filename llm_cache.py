@@ -0,0 +1,193 @@
+"""
+LLM Response Cache Module
+
+This module provides a persistent, content-addressed cache for OpenAI chat
+completion responses, backed by SQLite in WAL mode so that several processes
+can share one cache file safely.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+# Constants
+DEFAULT_CACHE_PATH = "llm_cache.sqlite3"
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+
+def make_cache_key(model: str, messages: List[Dict[str, str]], temperature: float,
+                   max_tokens: int, **extra: Any) -> str:
+    """
+    Build a content-addressed key for a chat completion request.
+
+    Args:
+        model: Model name
+        messages: Chat messages sent to the model
+        temperature: Sampling temperature
+        max_tokens: Output token budget
+        **extra: Other request parameters that change the response
+
+    Returns:
+        Hex SHA-256 digest of the canonical request payload
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        **extra
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    SQLite-backed LRU cache for LLM responses.
+
+    Entries are evicted least-recently-used first once the stored responses
+    exceed max_bytes, and are ignored once they are older than ttl_seconds.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_seconds: Optional[float] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's SQLite connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT_SECONDS)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached response text or None on a miss or expired entry
+        """
+        now = time.time()
+        conn = self._connection()
+
+        try:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                with conn:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            if row:
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                        (now, key)
+                    )
+        except sqlite3.Error as e:
+            print(f"LLM cache read failed: {e}")
+            row = None
+
+        with self._stats_lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response and evict old entries if the cache is over its cap.
+
+        Args:
+            key: Cache key from make_cache_key
+            response: Response text to store
+        """
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        conn = self._connection()
+
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, response, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, response, size, now, now)
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"LLM cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used entries until the size cap is met."""
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        stale_keys = []
+        for key, size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at ASC"):
+            stale_keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters for this process.
+
+        Returns:
+            Dictionary with hits, misses and lookups
+        """
+        with self._stats_lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "lookups": self.hits + self.misses
+            }
@@ -0,0 +1,313 @@
+"""
+OpenAI Limiter Module
+
+This module shares OpenAI request and token quotas between every evaluation
+in the process. It paces calls with requests-per-minute and tokens-per-minute
+buckets kept in line with the x-ratelimit-* response headers, adapts the
+number of calls in flight AIMD-style, and retries throttled calls with
+jittered backoff until the page's deadline runs out.
+"""
+
+import contextvars
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+from quota_scheduler import TokenBucket
+
+
+# Constants
+OPENAI_REQUESTS_PER_MINUTE = 500
+OPENAI_TOKENS_PER_MINUTE = 200000
+DEFAULT_MAX_IN_FLIGHT = 32
+DEFAULT_PAGE_BUDGET_SECONDS = 120.0
+BASE_RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 30.0
+# Concurrency is halved at most once per interval, however many calls fail
+DECREASE_INTERVAL_SECONDS = 1.0
+CHARS_PER_TOKEN = 4
+RETRYABLE_OPENAI_STATUSES = (408, 409, 429, 500, 502, 503, 504)
+DURATION_PART_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+DURATION_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Monotonic deadline of the page being evaluated in this context
+_page_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "openai_page_deadline", default=None)
+
+
+class RateLimitBudgetExceeded(Exception):
+    """The page deadline passed before the OpenAI quota allowed the call."""
+
+
+def estimate_tokens(text: str, max_tokens: int) -> int:
+    """
+    Estimate the tokens a chat completion counts against the TPM quota.
+
+    Args:
+        text: Prompt text (system and user messages)
+        max_tokens: Output token budget of the request
+
+    Returns:
+        Approximate prompt tokens plus max_tokens
+    """
+    return len(text) // CHARS_PER_TOKEN + max_tokens
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a reset duration such as "1s", "6m0s" or "20ms".
+
+    Args:
+        value: x-ratelimit-reset-* header value
+
+    Returns:
+        Seconds, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    parts = DURATION_PART_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * DURATION_UNIT_SECONDS[unit] for amount, unit in parts)
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    """Read a numeric header, ignoring missing or malformed values."""
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class OpenAIRateLimiter:
+    """
+    Process-wide pacing, adaptive concurrency and retries for OpenAI calls.
+
+    Attributes:
+        limit: Current number of calls allowed in flight
+        requests: Calls started, including retries
+        throttled: Calls rejected with 429
+        retries: Calls retried after a failure
+        exhausted: Calls given up on because the page deadline passed
+    """
+
+    def __init__(self, requests_per_minute: float = OPENAI_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = OPENAI_TOKENS_PER_MINUTE,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 page_budget: float = DEFAULT_PAGE_BUDGET_SECONDS):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_in_flight = max(1, max_in_flight)
+        self.page_budget = page_budget
+        self.limit = float(self.max_in_flight)
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.exhausted = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def page(self) -> Iterator[None]:
+        """
+        Give the OpenAI calls made within a with-block one shared deadline.
+
+        Threads evaluating the page must run in a copy of this context
+        (contextvars.copy_context) to see the deadline.
+        """
+        token = _page_deadline.set(time.monotonic() + self.page_budget)
+        try:
+            yield
+        finally:
+            _page_deadline.reset(token)
+
+    def _deadline(self) -> float:
+        """Get the current page's deadline, or a fresh one outside a page."""
+        deadline = _page_deadline.get()
+        return deadline if deadline is not None else time.monotonic() + self.page_budget
+
+    def _wait(self, seconds: float, deadline: float) -> None:
+        """Sleep unless that would pass the deadline."""
+        if time.monotonic() + seconds > deadline:
+            with self._condition:
+                self.exhausted += 1
+            raise RateLimitBudgetExceeded(
+                f"OpenAI quota needs {seconds:.1f}s more than the page budget allows")
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _enter(self, deadline: float) -> None:
+        """Wait for a concurrency slot."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.exhausted += 1
+                    raise RateLimitBudgetExceeded(
+                        "No OpenAI concurrency slot freed up within the page budget")
+                self._condition.wait(remaining)
+            self.in_flight += 1
+            self.requests += 1
+
+    def _leave(self, succeeded: bool, throttled: bool = False) -> None:
+        """Release a slot and adapt the concurrency limit; other failures leave it alone."""
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                self.throttled += 1
+                if now - self._last_decrease >= DECREASE_INTERVAL_SECONDS:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = now
+            elif succeeded:
+                self.limit = min(float(self.max_in_flight), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _finish(self, call: Callable[[], Any]) -> Any:
+        """Make a call that holds a slot, then release the slot and learn from the outcome."""
+        try:
+            response = call()
+        except Exception as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            self._leave(succeeded=False, throttled=status == 429)
+            raise
+        self._leave(succeeded=True)
+        self.observe(getattr(response, "headers", None))
+        return response
+
+    def try_extra(self, call: Callable[[], Any],
+                  tokens: int) -> Optional[Callable[[], Any]]:
+        """
+        Admit an extra, optional call (e.g. a hedge) only if it need not wait.
+
+        Args:
+            call: Makes the request and returns its raw response (with headers)
+            tokens: Estimated tokens the call counts against the TPM quota
+
+        Returns:
+            The call, holding quota and a concurrency slot until it finishes,
+            or None if either would have to be waited for; it is not retried
+        """
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return None
+            if max(self.request_bucket.reserve(1), self.token_bucket.reserve(tokens)) > 0:
+                self.request_bucket.refund(1)
+                self.token_bucket.refund(tokens)
+                return None
+            self.in_flight += 1
+            self.requests += 1
+        return lambda: self._finish(call)
+
+    def observe(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """
+        Update the quota buckets from x-ratelimit-* response headers.
+
+        Args:
+            headers: Response headers, if any
+
+        Returns:
+            Seconds until an exhausted quota resets, or None if neither quota
+            is exhausted (or the headers do not say)
+        """
+        if headers is None:
+            return None
+
+        reset = None
+        for kind, bucket in (("requests", self.request_bucket),
+                             ("tokens", self.token_bucket)):
+            remaining = _header_number(headers, f"x-ratelimit-remaining-{kind}")
+            bucket.sync(_header_number(headers, f"x-ratelimit-limit-{kind}"), remaining)
+            if remaining is not None and remaining < 1:
+                kind_reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                if kind_reset is not None:
+                    reset = max(reset or 0.0, kind_reset)
+        return reset
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Get the backoff before retrying a failed call, or None if it must not be retried."""
+        import openai
+
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        if (status not in RETRYABLE_OPENAI_STATUSES
+                and not isinstance(error, openai.APIConnectionError)):
+            return None
+        # An exhausted billing quota will not recover by waiting
+        if getattr(error, "code", None) == "insufficient_quota":
+            return None
+
+        headers = getattr(response, "headers", None)
+        server_delay = self.observe(headers) or 0.0
+        retry_after = _header_number(headers or {}, "retry-after") or 0.0
+
+        ceiling = min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * (2 ** attempt))
+        return max(random.uniform(0, ceiling), server_delay, retry_after)
+
+    def run(self, call: Callable[[], Any], tokens: int,
+            deadline: Optional[float] = None) -> Any:
+        """
+        Make an OpenAI call within the shared quotas, retrying until the deadline.
+
+        Args:
+            call: Makes the request and returns its raw response (with headers)
+            tokens: Estimated tokens the call counts against the TPM quota
+            deadline: Monotonic time to give up by if sooner than the page's
+
+        Returns:
+            Raw response of the call
+
+        Raises:
+            RateLimitBudgetExceeded: If the quota cannot be had before the deadline
+            Exception: The last error of a call that cannot be retried, or that
+                still fails when the deadline passes
+        """
+        page_deadline = self._deadline()
+        deadline = page_deadline if deadline is None else min(page_deadline, deadline)
+        attempt = 0
+
+        while True:
+            delay = max(self.request_bucket.reserve(1), self.token_bucket.reserve(tokens))
+            try:
+                self._wait(delay, deadline)
+                self._enter(deadline)
+            except RateLimitBudgetExceeded:
+                # The call is not made, so later calls must not wait for its quota
+                self.request_bucket.refund(1)
+                self.token_bucket.refund(tokens)
+                raise
+
+            try:
+                return self._finish(call)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or time.monotonic() + delay > deadline:
+                    if delay is not None:
+                        with self._condition:
+                            self.exhausted += 1
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                with self._condition:
+                    self.retries += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter counters for this process.
+
+        Returns:
+            Dictionary with requests, throttled, retries, exhausted and the
+            current concurrency limit
+        """
+        with self._condition:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "limit": int(self.limit)
+            }
@@ -0,0 +1,289 @@
+"""
+Quota Scheduler Module
+
+This module paces API calls with per-API token buckets sized from the
+per-minute quotas and retries throttled calls with jittered exponential
+backoff, bounded by a retry budget so retries cannot snowball under load.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+# Constants
+DEFAULT_MAX_RETRIES = 6
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 64.0
+# Retries may add this fraction of the calls made so far, plus a fixed floor
+DEFAULT_RETRY_RATIO = 0.2
+DEFAULT_MIN_RETRY_BUDGET = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled at a fixed per-minute rate.
+
+    A caller may take more tokens than the bucket holds (e.g. for a batch
+    request); the balance then goes negative and later callers wait until
+    it has been paid back.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update; call with the lock held."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens now and get how long to wait before using them.
+
+        Args:
+            tokens: Number of tokens (API calls) to take
+
+        Returns:
+            Seconds until the bucket would have covered the tokens
+        """
+        with self._lock:
+            self._refill()
+            needed = min(tokens, self.capacity)
+            delay = max(0.0, (needed - self._tokens) / self.rate_per_second)
+            self._tokens -= tokens
+            return delay
+
+    def refund(self, tokens: float = 1) -> None:
+        """
+        Give back tokens reserved for a call that was not made.
+
+        Args:
+            tokens: Number of tokens taken by reserve()
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def sync(self, rate_per_minute: Optional[float] = None,
+             available: Optional[float] = None) -> None:
+        """
+        Align the bucket with limits reported by the server.
+
+        Args:
+            rate_per_minute: New refill rate and capacity, if known
+            available: Tokens the server says are left; the balance is
+                lowered to it but never raised, since the server's count
+                does not include calls still in flight
+        """
+        with self._lock:
+            self._refill()
+            if rate_per_minute:
+                self.rate_per_second = rate_per_minute / 60.0
+                self.capacity = rate_per_minute
+            if available is not None:
+                self._tokens = min(self._tokens, available)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens, blocking until the bucket can cover them.
+
+        Args:
+            tokens: Number of tokens (API calls) to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class QuotaScheduler:
+    """
+    Paces calls per API and retries throttled ones within a retry budget.
+
+    Attributes:
+        waits: Number of calls that had to wait for quota
+        retries: Number of retries made
+        exhausted: Number of retryable failures given up on
+    """
+
+    def __init__(self, rates_per_minute: Dict[str, float],
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY,
+                 retry_ratio: float = DEFAULT_RETRY_RATIO,
+                 min_retry_budget: int = DEFAULT_MIN_RETRY_BUDGET):
+        self.buckets = {
+            api: TokenBucket(rate) for api, rate in rates_per_minute.items()
+        }
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_ratio = retry_ratio
+        self.min_retry_budget = min_retry_budget
+        self.calls = 0
+        self.waits = 0
+        self.retries = 0
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, api: str, calls: int, retry: bool) -> float:
+        """Count calls and reserve their quota, returning the delay to honour."""
+        if not retry:
+            with self._lock:
+                self.calls += calls
+
+        bucket = self.buckets.get(api)
+        delay = bucket.reserve(calls) if bucket is not None else 0.0
+        if delay > 0:
+            with self._lock:
+                self.waits += 1
+        return delay
+
+    def acquire(self, api: str, calls: int = 1, retry: bool = False) -> None:
+        """
+        Wait until an API's quota allows more calls.
+
+        Args:
+            api: API name; APIs without a configured quota are not paced
+            calls: Number of calls about to be made
+            retry: Whether the calls are retries, which do not grow the
+                retry budget
+        """
+        delay = self._reserve(api, calls, retry)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, api: str, calls: int = 1, retry: bool = False) -> None:
+        """
+        Wait until an API's quota allows more calls without blocking the event loop.
+
+        Args:
+            api: API name; APIs without a configured quota are not paced
+            calls: Number of calls about to be made
+            retry: Whether the calls are retries, which do not grow the
+                retry budget
+        """
+        delay = self._reserve(api, calls, retry)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def allow_retry(self, attempt: int, calls: int = 1) -> bool:
+        """
+        Spend retry budget for retrying failed calls.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            calls: Number of calls to retry
+
+        Returns:
+            True if the calls may be retried
+        """
+        with self._lock:
+            budget = (self.min_retry_budget + self.retry_ratio * self.calls
+                      - self.retries)
+            if attempt >= self.max_retries or budget < calls:
+                self.exhausted += calls
+                return False
+            self.retries += calls
+            return True
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get a full-jitter exponential backoff delay.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            retry_after: Server-requested delay in seconds, if any
+
+        Returns:
+            Seconds to sleep before the next attempt
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        return max(delay, retry_after or 0.0)
+
+    def run(self, api: str, func: Callable[[], Any],
+            retry_after: Callable[[Exception], Optional[float]]) -> Any:
+        """
+        Run a call within the API's quota, retrying throttled attempts.
+
+        Args:
+            api: API name used to pick the token bucket
+            func: Call to make
+            retry_after: Returns None for errors that must not be retried,
+                otherwise the server-requested delay (0 if none)
+
+        Returns:
+            Result of func
+
+        Raises:
+            Exception: The last error once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            self.acquire(api, retry=attempt > 0)
+            try:
+                return func()
+            except Exception as e:
+                delay = retry_after(e)
+                if delay is None or not self.allow_retry(attempt):
+                    raise
+                time.sleep(self.backoff_delay(attempt, delay))
+                attempt += 1
+
+    async def run_async(self, api: str, func: Callable[[], Awaitable[Any]],
+                        retry_after: Callable[[Exception], Optional[float]]) -> Any:
+        """
+        Await a call within the API's quota, retrying throttled attempts.
+
+        Args:
+            api: API name used to pick the token bucket
+            func: Returns the awaitable call to make
+            retry_after: Returns None for errors that must not be retried,
+                otherwise the server-requested delay (0 if none)
+
+        Returns:
+            Result of func
+
+        Raises:
+            Exception: The last error once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            await self.acquire_async(api, retry=attempt > 0)
+            try:
+                return await func()
+            except Exception as e:
+                delay = retry_after(e)
+                if delay is None or not self.allow_retry(attempt):
+                    raise
+                await asyncio.sleep(self.backoff_delay(attempt, delay))
+                attempt += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get scheduler counters for this process.
+
+        Returns:
+            Dictionary with calls, waits, retries and exhausted counts
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "waits": self.waits,
+                "retries": self.retries,
+                "exhausted": self.exhausted
+            }
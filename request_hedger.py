@@ -0,0 +1,178 @@
+"""
+Request Hedger Module
+
+This module cuts tail latency by hedging slow requests: when a call has
+not answered within the running latency percentile of its kind, a
+duplicate is sent and whichever answers first wins. Hedges are limited to
+a fraction of the calls made, so the extra spend stays bounded.
+"""
+
+import collections
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+# Constants
+DEFAULT_HEDGE_PERCENTILE = 95.0
+# Hedges may add at most this fraction of the calls made so far
+DEFAULT_MAX_EXTRA_RATIO = 0.1
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_LATENCY_WINDOW = 200
+DEFAULT_MAX_WORKERS = 64
+
+
+class RequestHedger:
+    """
+    Sends a duplicate of a call that is slower than usual; the first answer wins.
+
+    Latencies of successful calls are tracked per key (e.g. evaluation type)
+    over a sliding window, and a key is only hedged once it has min_samples
+    latencies. Calls should be single attempts: time spent queueing or
+    backing off belongs outside the hedger.
+    The losing call is left to finish in the background.
+
+    Attributes:
+        calls: Calls made through the hedger
+        hedged: Duplicates sent
+        hedge_wins: Calls answered by their duplicate
+        denied: Slow calls not hedged because the spend cap was reached or
+            the duplicate was not admitted
+    """
+
+    def __init__(self, percentile: float = DEFAULT_HEDGE_PERCENTILE,
+                 max_extra_ratio: float = DEFAULT_MAX_EXTRA_RATIO,
+                 min_samples: int = DEFAULT_MIN_SAMPLES,
+                 window: int = DEFAULT_LATENCY_WINDOW,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        self.percentile = percentile
+        self.max_extra_ratio = max_extra_ratio
+        self.min_samples = max(1, min_samples)
+        self.window = window
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.denied = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, max_workers), thread_name_prefix="hedge")
+
+    def threshold(self, key: str) -> Optional[float]:
+        """
+        Get the latency after which a call of this kind is hedged.
+
+        Args:
+            key: Kind of call
+
+        Returns:
+            The running percentile latency in seconds, or None while there
+            are too few samples
+        """
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return samples[index]
+
+    def _record(self, key: str, latency: float) -> None:
+        """Add a call's latency to its key's window."""
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = collections.deque(maxlen=self.window)
+                self._latencies[key] = latencies
+            latencies.append(latency)
+
+    def _submit(self, call: Callable[[], Any]) -> Future:
+        """Start a call in a copy of the caller's context."""
+        return self._executor.submit(contextvars.copy_context().run, call)
+
+    def _may_hedge(self) -> bool:
+        """Take a hedge from the spend cap, if any is left."""
+        with self._lock:
+            if self.hedged + 1 > self.max_extra_ratio * self.calls:
+                self.denied += 1
+                return False
+            self.hedged += 1
+            return True
+
+    def run(self, key: str, call: Callable[[], Any],
+            admit: Optional[Callable[[], Optional[Callable[[], Any]]]] = None) -> Any:
+        """
+        Make a call, hedging it if it is slower than usual for its key.
+
+        Args:
+            key: Kind of call whose latencies set the hedging threshold
+            call: Call to make; it must be safe to make twice
+            admit: Takes what a duplicate needs (e.g. rate limit quota)
+                without waiting and returns the duplicate call to make, or
+                None to skip the hedge; by default call is duplicated as is
+
+        Returns:
+            Result of whichever call answered first
+
+        Raises:
+            Exception: The primary call's error if no call succeeded
+        """
+        with self._lock:
+            self.calls += 1
+
+        threshold = self.threshold(key)
+        start = time.monotonic()
+        primary = self._submit(call)
+        # Successful primary latencies are recorded even when the call lost,
+        # so stragglers keep counting towards the percentile; failures are
+        # not, as fast errors would pull the threshold down
+        def _record_success(future: Future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                self._record(key, time.monotonic() - start)
+
+        primary.add_done_callback(_record_success)
+
+        if threshold is None:
+            return primary.result()
+
+        done, _ = wait([primary], timeout=threshold)
+        if done or not self._may_hedge():
+            return primary.result()
+
+        duplicate = admit() if admit is not None else call
+        if duplicate is None:
+            with self._lock:
+                self.hedged -= 1
+                self.denied += 1
+            return primary.result()
+
+        hedge = self._submit(duplicate)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+
+        return primary.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters for this process.
+
+        Returns:
+            Dictionary with calls, hedged, hedge_wins, denied and the extra
+            request ratio
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "denied": self.denied,
+                "extra_ratio": self.hedged / self.calls if self.calls else 0.0
+            }
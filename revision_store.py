@@ -0,0 +1,168 @@
+"""
+Revision Store Module
+
+This module records, per Google Doc, the document revision and keyword list
+each report was generated from, backed by SQLite in WAL mode, so later runs
+can skip documents whose content and keywords have not changed.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+# Constants
+DEFAULT_STATE_PATH = "proofreader_state.sqlite3"
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+
+def hash_keywords(keywords: List[str]) -> str:
+    """
+    Hash a keyword list so changes to the keyword sheet can be detected.
+
+    Args:
+        keywords: Keywords in sheet order
+
+    Returns:
+        Hex SHA-256 digest of the keyword list
+    """
+    canonical = json.dumps(keywords, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RevisionStore:
+    """
+    SQLite-backed record of the inputs behind each document's last report.
+
+    A document counts as unchanged when its revision ID, keyword hash and
+    evaluation settings all match the stored row and the report file still
+    exists. Google only guarantees a revision ID for 24 hours, so a changed
+    ID format just causes one extra evaluation, never a stale report.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        self.path = path
+        self.unchanged = 0
+        self.changed = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " doc_id TEXT PRIMARY KEY,"
+                " revision_id TEXT NOT NULL,"
+                " keywords_hash TEXT NOT NULL,"
+                " settings TEXT NOT NULL,"
+                " report_path TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's SQLite connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT_SECONDS)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def find_unchanged(self, doc_id: str, revision_id: str, keywords_hash: str,
+                       settings: str) -> Optional[str]:
+        """
+        Look up the report of an unchanged document and count the outcome.
+
+        Args:
+            doc_id: Google Document ID
+            revision_id: Current revision ID of the document
+            keywords_hash: hash_keywords of the current keyword list
+            settings: Evaluation settings that change the report
+
+        Returns:
+            Path of the stored report, or None if the document must be evaluated
+        """
+        report_path = self.lookup_report(doc_id, revision_id, keywords_hash, settings)
+
+        with self._stats_lock:
+            if report_path:
+                self.unchanged += 1
+            else:
+                self.changed += 1
+
+        return report_path
+
+    def lookup_report(self, doc_id: str, revision_id: str, keywords_hash: str,
+                      settings: str) -> Optional[str]:
+        """
+        Look up the report of an unchanged document without counting it.
+
+        Args:
+            doc_id: Google Document ID
+            revision_id: Current revision ID of the document
+            keywords_hash: hash_keywords of the current keyword list
+            settings: Evaluation settings that change the report
+
+        Returns:
+            Path of the stored report, or None if the document must be evaluated
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT revision_id, keywords_hash, settings, report_path "
+                "FROM documents WHERE doc_id = ?",
+                (doc_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Revision store read failed: {e}")
+            row = None
+
+        if (row and row[:3] == (revision_id, keywords_hash, settings)
+                and os.path.exists(row[3])):
+            return row[3]
+        return None
+
+    def record(self, doc_id: str, revision_id: str, keywords_hash: str,
+               settings: str, report_path: str) -> None:
+        """
+        Store the inputs a document's report was generated from.
+
+        Args:
+            doc_id: Google Document ID
+            revision_id: Revision ID of the evaluated content
+            keywords_hash: hash_keywords of the keyword list used
+            settings: Evaluation settings that change the report
+            report_path: Path of the written report
+        """
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents "
+                    "(doc_id, revision_id, keywords_hash, settings, report_path, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (doc_id, revision_id, keywords_hash, settings,
+                     report_path, time.time())
+                )
+        except sqlite3.Error as e:
+            print(f"Revision store write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get unchanged/changed counters for this process.
+
+        Returns:
+            Dictionary with unchanged, changed and checked counts
+        """
+        with self._stats_lock:
+            return {
+                "unchanged": self.unchanged,
+                "changed": self.changed,
+                "checked": self.unchanged + self.changed
+            }
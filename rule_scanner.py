@@ -0,0 +1,173 @@
+"""
+Rule Scanner Module
+
+This module fuses the regex rules used by the grammar, pricing, structure and
+formatting evaluators into one precompiled pattern with a named group per
+rule, so a single finditer pass collects every rule hit for a document.
+"""
+
+import re
+from typing import Dict, Optional, Pattern, Set, Union
+
+
+# The pattern starts with one character class of rule triggers, which lets
+# the regex engine skip straight to candidate positions. Each alternative
+# then checks its context with lookarounds and marks its rule with an empty
+# named group, so at most the trigger character is consumed. Lookarounds
+# never scan past the next line or tag: checks that would (a digit later on a
+# "price" line, the '>' closing a heading tag) are resolved in scan_rules with
+# memoised forward searches so the whole scan stays linear in the text size.
+RULE_PATTERN = re.compile(
+    r'[,.!?€$%<\npP]'
+    r'(?:(?<=\s[,.!?])(?P<space_before_punctuation>)'
+    r'|(?<=[a-z]\.)(?=[A-Z])(?P<sentence_join>)'
+    r'|(?<=€)(?=\s*\d+(?:,-|,\d|\.\d+,-))(?P<euro_formatted>)'
+    r'|(?<=€)(?=\s*\d)(?P<euro_amount>)'
+    r'|(?<=\$)(?=\s*\d)(?P<dollar_amount>)'
+    r'|(?<=\d%)(?P<percent>)'
+    r'|(?<=<)[hH](?P<heading_level>[1-3])(?P<heading>)'
+    r'|(?<=\n)(?=[^\S\n]*(?:[-•*]|\d+\.)\s)(?P<bullet>)'
+    r'|(?<=[pP])(?=(?i:rice))(?P<price_word>)'
+    r')'
+)
+FIRST_LINE_BULLET_PATTERN = re.compile(r'[^\S\n]*(?:[-•*]|\d+\.)\s')
+DIGIT_PATTERN = re.compile(r'\d')
+
+PRICE_TERMS = ['cost', 'price', 'fee', 'expense', '€', '$']
+
+
+class ForwardFinder:
+    """
+    Memoised "next occurrence at or after a position" lookups.
+
+    Successive calls with non-decreasing start positions reuse the previous
+    result, so a left-to-right scan that repeatedly asks for the next
+    delimiter costs one pass over the text in total.
+    """
+
+    def __init__(self, text: str, needle: Union[str, Pattern]):
+        self._text = text
+        self._needle = needle
+        self._searched_from: Optional[int] = None
+        self._found = -1
+
+    def find(self, start: int) -> int:
+        """
+        Find the first occurrence at or after start.
+
+        Args:
+            start: Position to search from
+
+        Returns:
+            Start offset of the occurrence or -1 if there is none
+        """
+        if (self._searched_from is not None and self._searched_from <= start
+                and (self._found == -1 or self._found >= start)):
+            return self._found
+
+        if isinstance(self._needle, str):
+            found = self._text.find(self._needle, start)
+        else:
+            match = self._needle.search(self._text, start)
+            found = match.start() if match else -1
+
+        self._searched_from = start
+        self._found = found
+        return found
+
+
+class RuleHits:
+    """
+    Rule hits collected by scan_rules.
+
+    Attributes:
+        double_spaces: Non-overlapping occurrences of two spaces
+        sentence_joins: Sentences joined without a space (e.g. "end.Next")
+        space_before_punctuation: Whitespace runs directly before , . ! or ?
+        heading_counts: Number of <h1>, <h2> and <h3> tags by level
+        price_terms: Price terms present ('cost', 'price', 'fee', 'expense', '€', '$')
+        euro_amount: Whether a euro amount (e.g. "€ 25") occurs
+        euro_formatted: Whether a correctly formatted euro amount (e.g. "€25,-") occurs
+        dollar_amount: Whether a dollar amount occurs
+        price_amount: Whether "price" is followed by a number on the same line
+        percent: Whether a percentage (e.g. "15%") occurs
+        bullets: Whether a bullet or numbered list line occurs
+    """
+
+    def __init__(self):
+        self.double_spaces = 0
+        self.sentence_joins = 0
+        self.space_before_punctuation = 0
+        self.heading_counts: Dict[int, int] = {1: 0, 2: 0, 3: 0}
+        self.price_terms: Set[str] = set()
+        self.euro_amount = False
+        self.euro_formatted = False
+        self.dollar_amount = False
+        self.price_amount = False
+        self.percent = False
+        self.bullets = False
+
+
+def scan_rules(text: str, text_lower: Optional[str] = None) -> RuleHits:
+    """
+    Collect every rule hit in a single regex pass over the text.
+
+    Double spaces and price terms are plain substring checks, which str
+    methods already do in one fast scan each.
+
+    Args:
+        text: Content text
+        text_lower: Lower-cased content text (computed if omitted)
+
+    Returns:
+        RuleHits for the text
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+
+    hits = RuleHits()
+    heading_ends = {1: 0, 2: 0, 3: 0}
+    tag_closes = ForwardFinder(text, '>')
+    newlines = ForwardFinder(text, '\n')
+    price_line_end = 0
+    hits.double_spaces = text.count('  ')
+    hits.price_terms = {term for term in PRICE_TERMS if term in text_lower}
+    hits.bullets = FIRST_LINE_BULLET_PATTERN.match(text) is not None
+
+    for match in RULE_PATTERN.finditer(text):
+        rule = match.lastgroup
+
+        if rule == 'space_before_punctuation':
+            hits.space_before_punctuation += 1
+        elif rule == 'sentence_join':
+            hits.sentence_joins += 1
+        elif rule == 'heading':
+            # Like findall, a tag only counts once its level's previous tag has closed
+            level = int(match.group('heading_level'))
+            if match.start() >= heading_ends[level]:
+                tag_close = tag_closes.find(match.end())
+                if tag_close != -1:
+                    hits.heading_counts[level] += 1
+                    heading_ends[level] = tag_close + 1
+        elif rule == 'euro_formatted':
+            hits.euro_amount = True
+            hits.euro_formatted = True
+        elif rule == 'euro_amount':
+            hits.euro_amount = True
+        elif rule == 'dollar_amount':
+            hits.dollar_amount = True
+        elif rule == 'price_word':
+            # Only the first "price" of a line needs checking for a later digit
+            if not hits.price_amount and match.start() >= price_line_end:
+                price_line_end = newlines.find(match.start())
+                if price_line_end == -1:
+                    price_line_end = len(text)
+                digit = DIGIT_PATTERN.search(
+                    text, match.start() + len('price'), price_line_end)
+                hits.price_amount = digit is not None
+        elif rule == 'percent':
+            hits.percent = True
+        elif rule == 'bullet':
+            hits.bullets = True
+
+    return hits
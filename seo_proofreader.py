@@ -5,19 +5,48 @@ This module provides automated SEO content evaluation for cost pages and city pa
 using AI-powered analysis with rule-based fallbacks.
 """
 
+import time
+
+_IMPORT_START = time.perf_counter()
+
 import os
 import re
 import json
+import csv
 import argparse
-from typing import Dict, List, Optional, Tuple, Any
-
-import openai
-from google.auth.exceptions import GoogleAuthError
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-
+import asyncio
+import atexit
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+
+# The OpenAI and Google client libraries are imported on first use, so
+# rule-based runs never pay for loading them
+from circuit_breaker import (DEFAULT_FAILURE_THRESHOLD, DEFAULT_LATENCY_THRESHOLD_SECONDS,
+                             DEFAULT_OPEN_SECONDS, CircuitBreaker, CircuitOpenError)
+from document_model import DocumentModel, DocumentStreamParser, iter_chunks, parse_document_stream
+from google_pool import DEFAULT_POOL_SIZE, GoogleHttpPool
+from keyword_cache import KeywordSheet, KeywordSheetCache, tab_keywords
+from keyword_matcher import get_keyword_matcher
+from llm_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_BYTES, LLMCache, make_cache_key
+from openai_limiter import (DEFAULT_PAGE_BUDGET_SECONDS, OPENAI_REQUESTS_PER_MINUTE,
+                            OPENAI_TOKENS_PER_MINUTE, OpenAIRateLimiter,
+                            RateLimitBudgetExceeded, estimate_tokens, parse_duration)
+from quota_scheduler import QuotaScheduler
 from report_generator import generate_report
+from request_hedger import DEFAULT_HEDGE_PERCENTILE, DEFAULT_MAX_EXTRA_RATIO, RequestHedger
+from revision_store import DEFAULT_STATE_PATH, RevisionStore, hash_keywords
+from single_flight import SingleFlight
+from snapshot_store import DEFAULT_SNAPSHOT_DIR, SnapshotStore
+from text_analysis import TextAnalysis
+from token_cache import DEFAULT_TOKEN_CACHE_PATH, TokenCache
+
+_startup_timings: Dict[str, float] = {
+    "core imports": time.perf_counter() - _IMPORT_START
+}
 
 # Constants
 DEFAULT_SCORE = 5
@@ -29,32 +58,433 @@ MAX_SENTENCE_LENGTH = 15
 ACCEPTABLE_SENTENCE_LENGTH = 20
 MIN_CONTENT_LENGTH = 400
 GOOD_CONTENT_LENGTH = 800
+DEFAULT_MAX_CONCURRENCY = 6
+OPENAI_MODEL = "gpt-4o-mini"
+DEFAULT_BATCH_WORKERS = 4
+DEADLINE_METHOD = "Rule-based (deadline)"
+
+COST_EVALUATION_TYPES = [
+    "grammar_spelling", "readability", "keyword_usage",
+    "content_structure", "seo_quality", "pricing_focus"
+]
+CITY_EVALUATION_TYPES = [
+    "grammar_spelling", "readability", "keyword_usage",
+    "content_structure", "seo_quality", "local_relevance"
+]
+
+COMBINED_MAX_TOKENS_PER_ITEM = 120
+
+# Field masks: fetch only what build_document_model and the keyword reader use
+DOCUMENT_PARAGRAPH_FIELDS = (
+    "paragraph(elements(textRun(content,textStyle/link)),"
+    "paragraphStyle/namedStyleType,bullet/listId)"
+)
+# Table cells can hold tables of their own; content nested deeper than this
+# many tables is not fetched
+DOCUMENT_TABLE_NESTING = 4
+DOCUMENT_CONTENT_FIELDS = DOCUMENT_PARAGRAPH_FIELDS
+for _ in range(DOCUMENT_TABLE_NESTING):
+    DOCUMENT_CONTENT_FIELDS = (
+        f"{DOCUMENT_PARAGRAPH_FIELDS},"
+        f"table/tableRows/tableCells/content({DOCUMENT_CONTENT_FIELDS})"
+    )
+DOCUMENT_FIELDS = f"revisionId,body/content({DOCUMENT_CONTENT_FIELDS})"
+SHEET_TITLES_FIELDS = "sheets/properties/title"
+KEYWORD_HEADER_RANGE = "1:1"
+VALUE_RANGES_FIELDS = "valueRanges/values"
+# Most Google APIs accept up to 1000 calls per batch request
+GOOGLE_BATCH_LIMIT = 1000
+# Manifest documents fetched ahead of the evaluation workers
+MANIFEST_PREFETCH_SIZE = 100
+# all: fetch and evaluate; fetch: snapshot documents only; evaluate: from snapshots
+PIPELINE_STAGES = ("all", "fetch", "evaluate")
+# Default per-user read quotas; every call inside a batch counts separately
+DOCS_READS_PER_MINUTE = 300
+SHEETS_READS_PER_MINUTE = 60
+DRIVE_QUERIES_PER_MINUTE = 12000
+# Any of these lets the Drive service read a keyword sheet's modifiedTime
+DRIVE_METADATA_SCOPES = (
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+    "https://www.googleapis.com/auth/drive.metadata",
+    "https://www.googleapis.com/auth/drive.readonly",
+    "https://www.googleapis.com/auth/drive"
+)
+RETRYABLE_GOOGLE_STATUSES = (429, 500, 502, 503, 504)
+
+EVALUATION_CRITERIA = {
+    "grammar_spelling": (
+        "Evaluate this content for grammar and spelling quality. "
+        "Score 1-10 and provide specific examples of issues found."
+    ),
+    "readability": (
+        "Evaluate readability and flow. Consider sentence length, "
+        "paragraph structure, and clarity. Score 1-10 with explanation."
+    ),
+    "keyword_usage": (
+        "Analyze keyword usage and density. Are keywords naturally "
+        "integrated? Is there keyword stuffing? Score 1-10."
+    ),
+    "content_structure": (
+        "Evaluate heading structure and content organization. "
+        "Are headings logical and SEO-friendly? Score 1-10."
+    ),
+    "seo_quality": (
+        "Overall SEO quality assessment. Consider title optimization, "
+        "meta-worthy content, and search intent matching. Score 1-10."
+    ),
+    "local_relevance": (
+        "For this city page, evaluate local relevance and "
+        "city-specific information quality. Score 1-10."
+    ),
+    "pricing_focus": (
+        "For this cost page, evaluate how well it focuses on "
+        "pricing information and cost-related content. Score 1-10."
+    )
+}
+
+CITY_AFTER_PREPOSITION_PATTERN = re.compile(
+    r'\b(?:in|te)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+CAPITALIZED_RUN_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*')
+AREA_SUFFIX_PATTERN = re.compile(r'\s+(?:area|region|city)')
 
 # With:
 client = None
+_client_lock = threading.Lock()
+llm_cache: Optional[LLMCache] = None
+revision_store: Optional[RevisionStore] = None
+keyword_cache = KeywordSheetCache(None)
+google_scheduler = QuotaScheduler({
+    "docs": DOCS_READS_PER_MINUTE,
+    "sheets": SHEETS_READS_PER_MINUTE,
+    "drive": DRIVE_QUERIES_PER_MINUTE
+})
+google_pool: Optional[GoogleHttpPool] = None
+async_google_connections: Optional[int] = None
+# Event loop thread and client shared by every async read, started on first use
+_async_google: Optional[Any] = None
+_async_google_lock = threading.Lock()
+token_cache: Optional[TokenCache] = None
+snapshot_store: Optional[SnapshotStore] = None
+openai_limiter: Optional[OpenAIRateLimiter] = OpenAIRateLimiter()
+openai_breaker: Optional[CircuitBreaker] = None
+request_hedger: Optional[RequestHedger] = None
+openai_single_flight: Optional[SingleFlight] = SingleFlight()
+# Seconds each page's checklist evaluations may take, or None for no limit
+evaluation_deadline: Optional[float] = None
+
+# Monotonic deadline of the checklist evaluation running in this context
+_evaluation_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "evaluation_deadline", default=None)
+
+# Without a pool, googleapiclient services share one httplib2.Http, which is
+# not thread-safe
+_google_io_lock = threading.Lock()
+
+
+@contextmanager
+def _startup_step(label: str) -> Iterator[None]:
+    """Record how long a lazy import or client initialisation takes."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _startup_timings[label] = (
+            _startup_timings.get(label, 0.0) + time.perf_counter() - start)
 
 
 def get_openai_client():
     """Get OpenAI client, initializing if needed."""
     global client
-    if client is None:
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if api_key:
-            client = openai.OpenAI(api_key=api_key)
+    with _client_lock:
+        if client is None:
+            api_key = os.environ.get("OPENAI_API_KEY")
+            if api_key:
+                with _startup_step("import openai"):
+                    import openai
+                with _startup_step("init OpenAI client"):
+                    client = openai.OpenAI(api_key=api_key)
     return client
 
 
+def _openai_available() -> bool:
+    """Check whether AI evaluation is possible in this run (an API key is set)."""
+    openai_client = get_openai_client()
+    return bool(openai_client and openai_client.api_key)
+
+
+def _openai_errors() -> Tuple[type, ...]:
+    """Get the OpenAI exception types handled by the AI evaluators."""
+    import openai
+    return (openai.OpenAIError, openai.APIError, openai.RateLimitError,
+            RateLimitBudgetExceeded, CircuitOpenError)
+
+
+def _is_deadline_timeout(error: Exception) -> bool:
+    """Tell timeouts set by an evaluation deadline, which say nothing about OpenAI's health."""
+    import openai
+    # With a deadline, the request timeout is the time left before it
+    return (isinstance(error, openai.APITimeoutError)
+            and _evaluation_deadline.get() is not None)
+
+
+def _is_openai_outage(error: Exception) -> bool:
+    """Tell OpenAI service failures (timeouts, connection errors, 5xx) from request errors."""
+    import openai
+    if isinstance(error, openai.APIConnectionError):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status is not None and (status == 408 or status >= 500)
+
+
+def _google_errors() -> Tuple[type, ...]:
+    """Get the Google API exception types handled by the readers."""
+    from google.auth.exceptions import GoogleAuthError
+    from googleapiclient.errors import HttpError
+    return (GoogleAuthError, HttpError)
+
+
+def configure_llm_cache(cache: Optional[LLMCache]) -> None:
+    """Set the response cache used for OpenAI calls (None disables caching)."""
+    global llm_cache
+    llm_cache = cache
+
+
+def configure_keyword_cache(cache: KeywordSheetCache) -> None:
+    """Set the cache used to share keyword spreadsheets between documents."""
+    global keyword_cache
+    keyword_cache = cache
+
+
+def configure_google_scheduler(scheduler: QuotaScheduler) -> None:
+    """Set the scheduler that paces and retries Google API calls."""
+    global google_scheduler
+    google_scheduler = scheduler
+
+
+def configure_google_pool(pool: Optional[GoogleHttpPool]) -> None:
+    """Set the pool of per-thread Google transports (None serialises requests)."""
+    global google_pool
+    google_pool = pool
+
+
+def configure_async_google(max_connections: Optional[int]) -> None:
+    """Read manifest documents and keyword sheets with the async client (None disables it)."""
+    global async_google_connections, _async_google
+    with _async_google_lock:
+        if _async_google is not None:
+            _async_google.close()
+            _async_google = None
+        async_google_connections = max_connections
+
+
+def configure_token_cache(cache: Optional[TokenCache]) -> None:
+    """Set the cache sharing OAuth access tokens between runs (None refreshes every run)."""
+    global token_cache
+    token_cache = cache
+
+
+def configure_openai_limiter(limiter: Optional[OpenAIRateLimiter]) -> None:
+    """Set the limiter pacing and retrying OpenAI calls (None calls straight through)."""
+    global openai_limiter
+    openai_limiter = limiter
+
+
+def configure_openai_breaker(breaker: Optional[CircuitBreaker]) -> None:
+    """Set the circuit breaker guarding OpenAI calls (None never short-circuits)."""
+    global openai_breaker
+    openai_breaker = breaker
+
+
+def _guarded_openai_call(create: Callable[..., Any], request: Dict[str, Any]) -> Any:
+    """
+    Make one OpenAI request through the circuit breaker, if there is one.
+
+    The create method should come from _with_deadline, so a passed deadline
+    is raised before the breaker admits the request.
+    """
+    if openai_breaker is None:
+        return create(**request)
+    return openai_breaker.call(lambda: create(**request))
+
+
+def configure_evaluation_deadline(seconds: Optional[float]) -> None:
+    """Set the per-page latency budget of the checklist evaluations (None waits indefinitely)."""
+    global evaluation_deadline
+    evaluation_deadline = seconds
+
+
+def configure_request_hedger(hedger: Optional[RequestHedger]) -> None:
+    """Set the hedger duplicating slow AI evaluation requests (None never hedges)."""
+    global request_hedger
+    request_hedger = hedger
+
+
+def configure_openai_single_flight(single_flight: Optional[SingleFlight]) -> None:
+    """Set the layer sharing identical in-flight OpenAI requests (None sends each one)."""
+    global openai_single_flight
+    openai_single_flight = single_flight
+
+
+def _with_deadline(openai_client: Any, **options: Any) -> Any:
+    """Limit an OpenAI request to the time left before the evaluation's deadline."""
+    deadline = _evaluation_deadline.get()
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise EvaluationDeadlineExceeded("Evaluation deadline passed before the OpenAI call")
+        # A retry could not finish within the deadline either
+        options.update(timeout=remaining, max_retries=0)
+    return openai_client.with_options(**options) if options else openai_client
+
+
+@contextmanager
+def _openai_page() -> Iterator[None]:
+    """Share one OpenAI retry deadline between the calls made for a page."""
+    if openai_limiter is None:
+        yield
+    else:
+        with openai_limiter.page():
+            yield
+
+
+def configure_snapshot_store(store: Optional[SnapshotStore]) -> None:
+    """Set the local store that fetch and evaluate stages share."""
+    global snapshot_store
+    snapshot_store = store
+
+
+def configure_revision_store(store: Optional[RevisionStore]) -> None:
+    """Set the store used to skip unchanged documents (None always re-evaluates)."""
+    global revision_store
+    revision_store = store
+
+
+def _create_chat_completion(openai_client: Any, system_prompt: str, prompt: str,
+                            max_tokens: int, temperature: float,
+                            hedge_key: Optional[str] = None, **extra: Any) -> str:
+    """
+    Run a chat completion, serving it from the response cache when possible.
+
+    Args:
+        openai_client: OpenAI client instance
+        system_prompt: System message content
+        prompt: User message content
+        max_tokens: Output token budget
+        temperature: Sampling temperature
+        hedge_key: Kind of request whose latencies decide when to hedge it,
+            or None to never hedge it
+        **extra: Additional request parameters (e.g. response_format)
+
+    Returns:
+        Response message content
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+
+    # The request payload identifies cached responses and identical calls in flight
+    request_key = make_cache_key(OPENAI_MODEL, messages, temperature, max_tokens, **extra)
+    if llm_cache is not None:
+        cached = llm_cache.get(request_key)
+        if cached is not None:
+            return cached
+
+    request = dict(
+        model=OPENAI_MODEL,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        **extra
+    )
+    # While the circuit is open, fall back without waiting for quota
+    if openai_breaker is not None:
+        openai_breaker.check()
+
+    deadline = _evaluation_deadline.get()
+    if deadline is not None and time.monotonic() >= deadline:
+        raise EvaluationDeadlineExceeded("Evaluation deadline passed before the OpenAI call")
+
+    def _hedged(attempt: Callable[[], Any],
+                admit: Optional[Callable[[], Optional[Callable[[], Any]]]] = None) -> Any:
+        if request_hedger is not None and hedge_key is not None:
+            return request_hedger.run(hedge_key, attempt, admit)
+        return attempt()
+
+    def _call() -> Any:
+        if openai_limiter is None:
+            return _hedged(lambda: _guarded_openai_call(
+                _with_deadline(openai_client).chat.completions.create, request))
+
+        def _attempt() -> Any:
+            return _guarded_openai_call(
+                _with_deadline(
+                    openai_client, max_retries=0
+                ).chat.completions.with_raw_response.create, request)
+
+        tokens = estimate_tokens(system_prompt + prompt, max_tokens)
+        # Retries are left to the limiter, which sees the rate limit headers;
+        # only the HTTP attempt is hedged, and a duplicate is only sent if
+        # the limiter has quota and a slot for it right away
+        raw_response = openai_limiter.run(
+            lambda: _hedged(_attempt, lambda: openai_limiter.try_extra(_attempt, tokens)),
+            tokens,
+            deadline
+        )
+        return raw_response.parse()
+
+    try:
+        if openai_single_flight is not None:
+            response = openai_single_flight.do(request_key, _call)
+        else:
+            response = _call()
+    except _openai_errors() as e:
+        import openai
+        if deadline is not None and (
+                isinstance(e, (openai.APITimeoutError, RateLimitBudgetExceeded))
+                or time.monotonic() >= deadline):
+            raise EvaluationDeadlineExceeded(f"OpenAI call missed its deadline: {e}") from e
+        raise
+    content = response.choices[0].message.content
+
+    if llm_cache is not None and content:
+        llm_cache.set(request_key, content)
+
+    return content
+
+
 class SEOEvaluationError(Exception):
     """Custom exception for SEO evaluation errors."""
 
 
-def authenticate_google() -> Tuple[Optional[Any], Optional[Any]]:
+class EvaluationDeadlineExceeded(Exception):
+    """An AI evaluation did not finish within its share of the page's deadline."""
+
+
+def authenticate_google(pool_size: int = DEFAULT_POOL_SIZE
+                        ) -> Tuple[Optional[Any], Optional[Any], Optional[Any]]:
     """
     Authenticate with Google API using OAuth credentials.
 
+    The Drive service is only used to read keyword sheet modification times;
+    without Drive access the on-disk keyword cache is simply not used, and if
+    the credentials lack a Drive scope no Drive service is built.
+    Requests run on a pool of per-thread transports sharing the credentials.
+    A still-valid access token from the token cache is reused instead of
+    refreshing it, and refreshed tokens are written back to the cache.
+
+    Args:
+        pool_size: Maximum number of concurrent Google connections
+
     Returns:
-        Tuple of (docs_service, sheets_service) or (None, None) if authentication fails.
+        Tuple of (docs_service, sheets_service, drive_service) or
+        (None, None, None) if authentication fails; drive_service is None
+        without a Drive scope.
     """
+    with _startup_step("import Google client libraries"):
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.discovery import build
+
     creds_json = os.environ.get('GOOGLE_CREDENTIALS')
 
     if creds_json:
@@ -63,7 +493,7 @@ def authenticate_google() -> Tuple[Optional[Any], Optional[Any]]:
             creds = Credentials.from_authorized_user_info(creds_data)
         except json.JSONDecodeError as e:
             print(f"Error parsing Google credentials: {e}")
-            return None, None
+            return None, None, None
     else:
         # Try to load from token.json file
         try:
@@ -73,18 +503,35 @@ def authenticate_google() -> Tuple[Optional[Any], Optional[Any]]:
         except FileNotFoundError:
             print("Error: No credentials found. Please set up token.json or "
                   "GOOGLE_CREDENTIALS environment variable.")
-            return None, None
+            return None, None, None
         except json.JSONDecodeError as e:
             print(f"Error parsing token.json: {e}")
-            return None, None
+            return None, None, None
+
+    if token_cache is not None:
+        token_cache.load(creds)
 
     try:
-        docs_service = build('docs', 'v1', credentials=creds)
-        sheets_service = build('sheets', 'v4', credentials=creds)
-        return docs_service, sheets_service
-    except (GoogleAuthError, HttpError) as e:
+        # Use the discovery documents bundled with googleapiclient instead
+        # of fetching them over the network on every run
+        with _startup_step("build Google services"):
+            docs_service = build('docs', 'v1', credentials=creds,
+                                 static_discovery=True, cache_discovery=False)
+            sheets_service = build('sheets', 'v4', credentials=creds,
+                                   static_discovery=True, cache_discovery=False)
+            # Without a Drive scope every modifiedTime lookup would fail with 403
+            if creds.scopes is not None and not set(creds.scopes) & set(DRIVE_METADATA_SCOPES):
+                print("⚠ Google credentials lack the drive.metadata.readonly scope - "
+                      "keyword sheets are not reused from the disk cache")
+                drive_service = None
+            else:
+                drive_service = build('drive', 'v3', credentials=creds,
+                                      static_discovery=True, cache_discovery=False)
+        configure_google_pool(GoogleHttpPool(creds, pool_size, token_cache))
+        return docs_service, sheets_service, drive_service
+    except _google_errors() as e:
         print(f"Error building Google services: {e}")
-        return None, None
+        return None, None, None
 
 
 def read_document(doc_id: str, service: Any) -> Optional[str]:
@@ -98,25 +545,49 @@ def read_document(doc_id: str, service: Any) -> Optional[str]:
     Returns:
         Document text content or None if error occurs
     """
+    model = read_document_model(doc_id, service)
+    return model.text if model else None
+
+
+def read_document_model(doc_id: str, service: Any) -> Optional[DocumentModel]:
+    """
+    Read a Google Doc with its headings, links, lists and tables.
+
+    Args:
+        doc_id: Google Document ID
+        service: Google Docs service instance
+
+    Returns:
+        DocumentModel or None if error occurs
+    """
     try:
-        document = service.documents().get(documentId=doc_id).execute()
-        text_content = []
-
-        body_content = document.get('body', {}).get('content', [])
-        for content in body_content:
-            if 'paragraph' in content:
-                elements = content.get('paragraph', {}).get('elements', [])
-                for element in elements:
-                    if 'textRun' in element:
-                        text_run = element.get('textRun', {})
-                        text_content.append(text_run.get('content', ''))
-
-        return ''.join(text_content)
-    except (GoogleAuthError, HttpError) as e:
+        return _execute_google_request(
+            _document_request(service, doc_id), f"document {doc_id}")
+    except _google_errors() as e:
         print(f"Error reading Google Doc: {e}")
         return None
 
 
+def read_document_revision(doc_id: str, service: Any) -> Optional[str]:
+    """
+    Read only the current revision ID of a Google Doc.
+
+    Args:
+        doc_id: Google Document ID
+        service: Google Docs service instance
+
+    Returns:
+        Revision ID or None if error occurs
+    """
+    try:
+        document = _execute_google_request(
+            _revision_request(service, doc_id), f"revision of {doc_id}")
+        return document.get('revisionId')
+    except _google_errors() as e:
+        print(f"Error reading Google Doc revision: {e}")
+        return None
+
+
 def read_keyword_list(sheet_id: str, service: Any) -> List[str]:
     """
     Read keywords from Google Sheet.
@@ -126,51 +597,583 @@ def read_keyword_list(sheet_id: str, service: Any) -> List[str]:
         service: Google Sheets service instance
 
     Returns:
-        List of keywords or empty list if error occurs
+        List of keywords of the first tab or empty list if error occurs
+    """
+    return tab_keywords(read_keyword_sheets([sheet_id], service).get(sheet_id))
+
+
+def read_keyword_sheets(sheet_ids: List[str], service: Any) -> Dict[str, KeywordSheet]:
+    """
+    Read the keyword column of every tab of Google Sheets.
+
+    Each spreadsheet costs three small requests: its tab titles, one
+    values().batchGet of every tab's header row and one values().batchGet of
+    every tab's keyword column. Several spreadsheets are read with batched
+    HTTP requests.
+
+    Args:
+        sheet_ids: Google Sheet IDs
+        service: Google Sheets service instance
+
+    Returns:
+        Keyword lists by tab for each sheet; sheets that failed are left out
+    """
+    metadata, errors = _execute_google_requests(
+        service,
+        {
+            sheet_id: service.spreadsheets().get(
+                spreadsheetId=sheet_id, fields=SHEET_TITLES_FIELDS)
+            for sheet_id in sheet_ids
+        },
+        "keyword sheet tabs"
+    )
+    titles = {
+        sheet_id: [sheet['properties']['title'] for sheet in result.get('sheets', [])]
+        for sheet_id, result in metadata.items()
+    }
+
+    headers, header_errors = _execute_google_requests(
+        service,
+        {
+            sheet_id: service.spreadsheets().values().batchGet(
+                spreadsheetId=sheet_id,
+                ranges=[_sheet_range(title, KEYWORD_HEADER_RANGE) for title in sheet_titles],
+                fields=VALUE_RANGES_FIELDS
+            )
+            for sheet_id, sheet_titles in titles.items() if sheet_titles
+        },
+        "keyword headers"
+    )
+    errors.update(header_errors)
+
+    # Tab titles with a header row, and the A1 range of their keyword column
+    keyword_ranges: Dict[str, List[Tuple[str, str]]] = {}
+    for sheet_id, result in headers.items():
+        keyword_ranges[sheet_id] = [
+            (title, _sheet_range(title, _keyword_column_range(value_range['values'])))
+            for title, value_range in zip(titles[sheet_id], result.get('valueRanges', []))
+            if value_range.get('values')
+        ]
+
+    columns, column_errors = _execute_google_requests(
+        service,
+        {
+            sheet_id: service.spreadsheets().values().batchGet(
+                spreadsheetId=sheet_id,
+                ranges=[a1_range for _, a1_range in ranges],
+                fields=VALUE_RANGES_FIELDS
+            )
+            for sheet_id, ranges in keyword_ranges.items() if ranges
+        },
+        "keyword columns"
+    )
+    errors.update(column_errors)
+
+    for sheet_id, error in errors.items():
+        print(f"Error reading keyword list {sheet_id}: {error}")
+
+    sheets = {}
+    for sheet_id, sheet_titles in titles.items():
+        if sheet_id in errors:
+            continue
+        # Tabs without a header row have no keywords
+        sheet = {title: [] for title in sheet_titles}
+        value_ranges = columns.get(sheet_id, {}).get('valueRanges', [])
+        for (title, _), value_range in zip(keyword_ranges.get(sheet_id, []), value_ranges):
+            sheet[title] = _extract_keywords(value_range)
+        sheets[sheet_id] = sheet
+    return sheets
+
+
+def read_modified_times(file_ids: List[str], service: Any) -> Dict[str, str]:
+    """
+    Read the Drive modifiedTime of files.
+
+    Args:
+        file_ids: Google Drive file IDs (e.g. Sheet IDs)
+        service: Google Drive service instance
+
+    Returns:
+        modifiedTime by file ID; files that failed are left out
+    """
+    results, errors = _execute_google_requests(
+        service,
+        {
+            file_id: service.files().get(
+                fileId=file_id, fields="modifiedTime", supportsAllDrives=True)
+            for file_id in file_ids
+        },
+        "modified times"
+    )
+
+    for file_id, error in errors.items():
+        print(f"Error reading modified time of {file_id}: {error}")
+
+    return {
+        file_id: result['modifiedTime']
+        for file_id, result in results.items()
+        if result.get('modifiedTime')
+    }
+
+
+def load_keyword_sheets(sheet_ids: List[str], sheets_service: Any,
+                        drive_service: Any = None) -> Dict[str, KeywordSheet]:
+    """
+    Get keyword spreadsheets through the keyword cache.
+
+    Sheets already loaded in this process need no request. Otherwise one
+    Drive modifiedTime lookup decides whether the copy on disk is still
+    current; only sheets without one are read from the Sheets API.
+
+    Args:
+        sheet_ids: Google Sheet IDs
+        sheets_service: Google Sheets service instance
+        drive_service: Google Drive service instance, or None to skip the
+            on-disk cache
+
+    Returns:
+        Keyword lists by tab for each sheet; sheets that failed are left out
+    """
+    sheets: Dict[str, KeywordSheet] = {}
+    missing = []
+    for sheet_id in dict.fromkeys(sheet_ids):
+        sheet = keyword_cache.get_loaded(sheet_id)
+        if sheet is not None:
+            sheets[sheet_id] = sheet
+        else:
+            missing.append(sheet_id)
+
+    if not missing:
+        return sheets
+
+    modified_times = (
+        read_modified_times(missing, drive_service) if drive_service else {})
+
+    to_read = []
+    for sheet_id in missing:
+        modified_time = modified_times.get(sheet_id)
+        sheet = keyword_cache.get_stored(sheet_id, modified_time) if modified_time else None
+        if sheet is not None:
+            sheets[sheet_id] = sheet
+        else:
+            to_read.append(sheet_id)
+
+    if to_read:
+        for sheet_id, sheet in _read_keyword_sheets(to_read, sheets_service).items():
+            keyword_cache.put(sheet_id, sheet, modified_times.get(sheet_id))
+            sheets[sheet_id] = sheet
+
+    return sheets
+
+
+def read_documents_batch(doc_ids: List[str], service: Any) -> Dict[str, DocumentModel]:
+    """
+    Read many Google Docs with batched HTTP requests.
+
+    Args:
+        doc_ids: Google Document IDs
+        service: Google Docs service instance
+
+    Returns:
+        DocumentModel by document ID; documents that failed are left out
+    """
+    requests = {doc_id: _document_request(service, doc_id) for doc_id in doc_ids}
+    results, errors = _execute_google_batch(service, requests, "documents")
+
+    for doc_id, error in errors.items():
+        print(f"Error reading Google Doc {doc_id}: {error}")
+
+    return results
+
+
+def read_document_revisions_batch(doc_ids: List[str], service: Any) -> Dict[str, str]:
+    """
+    Read the revision IDs of many Google Docs with batched HTTP requests.
+
+    Args:
+        doc_ids: Google Document IDs
+        service: Google Docs service instance
+
+    Returns:
+        Revision ID by document ID; documents that failed are left out
     """
+    requests = {doc_id: _revision_request(service, doc_id) for doc_id in doc_ids}
+    results, errors = _execute_google_batch(service, requests, "document revisions")
+
+    for doc_id, error in errors.items():
+        print(f"Error reading Google Doc revision {doc_id}: {error}")
+
+    return {
+        doc_id: document['revisionId']
+        for doc_id, document in results.items()
+        if document.get('revisionId')
+    }
+
+
+def _async_google_enabled() -> bool:
+    """Check whether reads go through the async client."""
+    return async_google_connections is not None and google_pool is not None
+
+
+def _async_google_runner() -> Any:
+    """Get the loop thread and client shared by all async reads, starting them if needed."""
+    global _async_google
+    with _async_google_lock:
+        if _async_google is None:
+            from google_async import AsyncGoogleClient, AsyncGoogleRunner
+
+            _async_google = AsyncGoogleRunner(lambda: AsyncGoogleClient(
+                google_pool.credentials, async_google_connections,
+                google_scheduler, token_cache=token_cache))
+            atexit.register(_async_google.close)
+        return _async_google
+
+
+async def read_documents_async(doc_ids: List[str], client: Any) -> Dict[str, DocumentModel]:
+    """
+    Read many Google Docs concurrently with the async client.
+
+    Args:
+        doc_ids: Google Document IDs
+        client: google_async.AsyncGoogleClient
+
+    Returns:
+        DocumentModel by document ID; documents that failed are left out
+    """
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(client.get_document_stream(doc_id, DocumentStreamParser, DOCUMENT_FIELDS)
+          for doc_id in doc_ids),
+        return_exceptions=True
+    )
+    print(f"Fetched {len(doc_ids)} documents concurrently "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    documents = {}
+    for doc_id, result in zip(doc_ids, results):
+        if isinstance(result, Exception):
+            print(f"Error reading Google Doc {doc_id}: {result}")
+        else:
+            documents[doc_id] = result
+    return documents
+
+
+async def read_keyword_sheets_async(sheet_ids: List[str], client: Any) -> Dict[str, KeywordSheet]:
+    """
+    Read the keyword column of every tab of Google Sheets concurrently.
+
+    Makes the same three requests per spreadsheet as read_keyword_sheets,
+    with all spreadsheets in flight at once.
+
+    Args:
+        sheet_ids: Google Sheet IDs
+        client: google_async.AsyncGoogleClient
+
+    Returns:
+        Keyword lists by tab for each sheet; sheets that failed are left out
+    """
+    async def _read(sheet_id: str) -> KeywordSheet:
+        metadata = await client.get_spreadsheet(sheet_id, SHEET_TITLES_FIELDS)
+        titles = [sheet['properties']['title'] for sheet in metadata.get('sheets', [])]
+        if not titles:
+            return {}
+
+        headers = await client.batch_get_values(
+            sheet_id, [_sheet_range(title, KEYWORD_HEADER_RANGE) for title in titles],
+            VALUE_RANGES_FIELDS)
+        keyword_ranges = [
+            (title, _sheet_range(title, _keyword_column_range(value_range['values'])))
+            for title, value_range in zip(titles, headers.get('valueRanges', []))
+            if value_range.get('values')
+        ]
+
+        # Tabs without a header row have no keywords
+        sheet: KeywordSheet = {title: [] for title in titles}
+        if keyword_ranges:
+            columns = await client.batch_get_values(
+                sheet_id, [a1_range for _, a1_range in keyword_ranges], VALUE_RANGES_FIELDS)
+            for (title, _), value_range in zip(keyword_ranges, columns.get('valueRanges', [])):
+                sheet[title] = _extract_keywords(value_range)
+        return sheet
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_read(sheet_id) for sheet_id in sheet_ids), return_exceptions=True)
+    print(f"Fetched {len(sheet_ids)} keyword sheets concurrently "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    sheets = {}
+    for sheet_id, result in zip(sheet_ids, results):
+        if isinstance(result, Exception):
+            print(f"Error reading keyword list {sheet_id}: {result}")
+        else:
+            sheets[sheet_id] = result
+    return sheets
+
+
+def _read_documents(doc_ids: List[str], service: Any) -> Dict[str, DocumentModel]:
+    """Read documents with the async client if enabled, otherwise in batches."""
+    if not _async_google_enabled():
+        return read_documents_batch(doc_ids, service)
+
+    runner = _async_google_runner()
+    return runner.run(read_documents_async(doc_ids, runner.client))
+
+
+def _read_keyword_sheets(sheet_ids: List[str], service: Any) -> Dict[str, KeywordSheet]:
+    """Read keyword sheets with the async client if enabled, otherwise in batches."""
+    if not _async_google_enabled():
+        return read_keyword_sheets(sheet_ids, service)
+
+    runner = _async_google_runner()
+    return runner.run(read_keyword_sheets_async(sheet_ids, runner.client))
+
+
+def _document_request(service: Any, doc_id: str) -> Any:
+    """
+    Build a field-masked request for a document's content.
+
+    The response is parsed straight into a DocumentModel, one body element
+    at a time, instead of being decoded into a dict first.
+    """
+    request = service.documents().get(documentId=doc_id, fields=DOCUMENT_FIELDS)
+    postproc = request.postproc
+
+    def _parse(response: Any, content: bytes) -> Any:
+        if response.status >= 300:
+            # Let the JSON model raise the HttpError
+            return postproc(response, content)
+        return parse_document_stream(iter_chunks(content))
+
+    request.postproc = _parse
+    return request
+
+
+def _revision_request(service: Any, doc_id: str) -> Any:
+    """Build a request for only a document's revision ID."""
+    return service.documents().get(documentId=doc_id, fields="revisionId")
+
+
+def _sheet_range(title: str, a1_range: str) -> str:
+    """Qualify an A1 range with a quoted sheet (tab) title."""
+    return "'{}'!{}".format(title.replace("'", "''"), a1_range)
+
+
+def _keyword_column_range(header_rows: List[List[str]]) -> str:
+    """Get the A1 range of the keyword column below a header row."""
+    # Try to find keyword column; otherwise assume the first column
+    keyword_col_idx = 0
+    for idx, col_name in enumerate(header_rows[0]):
+        if 'keyword' in str(col_name).lower():
+            keyword_col_idx = idx
+            break
+
+    column = _column_letter(keyword_col_idx)
+    return f"{column}2:{column}"
+
+
+def _extract_keywords(value_range: Dict[str, Any]) -> List[str]:
+    """Get the non-empty keywords of a keyword column value range."""
+    return [
+        row[0] for row in value_range.get('values', [])
+        if row and row[0].strip()
+    ]
+
+
+def _track_payload(request: Any, payload: Dict[str, Any]) -> None:
+    """Add a request's response size and encoding to payload once it arrives."""
+    postproc = request.postproc
+
+    def _measure(response: Any, content: bytes) -> Any:
+        payload['bytes'] = payload.get('bytes', 0) + len(content)
+        payload['encoding'] = response.get('-content-encoding', 'identity')
+        return postproc(response, content)
+
+    request.postproc = _measure
+
+
+@contextmanager
+def _google_transport() -> Iterator[Optional[Any]]:
+    """
+    Borrow an HTTP transport for one Google API call.
+
+    Yields:
+        A pooled transport for this thread, or None to use the service's
+        own transport while holding the shared lock
+    """
+    if google_pool is not None:
+        with google_pool.transport() as http:
+            yield http
+    else:
+        with _google_io_lock:
+            yield None
+
+
+def _execute_google_request(request: Any, description: str) -> Dict[str, Any]:
+    """
+    Execute a Google API request and log its payload size and latency.
+
+    Args:
+        request: googleapiclient HttpRequest
+        description: What is being fetched, for the log line
+
+    Returns:
+        Decoded response body
+    """
+    payload: Dict[str, Any] = {}
+    _track_payload(request, payload)
+
+    def _execute() -> Dict[str, Any]:
+        with _google_transport() as http:
+            return request.execute(http=http)
+
+    start = time.perf_counter()
+    result = google_scheduler.run(
+        _google_api(request.uri), _execute, _google_retry_after)
+    elapsed = time.perf_counter() - start
+
+    print(f"Fetched {description}: {payload.get('bytes', 0) / 1024:.1f} KB "
+          f"({payload.get('encoding', 'identity')}) in {elapsed:.2f}s")
+    return result
+
+
+def _execute_google_requests(service: Any, requests: Dict[str, Any],
+                             description: str) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """
+    Execute Google API requests, batching them when there is more than one.
+
+    Args:
+        service: Google API service the requests belong to
+        requests: googleapiclient HttpRequests keyed by a unique ID
+        description: What is being fetched, for the log line
+
+    Returns:
+        Tuple of (decoded responses by ID, exceptions by ID)
+    """
+    if len(requests) != 1:
+        return _execute_google_batch(service, requests, description)
+
+    request_id, request = next(iter(requests.items()))
     try:
-        # Get sheet metadata to find the first sheet
-        metadata = service.spreadsheets().get(spreadsheetId=sheet_id).execute()
-        sheet_name = metadata['sheets'][0]['properties']['title']
-
-        # Read the data
-        result = service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range=sheet_name
-        ).execute()
-
-        values = result.get('values', [])
-        if not values:
-            return []
-
-        # Try to find keyword column
-        header_row = values[0]
-        keyword_col_idx = None
-
-        for idx, col_name in enumerate(header_row):
-            if 'keyword' in str(col_name).lower():
-                keyword_col_idx = idx
-                break
+        return {request_id: _execute_google_request(request, f"{description} {request_id}")}, {}
+    except _google_errors() as e:
+        return {}, {request_id: e}
 
-        # Extract keywords
-        if keyword_col_idx is not None:
-            keywords = [
-                row[keyword_col_idx] for row in values[1:]
-                if (len(row) > keyword_col_idx and
-                    row[keyword_col_idx].strip())
-            ]
-            return keywords
+
+def _execute_google_batch(service: Any, requests: Dict[str, Any],
+                          description: str) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """
+    Execute Google API requests as multiplexed batch requests.
+
+    Requests are sent in groups of up to GOOGLE_BATCH_LIMIT. A failing item
+    only fails itself; a failing batch fails every item in it. Throttled
+    items are retried together in a smaller batch after a backoff.
+
+    Args:
+        service: Google API service the requests belong to
+        requests: googleapiclient HttpRequests keyed by a unique ID
+        description: What is being fetched, for the log line
+
+    Returns:
+        Tuple of (decoded responses by ID, exceptions by ID)
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+    items = list(requests.items())
+
+    def _callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        if exception is not None:
+            errors[request_id] = exception
         else:
-            # If no keyword column found, assume first column contains keywords
-            keywords = [
-                row[0] for row in values[1:]
-                if len(row) > 0 and row[0].strip()
+            results[request_id] = response
+
+    for offset in range(0, len(items), GOOGLE_BATCH_LIMIT):
+        group = dict(items[offset:offset + GOOGLE_BATCH_LIMIT])
+        count = len(group)
+        api = _google_api(next(iter(group.values())).uri)
+        payload: Dict[str, Any] = {}
+        for request in group.values():
+            _track_payload(request, payload)
+
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            google_scheduler.acquire(api, len(group), retry=attempt > 0)
+            batch = service.new_batch_http_request(callback=_callback)
+            for request_id, request in group.items():
+                batch.add(request, request_id=request_id)
+
+            try:
+                with _google_transport() as http:
+                    batch.execute(http=http)
+            except _google_errors() as e:
+                for request_id in group:
+                    errors[request_id] = e
+
+            retry_after = {
+                request_id: _google_retry_after(errors[request_id])
+                for request_id in group if request_id in errors
+            }
+            throttled = [
+                request_id for request_id, delay in retry_after.items()
+                if delay is not None
             ]
-            return keywords
+            if not throttled or not google_scheduler.allow_retry(attempt, len(throttled)):
+                break
+
+            delay = max(retry_after[request_id] for request_id in throttled)
+            time.sleep(google_scheduler.backoff_delay(attempt, delay))
+            group = {request_id: group[request_id] for request_id in throttled}
+            for request_id in throttled:
+                del errors[request_id]
+            attempt += 1
+        elapsed = time.perf_counter() - start
 
-    except (GoogleAuthError, HttpError) as e:
-        print(f"Error reading keyword list: {e}")
-        return []
+        print(f"Fetched {count} {description} in one batch: "
+              f"{payload.get('bytes', 0) / 1024:.1f} KB in {elapsed:.2f}s")
+
+    return results, errors
+
+
+def _google_api(uri: str) -> str:
+    """Get the quota bucket (docs, sheets or drive) of a request URI."""
+    if 'sheets.googleapis.com' in uri:
+        return "sheets"
+    if '/drive/' in uri:
+        return "drive"
+    return "docs"
+
+
+def _google_retry_after(error: Exception) -> Optional[float]:
+    """
+    Decide whether a failed Google API call is worth retrying.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        None if the call must not be retried, otherwise the delay in seconds
+        requested by the server's Retry-After header (0 if absent)
+    """
+    from googleapiclient.errors import HttpError
+
+    if not isinstance(error, HttpError) or error.resp.status not in RETRYABLE_GOOGLE_STATUSES:
+        return None
+
+    try:
+        return float(error.resp.get('retry-after', 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _column_letter(index: int) -> str:
+    """Convert a zero-based column index to A1 notation (0 -> A, 26 -> AA)."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
 
 
 def call_openai_evaluation(text: str, keywords: List[str], evaluation_type: str,
@@ -199,40 +1202,73 @@ def call_openai_evaluation(text: str, keywords: List[str], evaluation_type: str,
             text, keywords, evaluation_type, page_type, city_name
         )
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": ("You are an expert SEO content evaluator. "
-                                "Provide scores (1-10) and detailed explanations.")
-                },
-                {"role": "user", "content": prompt}
-            ],
+        return _create_chat_completion(
+            client,
+            ("You are an expert SEO content evaluator. "
+             "Provide scores (1-10) and detailed explanations."),
+            prompt,
             max_tokens=500,
-            temperature=0.3
+            temperature=0.3,
+            hedge_key=evaluation_type
         )
-
-        return response.choices[0].message.content
-    except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
+    except _openai_errors() as e:
         print(f"OpenAI API error for {evaluation_type}: {e}")
         return None
 
 
-def _construct_evaluation_prompt(text: str, keywords: List[str], evaluation_type: str,
-                                 page_type: str, city_name: Optional[str] = None) -> str:
+def call_openai_combined_evaluation(text: str, keywords: List[str],
+                                    evaluation_types: List[str], page_type: str,
+                                    city_name: Optional[str] = None) -> Optional[str]:
     """
-    Construct specific prompts for different evaluation types.
+    Use OpenAI to evaluate every checklist criterion in a single request.
+
+    Args:
+        text: Content to evaluate
+        keywords: List of target keywords
+        evaluation_types: Evaluation types to score in one response
+        page_type: Type of page (cost or city)
+        city_name: Name of target city for city pages
+
+    Returns:
+        OpenAI JSON response or None if API unavailable
+    """
+    client = get_openai_client()
+    if not client or not client.api_key:
+        print("OpenAI API key not found, using fallback for combined evaluation")
+        return None
+
+    try:
+        prompt = _construct_combined_evaluation_prompt(
+            text, keywords, evaluation_types, page_type, city_name
+        )
+
+        return _create_chat_completion(
+            client,
+            ("You are an expert SEO content evaluator. "
+             "Respond only with a JSON object."),
+            prompt,
+            max_tokens=COMBINED_MAX_TOKENS_PER_ITEM * len(evaluation_types),
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+    except _openai_errors() as e:
+        print(f"OpenAI API error for combined evaluation: {e}")
+        return None
+
+
+def _construct_base_info(text: str, keywords: List[str], page_type: str,
+                         city_name: Optional[str] = None) -> str:
+    """
+    Construct the content header shared by all evaluation prompts.
 
     Args:
         text: Content to evaluate
         keywords: List of target keywords
-        evaluation_type: Type of evaluation
         page_type: Type of page
         city_name: Name of target city
 
     Returns:
-        Formatted prompt string
+        Formatted header string
     """
     base_info = f"Content Type: {page_type.upper()} PAGE\n"
     base_info += f"Target Keywords: {', '.join(keywords[:5])}\n"
@@ -242,58 +1278,96 @@ def _construct_evaluation_prompt(text: str, keywords: List[str], evaluation_type
 
     base_info += f"Content to evaluate (first 1000 chars): {text[:1000]}...\n\n"
 
-    prompts = {
-        "grammar_spelling": (
-            f"{base_info}Evaluate this content for grammar and spelling quality. "
-            "Score 1-10 and provide specific examples of issues found."
-        ),
-        "readability": (
-            f"{base_info}Evaluate readability and flow. Consider sentence length, "
-            "paragraph structure, and clarity. Score 1-10 with explanation."
-        ),
-        "keyword_usage": (
-            f"{base_info}Analyze keyword usage and density. Are keywords naturally "
-            "integrated? Is there keyword stuffing? Score 1-10."
-        ),
-        "content_structure": (
-            f"{base_info}Evaluate heading structure and content organization. "
-            "Are headings logical and SEO-friendly? Score 1-10."
-        ),
-        "seo_quality": (
-            f"{base_info}Overall SEO quality assessment. Consider title optimization, "
-            "meta-worthy content, and search intent matching. Score 1-10."
-        ),
-        "local_relevance": (
-            f"{base_info}For this city page, evaluate local relevance and "
-            "city-specific information quality. Score 1-10."
-        ),
-        "pricing_focus": (
-            f"{base_info}For this cost page, evaluate how well it focuses on "
-            "pricing information and cost-related content. Score 1-10."
-        )
-    }
+    return base_info
+
+
+def _construct_evaluation_prompt(text: str, keywords: List[str], evaluation_type: str,
+                                 page_type: str, city_name: Optional[str] = None) -> str:
+    """
+    Construct specific prompts for different evaluation types.
+
+    Args:
+        text: Content to evaluate
+        keywords: List of target keywords
+        evaluation_type: Type of evaluation
+        page_type: Type of page
+        city_name: Name of target city
+
+    Returns:
+        Formatted prompt string
+    """
+    base_info = _construct_base_info(text, keywords, page_type, city_name)
 
-    return prompts.get(
+    return f"{base_info}{_get_evaluation_criterion(evaluation_type)}"
+
+
+def _construct_combined_evaluation_prompt(text: str, keywords: List[str],
+                                          evaluation_types: List[str], page_type: str,
+                                          city_name: Optional[str] = None) -> str:
+    """
+    Construct one prompt asking for every evaluation type at once.
+
+    Args:
+        text: Content to evaluate
+        keywords: List of target keywords
+        evaluation_types: Evaluation types to include
+        page_type: Type of page
+        city_name: Name of target city
+
+    Returns:
+        Formatted prompt string
+    """
+    base_info = _construct_base_info(text, keywords, page_type, city_name)
+
+    criteria = "\n".join(
+        f"- {eval_type}: {_get_evaluation_criterion(eval_type)}"
+        for eval_type in evaluation_types
+    )
+
+    return (
+        f"{base_info}Evaluate this content against each of the following criteria:\n"
+        f"{criteria}\n\n"
+        "Respond with a JSON object that has one key per criterion name above. "
+        'Each value must be an object of the form {"score": <integer 1-10>, '
+        '"details": "<short explanation>"}.'
+    )
+
+
+def _get_evaluation_criterion(evaluation_type: str) -> str:
+    """
+    Get the evaluation instruction for an evaluation type.
+
+    Args:
+        evaluation_type: Type of evaluation
+
+    Returns:
+        Instruction text
+    """
+    return EVALUATION_CRITERIA.get(
         evaluation_type,
-        f"{base_info}Evaluate this content for {evaluation_type}. "
+        f"Evaluate this content for {evaluation_type}. "
         "Score 1-10 with explanation."
     )
 
 
-def detect_page_type_ai(text: str, keywords: Optional[List[str]] = None) -> str:
+def detect_page_type_ai(text: str, keywords: Optional[List[str]] = None,
+                        analysis: Optional[TextAnalysis] = None) -> str:
     """
     Use AI to detect page type with fallback to rule-based detection.
 
     Args:
         text: Content to analyze
         keywords: Optional list of keywords
+        analysis: Shared text analysis of the content (built if omitted)
 
     Returns:
         Page type ('cost' or 'city')
     """
+    analysis = analysis or TextAnalysis(text)
+
     client = get_openai_client()
     if not client or not client.api_key:
-        return _detect_page_type_fallback(text, keywords)
+        return _detect_page_type_fallback(analysis, keywords)
 
     try:
         keyword_text = ', '.join(keywords[:10]) if keywords else 'None'
@@ -305,44 +1379,38 @@ def detect_page_type_ai(text: str, keywords: Optional[List[str]] = None) -> str:
             "Respond with exactly one word: either 'cost' or 'city' followed by your reasoning."
         )
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert at classifying web content types."
-                },
-                {"role": "user", "content": prompt}
-            ],
+        result = _create_chat_completion(
+            client,
+            "You are an expert at classifying web content types.",
+            prompt,
             max_tokens=100,
             temperature=0.1
-        )
-
-        result = response.choices[0].message.content.lower()
+        ).lower()
         if "cost" in result:
             return "cost"
         elif "city" in result:
             return "city"
         else:
-            return _detect_page_type_fallback(text, keywords)
+            return _detect_page_type_fallback(analysis, keywords)
 
-    except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
+    except _openai_errors() as e:
         print(f"AI page type detection failed: {e}, using fallback")
-        return _detect_page_type_fallback(text, keywords)
+        return _detect_page_type_fallback(analysis, keywords)
 
 
-def _detect_page_type_fallback(text: str, keywords: Optional[List[str]] = None) -> str:
+def _detect_page_type_fallback(analysis: TextAnalysis,
+                               keywords: Optional[List[str]] = None) -> str:
     """
     Fallback rule-based page type detection.
 
     Args:
-        text: Content to analyze
+        analysis: Text analysis of the content
         keywords: Optional list of keywords
 
     Returns:
         Page type ('cost' or 'city')
     """
-    text_lower = text.lower()
+    text_lower = analysis.lower
 
     cost_indicators = [
         'price', 'cost', 'fee', 'expense', 'tariff', '€', '$', 'kosten', 'prijs'
@@ -361,13 +1429,103 @@ def _detect_page_type_fallback(text: str, keywords: Optional[List[str]] = None)
         cost_score += sum(1 for indicator in cost_indicators if indicator in keyword_text)
         city_score += sum(1 for indicator in city_indicators if indicator in keyword_text)
 
-    return "cost" if cost_score > city_score else "city"
+    return "cost" if cost_score > city_score else "city"
+
+
+def evaluate_with_ai_fallback(text: str, keywords: List[str], evaluation_type: str,
+                              page_type: str, city_name: Optional[str] = None,
+                              analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
+    """
+    Evaluate using AI first, then fallback to rule-based if needed.
+
+    Args:
+        text: Content to evaluate
+        keywords: List of keywords
+        evaluation_type: Type of evaluation
+        page_type: Page type
+        city_name: City name for city pages
+        analysis: Shared text analysis of the content (built if omitted)
+
+    Returns:
+        Dictionary with score, details, and method used
+    """
+    # Try AI evaluation first
+    try:
+        ai_result = call_openai_evaluation(
+            text, keywords, evaluation_type, page_type, city_name)
+    except EvaluationDeadlineExceeded:
+        return _evaluate_after_deadline(
+            text, keywords, evaluation_type, page_type, city_name, analysis)
+
+    if ai_result:
+        score, details = _parse_ai_response(ai_result)
+        return {
+            "score": score,
+            "details": f"AI: {details}",
+            "method": "AI"
+        }
+
+    # Fallback to rule-based evaluation
+    return _evaluate_rule_based(
+        text, keywords, evaluation_type, page_type, city_name, analysis)
+
+
+def evaluate_combined_with_ai_fallback(text: str, keywords: List[str],
+                                      evaluation_types: List[str], page_type: str,
+                                      city_name: Optional[str] = None,
+                                      analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
+    """
+    Evaluate all evaluation types with one AI request, then fallback per item.
+
+    Args:
+        text: Content to evaluate
+        keywords: List of keywords
+        evaluation_types: Evaluation types to score
+        page_type: Page type
+        city_name: City name for city pages
+        analysis: Shared text analysis of the content (built if omitted)
+
+    Returns:
+        Dictionary of results keyed by evaluation type, in checklist order
+    """
+    # One request covers every evaluation type, so it gets the whole budget
+    token = _evaluation_deadline.set(
+        time.monotonic() + evaluation_deadline if evaluation_deadline else None)
+    missed_deadline = False
+    try:
+        ai_result = call_openai_combined_evaluation(
+            text, keywords, evaluation_types, page_type, city_name)
+    except EvaluationDeadlineExceeded:
+        ai_result = None
+        missed_deadline = True
+    finally:
+        _evaluation_deadline.reset(token)
+    parsed = _parse_combined_ai_response(ai_result) if ai_result else {}
+
+    results = {}
+    for eval_type in evaluation_types:
+        if eval_type in parsed:
+            score, details = parsed[eval_type]
+            results[eval_type] = {
+                "score": score,
+                "details": f"AI: {details}",
+                "method": "AI"
+            }
+        elif missed_deadline:
+            results[eval_type] = _evaluate_after_deadline(
+                text, keywords, eval_type, page_type, city_name, analysis)
+        else:
+            results[eval_type] = _evaluate_rule_based(
+                text, keywords, eval_type, page_type, city_name, analysis)
+
+    return results
 
 
-def evaluate_with_ai_fallback(text: str, keywords: List[str], evaluation_type: str,
-                              page_type: str, city_name: Optional[str] = None) -> Dict[str, Any]:
+def _evaluate_after_deadline(text: str, keywords: List[str], evaluation_type: str,
+                             page_type: str, city_name: Optional[str] = None,
+                             analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
     """
-    Evaluate using AI first, then fallback to rule-based if needed.
+    Rule-based evaluation standing in for an AI evaluation that ran out of time.
 
     Args:
         text: Content to evaluate
@@ -375,24 +1533,19 @@ def evaluate_with_ai_fallback(text: str, keywords: List[str], evaluation_type: s
         evaluation_type: Type of evaluation
         page_type: Page type
         city_name: City name for city pages
+        analysis: Shared text analysis of the content (built if omitted)
 
     Returns:
-        Dictionary with score, details, and method used
+        Dictionary with score, details, and method, tagged as a deadline fallback
     """
-    # Try AI evaluation first
-    ai_result = call_openai_evaluation(
-        text, keywords, evaluation_type, page_type, city_name)
-
-    if ai_result:
-        score, details = _parse_ai_response(ai_result)
-        return {
-            "score": score,
-            "details": f"AI: {details}",
-            "method": "AI"
-        }
-
-    # Fallback to rule-based evaluation
-    return _evaluate_rule_based(text, keywords, evaluation_type, page_type, city_name)
+    result = _evaluate_rule_based(
+        text, keywords, evaluation_type, page_type, city_name, analysis)
+    details = result["details"]
+    if details.startswith("Rule-based: "):
+        details = details[len("Rule-based: "):]
+    result["details"] = f"{DEADLINE_METHOD}: {details}"
+    result["method"] = DEADLINE_METHOD
+    return result
 
 
 def _parse_ai_response(ai_response: str) -> Tuple[int, str]:
@@ -429,8 +1582,43 @@ def _parse_ai_response(ai_response: str) -> Tuple[int, str]:
         return DEFAULT_SCORE, ai_response[:100]
 
 
+def _parse_combined_ai_response(ai_response: str) -> Dict[str, Tuple[int, str]]:
+    """
+    Parse a combined JSON AI response into per-item scores and explanations.
+
+    Args:
+        ai_response: JSON response from OpenAI API
+
+    Returns:
+        Dictionary mapping evaluation type to (score, details); items that
+        are missing or malformed are left out
+    """
+    try:
+        data = json.loads(ai_response)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing combined AI response: {e}")
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    parsed = {}
+    for eval_type, item in data.items():
+        if not isinstance(item, dict):
+            continue
+        try:
+            score = min(int(item.get("score", DEFAULT_SCORE)), MAX_SCORE)
+        except (TypeError, ValueError):
+            continue
+        details = str(item.get("details", "")).replace('\n', ' ').strip()[:200]
+        parsed[eval_type] = (score, details)
+
+    return parsed
+
+
 def _evaluate_rule_based(text: str, keywords: List[str], evaluation_type: str,
-                         page_type: str, city_name: Optional[str] = None) -> Dict[str, Any]:
+                         page_type: str, city_name: Optional[str] = None,
+                         analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
     """
     Rule-based evaluation as fallback.
 
@@ -440,6 +1628,7 @@ def _evaluate_rule_based(text: str, keywords: List[str], evaluation_type: str,
         evaluation_type: Type of evaluation
         page_type: Page type
         city_name: City name for city pages
+        analysis: Shared text analysis of the content (built if omitted)
 
     Returns:
         Dictionary with score, details, and method
@@ -447,14 +1636,15 @@ def _evaluate_rule_based(text: str, keywords: List[str], evaluation_type: str,
     evaluation_map = {
         "grammar_spelling": _evaluate_grammar_spelling_fallback,
         "readability": _evaluate_readability_fallback,
-        "keyword_usage": lambda t, k, *args: _evaluate_keyword_usage_fallback(t, k),
-        "content_structure": lambda t, *args: _evaluate_structure_fallback(t),
-        "local_relevance": lambda t, k, pt, cn: _evaluate_local_relevance_fallback(t, cn),
-        "pricing_focus": lambda t, *args: _evaluate_pricing_focus_fallback(t)
+        "keyword_usage": lambda a, k, *args: _evaluate_keyword_usage_fallback(a, k),
+        "content_structure": lambda a, *args: _evaluate_structure_fallback(a),
+        "local_relevance": lambda a, k, pt, cn: _evaluate_local_relevance_fallback(a, cn),
+        "pricing_focus": lambda a, *args: _evaluate_pricing_focus_fallback(a)
     }
 
     if evaluation_type in evaluation_map:
-        return evaluation_map[evaluation_type](text, keywords, page_type, city_name)
+        analysis = analysis or TextAnalysis(text)
+        return evaluation_map[evaluation_type](analysis, keywords, page_type, city_name)
 
     return {
         "score": DEFAULT_SCORE,
@@ -463,15 +1653,16 @@ def _evaluate_rule_based(text: str, keywords: List[str], evaluation_type: str,
     }
 
 
-def _evaluate_grammar_spelling_fallback(text: str, keywords: List[str],
+def _evaluate_grammar_spelling_fallback(analysis: TextAnalysis, keywords: List[str],
                                         page_type: str, city_name: Optional[str]) -> Dict[str, Any]:
     """Fallback grammar evaluation."""
     _ = keywords, page_type, city_name
+    rule_hits = analysis.rule_hits
 
     issues = 0
-    issues += text.count('  ')
-    issues += len(re.findall(r'[a-z]\.[A-Z]', text))
-    issues += len(re.findall(r'\s+[,.!?]', text))
+    issues += rule_hits.double_spaces
+    issues += rule_hits.sentence_joins
+    issues += rule_hits.space_before_punctuation
 
     score = max(1, MAX_SCORE - issues)
     return {
@@ -481,15 +1672,15 @@ def _evaluate_grammar_spelling_fallback(text: str, keywords: List[str],
     }
 
 
-def _evaluate_readability_fallback(text: str, keywords: List[str],
+def _evaluate_readability_fallback(analysis: TextAnalysis, keywords: List[str],
                                    page_type: str, city_name: Optional[str]) -> Dict[str, Any]:
     """Fallback readability evaluation."""
     _ = keywords, page_type, city_name
 
-    sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+    sentence_word_counts = analysis.sentence_word_counts
     avg_sentence_length = (
-        sum(len(s.split()) for s in sentences) / len(sentences)
-        if sentences else 0
+        sum(sentence_word_counts) / len(sentence_word_counts)
+        if sentence_word_counts else 0
     )
 
     if avg_sentence_length <= MAX_SENTENCE_LENGTH:
@@ -510,7 +1701,8 @@ def _evaluate_readability_fallback(text: str, keywords: List[str],
     }
 
 
-def _evaluate_keyword_usage_fallback(text: str, keywords: List[str]) -> Dict[str, Any]:
+def _evaluate_keyword_usage_fallback(analysis: TextAnalysis,
+                                     keywords: List[str]) -> Dict[str, Any]:
     """Fallback keyword evaluation."""
     if not keywords:
         return {
@@ -519,7 +1711,7 @@ def _evaluate_keyword_usage_fallback(text: str, keywords: List[str]) -> Dict[str
             "method": "Rule-based"
         }
 
-    keyword_density = _calculate_keyword_density(text, keywords)
+    keyword_density = _calculate_keyword_density(analysis, keywords)
 
     if KEYWORD_DENSITY_MIN <= keyword_density <= KEYWORD_DENSITY_MAX:
         score = 8
@@ -538,11 +1730,12 @@ def _evaluate_keyword_usage_fallback(text: str, keywords: List[str]) -> Dict[str
     }
 
 
-def _evaluate_structure_fallback(text: str) -> Dict[str, Any]:
+def _evaluate_structure_fallback(analysis: TextAnalysis) -> Dict[str, Any]:
     """Fallback structure evaluation."""
-    h1_count = len(re.findall(r'<h1[^>]*>', text, re.IGNORECASE))
-    h2_count = len(re.findall(r'<h2[^>]*>', text, re.IGNORECASE))
-    h3_count = len(re.findall(r'<h3[^>]*>', text, re.IGNORECASE))
+    heading_counts = analysis.heading_counts
+    h1_count = heading_counts[1]
+    h2_count = heading_counts[2]
+    h3_count = heading_counts[3]
 
     score = DEFAULT_SCORE
     details = []
@@ -570,7 +1763,8 @@ def _evaluate_structure_fallback(text: str) -> Dict[str, Any]:
     }
 
 
-def _evaluate_local_relevance_fallback(text: str, city_name: Optional[str]) -> Dict[str, Any]:
+def _evaluate_local_relevance_fallback(analysis: TextAnalysis,
+                                       city_name: Optional[str]) -> Dict[str, Any]:
     """Fallback local relevance evaluation."""
     if not city_name or city_name == "Unknown City":
         return {
@@ -579,9 +1773,9 @@ def _evaluate_local_relevance_fallback(text: str, city_name: Optional[str]) -> D
             "method": "Rule-based"
         }
 
-    city_mentions = text.lower().count(city_name.lower())
+    city_mentions = analysis.lower.count(city_name.lower())
     local_terms = ['local', 'nearby', 'area', 'district', 'region']
-    local_score = sum(1 for term in local_terms if term in text.lower())
+    local_score = sum(1 for term in local_terms if term in analysis.lower)
 
     score = min(MAX_SCORE, city_mentions + local_score)
 
@@ -593,16 +1787,16 @@ def _evaluate_local_relevance_fallback(text: str, city_name: Optional[str]) -> D
     }
 
 
-def _evaluate_pricing_focus_fallback(text: str) -> Dict[str, Any]:
+def _evaluate_pricing_focus_fallback(analysis: TextAnalysis) -> Dict[str, Any]:
     """Fallback pricing focus evaluation."""
-    price_terms = ['cost', 'price', 'fee', 'expense', '€', '$']
-    price_score = sum(1 for term in price_terms if term in text.lower())
+    rule_hits = analysis.rule_hits
+    price_score = len(rule_hits.price_terms)
 
-    price_patterns = [r'€\s*\d+', r'\$\s*\d+', r'price.*\d+']
-    pattern_matches = sum(
-        1 for pattern in price_patterns
-        if re.search(pattern, text, re.IGNORECASE)
-    )
+    pattern_matches = sum([
+        rule_hits.euro_amount,
+        rule_hits.dollar_amount,
+        rule_hits.price_amount
+    ])
 
     score = min(MAX_SCORE, price_score + pattern_matches)
 
@@ -617,85 +1811,157 @@ def _evaluate_pricing_focus_fallback(text: str) -> Dict[str, Any]:
 def extract_city_name(text: str, keywords: List[str]) -> str:
     """Extract city name from keywords or text."""
     for keyword in keywords:
-        city_match = re.search(
-            r'\b(?:in|te)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            keyword
-        )
+        city_match = CITY_AFTER_PREPOSITION_PATTERN.search(keyword)
         if city_match:
             return city_match.group(1)
 
-    city_patterns = [
-        r'\b(?:in|te)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:area|region|city)'
-    ]
+    match = CITY_AFTER_PREPOSITION_PATTERN.search(text)
+    if match:
+        return match.group(1)
 
-    for pattern in city_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(1)
+    # Equivalent to searching for the capitalised run in front of
+    # "area/region/city", without re-trying the run from every word in it
+    for run in CAPITALIZED_RUN_PATTERN.finditer(text):
+        if AREA_SUFFIX_PATTERN.match(text, run.end()):
+            return run.group()
 
     return "Unknown City"
 
 
-def evaluate_checklist(text: str, keywords: List[str], page_type: str) -> Dict[str, Any]:
+def evaluate_checklist(text: str, keywords: List[str], page_type: str,
+                       max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                       combined: bool = False,
+                       analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
     """Evaluate content against the appropriate checklist."""
+    analysis = analysis or TextAnalysis(text)
+
     if page_type == "cost":
-        return _evaluate_cost_page(text, keywords)
+        return _evaluate_cost_page(
+            text, keywords, max_concurrency, combined, analysis)
     else:
         city_name = extract_city_name(text, keywords)
-        return _evaluate_city_page(text, keywords, city_name)
+        return _evaluate_city_page(
+            text, keywords, city_name, max_concurrency, combined, analysis)
 
 
-def _evaluate_cost_page(text: str, keywords: List[str]) -> Dict[str, Any]:
+def _evaluate_cost_page(text: str, keywords: List[str],
+                        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        combined: bool = False,
+                        analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
     """Evaluate a cost page using AI with fallbacks."""
-    results = {}
-
-    evaluation_types = [
-        "grammar_spelling", "readability", "keyword_usage",
-        "content_structure", "seo_quality", "pricing_focus"
-    ]
+    analysis = analysis or TextAnalysis(text)
 
-    for eval_type in evaluation_types:
-        results[eval_type] = evaluate_with_ai_fallback(
-            text, keywords, eval_type, "cost"
+    if combined:
+        results = evaluate_combined_with_ai_fallback(
+            text, keywords, COST_EVALUATION_TYPES, "cost", analysis=analysis
+        )
+    else:
+        results = _run_evaluations(
+            text, keywords, COST_EVALUATION_TYPES, "cost",
+            max_concurrency=max_concurrency, analysis=analysis
         )
 
-    results["internal_linking"] = _evaluate_internal_linking(text)
-    results["formatting"] = _evaluate_formatting(text)
+    results["internal_linking"] = _evaluate_internal_linking(analysis)
+    results["formatting"] = _evaluate_formatting(analysis)
 
     return results
 
 
-def _evaluate_city_page(text: str, keywords: List[str], city_name: str) -> Dict[str, Any]:
+def _evaluate_city_page(text: str, keywords: List[str], city_name: str,
+                        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        combined: bool = False,
+                        analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
     """Evaluate a city page using AI with fallbacks."""
-    results = {}
+    analysis = analysis or TextAnalysis(text)
 
-    evaluation_types = [
-        "grammar_spelling", "readability", "keyword_usage",
-        "content_structure", "seo_quality", "local_relevance"
-    ]
-
-    for eval_type in evaluation_types:
-        results[eval_type] = evaluate_with_ai_fallback(
-            text, keywords, eval_type, "city", city_name
+    if combined:
+        results = evaluate_combined_with_ai_fallback(
+            text, keywords, CITY_EVALUATION_TYPES, "city", city_name,
+            analysis=analysis
+        )
+    else:
+        results = _run_evaluations(
+            text, keywords, CITY_EVALUATION_TYPES, "city", city_name,
+            max_concurrency=max_concurrency, analysis=analysis
         )
 
-    results["internal_linking"] = _evaluate_internal_linking(text)
-    results["formatting"] = _evaluate_formatting(text)
+    results["internal_linking"] = _evaluate_internal_linking(analysis)
+    results["formatting"] = _evaluate_formatting(analysis)
 
     return results
 
 
-def _evaluate_internal_linking(text: str) -> Dict[str, Any]:
+def _run_evaluations(text: str, keywords: List[str], evaluation_types: List[str],
+                     page_type: str, city_name: Optional[str] = None,
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                     analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
+    """
+    Run evaluations on a bounded thread pool.
+
+    Each evaluation is an independent, I/O-bound OpenAI round trip, so running
+    them side by side brings page latency down to roughly one request. With an
+    evaluation deadline configured, an evaluation still unfinished when its
+    slice of the deadline expires is replaced by its rule-based result.
+
+    Args:
+        text: Content to evaluate
+        keywords: List of keywords
+        evaluation_types: Evaluation types to run
+        page_type: Page type
+        city_name: City name for city pages
+        max_concurrency: Maximum number of evaluations in flight (1 = sequential)
+        analysis: Shared text analysis of the content
+
+    Returns:
+        Dictionary of results keyed by evaluation type, in checklist order
+    """
+    max_workers = max(1, min(max_concurrency, len(evaluation_types)))
+
+    # Split the page's latency budget into one slice per round of max_workers
+    # evaluations; an evaluation must finish by the end of its round's slice
+    deadlines: Dict[str, Optional[float]] = {}
+    if evaluation_deadline:
+        start = time.monotonic()
+        rounds = -(-len(evaluation_types) // max_workers)
+        for index, eval_type in enumerate(evaluation_types):
+            deadlines[eval_type] = (
+                start + evaluation_deadline * (index // max_workers + 1) / rounds)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {}
+        for eval_type in evaluation_types:
+            # Run each evaluation in a copy of this context to keep the page
+            # deadline, and give it its own evaluation deadline
+            context = contextvars.copy_context()
+            context.run(_evaluation_deadline.set, deadlines.get(eval_type))
+            futures[eval_type] = executor.submit(
+                context.run, evaluate_with_ai_fallback,
+                text, keywords, eval_type, page_type, city_name, analysis
+            )
+
+        results = {}
+        for eval_type, future in futures.items():
+            deadline = deadlines.get(eval_type)
+            try:
+                results[eval_type] = future.result(
+                    None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                # A running request ends on its own timeout; a queued one never starts
+                future.cancel()
+                results[eval_type] = _evaluate_after_deadline(
+                    text, keywords, eval_type, page_type, city_name, analysis)
+        return results
+    finally:
+        executor.shutdown(wait=not deadlines, cancel_futures=True)
+
+
+def _evaluate_internal_linking(analysis: TextAnalysis) -> Dict[str, Any]:
     """Evaluate internal linking strategy."""
     score = 0
     details = []
 
-    link_pattern = re.compile(
-        r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>',
-        re.IGNORECASE
-    )
-    links = link_pattern.findall(text)
+    links = analysis.links
 
     top10_links = sum(
         1 for _, link_text in links
@@ -741,29 +2007,24 @@ def _evaluate_internal_linking(text: str) -> Dict[str, Any]:
     }
 
 
-def _evaluate_formatting(text: str) -> Dict[str, Any]:
+def _evaluate_formatting(analysis: TextAnalysis) -> Dict[str, Any]:
     """Evaluate formatting and specific guidelines."""
+    rule_hits = analysis.rule_hits
     score = DEFAULT_SCORE
     details = []
 
-    price_patterns = [r'€\s*\d+,-', r'€\s*\d+\.\d+,-', r'€\s*\d+,\d+']
-    correct_prices = sum(
-        1 for pattern in price_patterns
-        if re.search(pattern, text)
-    )
-    if correct_prices > 0:
+    if rule_hits.euro_formatted:
         score += 2
         details.append("✓ Correct price formatting")
 
-    if re.search(r'\d+%', text):
+    if rule_hits.percent:
         score += 1
         details.append("✓ Correct percentage formatting")
 
     score += 1
     details.append("✓ Assuming correct number formatting")
 
-    bullet_patterns = [r'^\s*[-•*]\s+', r'^\s*\d+\.\s+']
-    if any(re.search(pattern, text, re.MULTILINE) for pattern in bullet_patterns):
+    if analysis.has_lists:
         score += 1
         details.append("✓ Has formatted bullet points")
 
@@ -773,14 +2034,15 @@ def _evaluate_formatting(text: str) -> Dict[str, Any]:
     }
 
 
-def _calculate_keyword_density(text: str, keywords: List[str]) -> float:
+def _calculate_keyword_density(analysis: TextAnalysis, keywords: List[str]) -> float:
     """Calculate keyword density percentage."""
     if not keywords:
         return 0.0
 
-    word_count = len(text.split())
+    word_count = analysis.word_count
+    keyword_positions = get_keyword_matcher(keywords).find_all(analysis.lower)
     keyword_count = sum(
-        text.lower().count(keyword.lower())
+        len(keyword_positions[keyword])
         for keyword in keywords
     )
 
@@ -823,21 +2085,14 @@ def generate_ai_suggestions(text: str, keywords: List[str],
             "Format as:\n1. [suggestion]\n2. [suggestion]\n...etc"
         )
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": ("You are an expert SEO consultant providing "
-                                "actionable improvement advice.")
-                },
-                {"role": "user", "content": prompt}
-            ],
+        suggestions_text = _create_chat_completion(
+            client,
+            ("You are an expert SEO consultant providing "
+             "actionable improvement advice."),
+            prompt,
             max_tokens=400,
             temperature=0.5
         )
-
-        suggestions_text = response.choices[0].message.content
         suggestions = []
 
         for line in suggestions_text.split('\n'):
@@ -848,7 +2103,7 @@ def generate_ai_suggestions(text: str, keywords: List[str],
 
         return suggestions[:5]
 
-    except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
+    except _openai_errors() as e:
         print(f"AI suggestion generation failed: {e}, using fallback")
         return _generate_improvement_suggestions_fallback(checklist_results, page_type)
 
@@ -888,66 +2143,847 @@ def _generate_improvement_suggestions_fallback(checklist_results: Dict[str, Any]
     return suggestions
 
 
+def _report_settings(page_type: Optional[str], combined: bool) -> str:
+    """Describe the evaluation settings that change a document's report."""
+    return f"page_type={page_type or 'auto'};combined={combined};ai={_openai_available()}"
+
+
+def process_document(doc_id: str, keywords_sheet: str, docs_service: Any,
+                     sheets_service: Any, page_type: Optional[str] = None,
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                     combined: bool = False,
+                     keywords_tab: Optional[str] = None,
+                     force: bool = False,
+                     document: Optional[DocumentModel] = None,
+                     revision_id: Optional[str] = None,
+                     drive_service: Any = None) -> Optional[str]:
+    """
+    Fetch, evaluate and report on a single Google Doc.
+
+    Args:
+        doc_id: Google Document ID
+        keywords_sheet: Google Sheet ID with keywords
+        docs_service: Google Docs service instance
+        sheets_service: Google Sheets service instance
+        page_type: Forced page type, or None to detect it
+        max_concurrency: Maximum number of evaluations in flight
+        combined: Score all AI criteria with a single request
+        keywords_tab: Tab of the keyword sheet, or None for the first tab
+        force: Re-evaluate even if the document and keywords are unchanged
+        document: Already fetched document, e.g. from read_documents_batch
+        revision_id: Already fetched revision ID of the document
+        drive_service: Google Drive service instance, used to reuse keyword
+            sheets cached by earlier runs
+
+    Returns:
+        Report filename or None if the document or keywords could not be read
+    """
+    print("Reading keywords...")
+    sheets = load_keyword_sheets([keywords_sheet], sheets_service, drive_service)
+    keywords = tab_keywords(sheets.get(keywords_sheet), keywords_tab)
+    if not keywords:
+        print("Failed to read keywords")
+        return None
+
+    keywords_hash = hash_keywords(keywords)
+    settings = _report_settings(page_type, combined)
+
+    if revision_store is not None and not force:
+        if revision_id is None and document is not None:
+            revision_id = document.revision_id
+        if revision_id is None:
+            revision_id = read_document_revision(doc_id, docs_service)
+        if revision_id:
+            report_path = revision_store.find_unchanged(
+                doc_id, revision_id, keywords_hash, settings)
+            if report_path:
+                print(f"Document unchanged since last run, reusing {report_path}")
+                return report_path
+
+    if document is None:
+        print("Reading document...")
+        document = read_document_model(doc_id, docs_service)
+    if not document or not document.text:
+        print("Failed to read document")
+        return None
+
+    output_filename, reusable = evaluate_document(
+        doc_id, document, keywords, page_type, max_concurrency, combined)
+
+    # A report where the AI fell back to rules is not reused, so the next run retries the AI
+    if revision_store is not None and document.revision_id and reusable:
+        revision_store.record(
+            doc_id, document.revision_id, keywords_hash, settings, output_filename)
+
+    return output_filename
+
+
+def evaluate_document(doc_id: str, document: DocumentModel, keywords: List[str],
+                      page_type: Optional[str] = None,
+                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                      combined: bool = False) -> Tuple[str, bool]:
+    """
+    Evaluate a document that has already been read and write its report.
+
+    Args:
+        doc_id: Google Document ID, used to name the report
+        document: Document content and structure
+        keywords: Keyword list for the document
+        page_type: Forced page type, or None to detect it
+        max_concurrency: Maximum number of evaluations in flight
+        combined: Score all AI criteria with a single request
+
+    Returns:
+        Report filename, and whether the report may be reused: False if the
+        AI was available but some criterion fell back to rule-based scoring
+    """
+    text = document.text
+    analysis = TextAnalysis(text, document)
+
+    with _openai_page():
+        page_type = page_type or detect_page_type_ai(text, keywords, analysis)
+        print(f"Page type detected: {page_type}")
+
+        print("Evaluating content with AI...")
+        checklist_results = evaluate_checklist(
+            text, keywords, page_type, max_concurrency, combined, analysis)
+
+        print("Generating AI-powered suggestions...")
+        suggestions = generate_ai_suggestions(
+            text, keywords, checklist_results, page_type)
+
+    print("Generating report...")
+    report = generate_report(
+        text, keywords, checklist_results, suggestions, page_type)
+
+    output_filename = f"report_{doc_id}.md"
+    with open(output_filename, 'w', encoding='utf-8') as output_file:
+        output_file.write(report)
+
+    print(f"Report saved as {output_filename}")
+    # Without an API key every criterion is rule-based by design
+    reusable = not _openai_available() or all(
+        result["method"] == "AI" for result in checklist_results.values()
+        if isinstance(result, dict) and "method" in result)
+    return output_filename, reusable
+
+
+def fetch_snapshot(doc_id: str, keywords_sheet: str, docs_service: Any,
+                   sheets_service: Any, page_type: Optional[str] = None,
+                   keywords_tab: Optional[str] = None,
+                   document: Optional[DocumentModel] = None,
+                   drive_service: Any = None) -> Optional[str]:
+    """
+    Fetch a Google Doc and its keywords into the snapshot store.
+
+    Args:
+        doc_id: Google Document ID
+        keywords_sheet: Google Sheet ID with keywords
+        docs_service: Google Docs service instance
+        sheets_service: Google Sheets service instance
+        page_type: Page type to store with the snapshot, or None to detect it
+        keywords_tab: Tab of the keyword sheet, or None for the first tab
+        document: Already fetched document, e.g. from read_documents_batch
+        drive_service: Google Drive service instance, used to reuse keyword
+            sheets cached by earlier runs
+
+    Returns:
+        Content hash of the snapshot or None if the document or keywords
+        could not be read
+    """
+    sheets = load_keyword_sheets([keywords_sheet], sheets_service, drive_service)
+    keywords = tab_keywords(sheets.get(keywords_sheet), keywords_tab)
+    if not keywords:
+        print(f"Failed to read keywords for {doc_id}")
+        return None
+
+    if document is None:
+        document = read_document_model(doc_id, docs_service)
+    if not document or not document.text:
+        print(f"Failed to read document {doc_id}")
+        return None
+
+    return snapshot_store.put(
+        doc_id, document, keywords, keywords_sheet, keywords_tab, page_type)
+
+
+def evaluate_snapshot(doc_id: str, page_type: Optional[str] = None,
+                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                      combined: bool = False) -> Optional[str]:
+    """
+    Evaluate a document from the snapshot store, without Google API calls.
+
+    Snapshots are evaluated again on every run, even if an earlier report
+    was made with the same keywords and settings: the evaluate stage is for
+    re-scoring, e.g. after the scoring code or prompts changed.
+
+    Args:
+        doc_id: Google Document ID
+        page_type: Forced page type, or None for the snapshot's page type
+        max_concurrency: Maximum number of evaluations in flight
+        combined: Score all AI criteria with a single request
+
+    Returns:
+        Report filename or None if the document has no snapshot
+    """
+    snapshot = snapshot_store.get(doc_id)
+    if snapshot is None:
+        print(f"No snapshot of {doc_id}; run the fetch stage first")
+        return None
+
+    page_type = page_type or snapshot.page_type
+    revision_id = snapshot.document.revision_id
+    keywords_hash = hash_keywords(snapshot.keywords)
+    settings = _report_settings(page_type, combined)
+
+    output_filename, reusable = evaluate_document(
+        doc_id, snapshot.document, snapshot.keywords, page_type,
+        max_concurrency, combined)
+
+    if revision_store is not None and revision_id and reusable:
+        revision_store.record(
+            doc_id, revision_id, keywords_hash, settings, output_filename)
+
+    return output_filename
+
+
+def load_manifest(manifest_path: str) -> List[Dict[str, Optional[str]]]:
+    """
+    Load a batch manifest from a CSV or JSONL file.
+
+    CSV files need a header row with doc_id and keywords_sheet columns; JSONL
+    files hold one object per line with the same keys. page_type and
+    keywords_tab (a tab title of the keyword sheet) are optional.
+
+    Args:
+        manifest_path: Path to a .csv or .jsonl manifest
+
+    Returns:
+        List of rows with doc_id, keywords_sheet, keywords_tab and page_type keys
+
+    Raises:
+        SEOEvaluationError: If the manifest is malformed
+    """
+    with open(manifest_path, 'r', encoding='utf-8', newline='') as manifest_file:
+        if manifest_path.lower().endswith(('.jsonl', '.ndjson')):
+            try:
+                raw_rows = [
+                    json.loads(line) for line in manifest_file if line.strip()
+                ]
+            except json.JSONDecodeError as e:
+                raise SEOEvaluationError(f"Invalid manifest line: {e}") from e
+        else:
+            raw_rows = list(csv.DictReader(manifest_file))
+
+    rows = []
+    for line_number, raw_row in enumerate(raw_rows, 1):
+        if not isinstance(raw_row, dict):
+            raise SEOEvaluationError(
+                f"Manifest row {line_number} is not an object")
+
+        doc_id = str(raw_row.get('doc_id') or '').strip()
+        keywords_sheet = str(raw_row.get('keywords_sheet') or '').strip()
+        keywords_tab = str(raw_row.get('keywords_tab') or '').strip() or None
+        page_type = str(raw_row.get('page_type') or '').strip().lower() or None
+
+        if not doc_id or not keywords_sheet:
+            raise SEOEvaluationError(
+                f"Manifest row {line_number} needs doc_id and keywords_sheet")
+        if page_type not in (None, 'cost', 'city'):
+            raise SEOEvaluationError(
+                f"Manifest row {line_number} has invalid page_type '{page_type}'")
+
+        rows.append({
+            'doc_id': doc_id,
+            'keywords_sheet': keywords_sheet,
+            'keywords_tab': keywords_tab,
+            'page_type': page_type
+        })
+
+    return rows
+
+
+def _prefetch_manifest_window(rows: List[Dict[str, Optional[str]]], docs_service: Any,
+                              sheets_service: Any, combined: bool, force: bool,
+                              drive_service: Any = None
+                              ) -> Tuple[Dict[str, DocumentModel], Dict[str, str]]:
+    """
+    Fetch what a window of manifest rows needs with batched requests.
+
+    Keyword sheets are loaded into the keyword cache. Documents that are
+    unchanged since their last report only get their revision ID fetched.
+    Anything that fails here is fetched again on its own by process_document.
+
+    Args:
+        rows: Manifest rows of the window
+        docs_service: Google Docs service instance
+        sheets_service: Google Sheets service instance
+        combined: Score all AI criteria with a single request
+        force: Re-evaluate documents even if they are unchanged
+        drive_service: Google Drive service instance, or None
+
+    Returns:
+        Tuple of (documents by ID, revision IDs by document ID)
+    """
+    doc_ids = list(dict.fromkeys(row['doc_id'] for row in rows))
+    revisions: Dict[str, str] = {}
+
+    # Without unchanged documents to skip, the documents do not depend on the
+    # keywords, so read them on the async loop while the keyword sheets load
+    pending_documents = None
+    if (revision_store is None or force) and doc_ids and _async_google_enabled():
+        runner = _async_google_runner()
+        pending_documents = runner.submit(read_documents_async(doc_ids, runner.client))
+
+    sheets = load_keyword_sheets(
+        [row['keywords_sheet'] for row in rows], sheets_service, drive_service)
+
+    if revision_store is not None and not force:
+        revisions = read_document_revisions_batch(doc_ids, docs_service)
+        unchanged = set()
+        for row in rows:
+            keywords = tab_keywords(
+                sheets.get(row['keywords_sheet']), row['keywords_tab'])
+            revision_id = revisions.get(row['doc_id'])
+            if keywords and revision_id and revision_store.lookup_report(
+                    row['doc_id'], revision_id, hash_keywords(keywords),
+                    _report_settings(row['page_type'], combined)):
+                unchanged.add(row['doc_id'])
+        doc_ids = [doc_id for doc_id in doc_ids if doc_id not in unchanged]
+
+    if pending_documents is not None:
+        documents = pending_documents.result()
+    else:
+        documents = _read_documents(doc_ids, docs_service) if doc_ids else {}
+
+    return documents, revisions
+
+
+def run_manifest(rows: List[Dict[str, Optional[str]]], docs_service: Any,
+                 sheets_service: Any, workers: int = DEFAULT_BATCH_WORKERS,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 combined: bool = False, force: bool = False,
+                 drive_service: Any = None, stage: str = "all") -> Dict[str, Any]:
+    """
+    Evaluate every document of a manifest in this process.
+
+    Google services, the OpenAI client and keyword lists are shared between
+    documents; a failure on one document does not stop the others. The
+    fetch stage only stores snapshots and the evaluate stage only reads
+    them, so the Google services are not needed there.
+
+    Args:
+        rows: Manifest rows from load_manifest
+        docs_service: Google Docs service instance
+        sheets_service: Google Sheets service instance
+        workers: Number of documents processed in parallel
+        max_concurrency: Maximum number of evaluations in flight per document
+        combined: Score all AI criteria with a single request
+        force: Re-evaluate documents even if they are unchanged (the
+            evaluate stage always re-scores)
+        drive_service: Google Drive service instance, used to reuse keyword
+            sheets cached by earlier runs
+        stage: One of PIPELINE_STAGES
+
+    Returns:
+        Dictionary with succeeded/failed doc IDs, elapsed seconds and docs_per_minute
+    """
+    succeeded = []
+    failed = []
+    start_time = time.perf_counter()
+
+    def _process_row(row: Dict[str, Optional[str]], document: Optional[DocumentModel],
+                     revision_id: Optional[str]) -> Optional[str]:
+        if stage == "fetch":
+            return fetch_snapshot(
+                row['doc_id'], row['keywords_sheet'], docs_service, sheets_service,
+                row['page_type'], row['keywords_tab'], document, drive_service
+            )
+        if stage == "evaluate":
+            return evaluate_snapshot(
+                row['doc_id'], row['page_type'], max_concurrency, combined)
+        return process_document(
+            row['doc_id'], row['keywords_sheet'], docs_service, sheets_service,
+            row['page_type'], max_concurrency, combined, row['keywords_tab'],
+            force, document, revision_id, drive_service
+        )
+
+    def _collect(future: Any, doc_id: str) -> None:
+        try:
+            output_filename = future.result()
+        except Exception as e:
+            print(f"✗ {doc_id}: {e}")
+            failed.append(doc_id)
+            return
+
+        if output_filename:
+            print(f"✓ {doc_id}: {output_filename}")
+            succeeded.append(doc_id)
+        else:
+            print(f"✗ {doc_id}: could not read document or keywords")
+            failed.append(doc_id)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending: Dict[Any, str] = {}
+
+        for offset in range(0, len(rows), MANIFEST_PREFETCH_SIZE):
+            window = rows[offset:offset + MANIFEST_PREFETCH_SIZE]
+            documents, revisions = {}, {}
+            if stage != "evaluate":
+                try:
+                    # Snapshots are always refetched, unchanged or not
+                    documents, revisions = _prefetch_manifest_window(
+                        window, docs_service, sheets_service, combined,
+                        force or stage == "fetch", drive_service)
+                except Exception as e:
+                    # Each row then reads what it needs on its own
+                    print(f"Prefetch failed for documents {offset + 1}-"
+                          f"{offset + len(window)}, reading them one by one: {e}")
+
+            for row in window:
+                future = executor.submit(
+                    _process_row, row, documents.get(row['doc_id']),
+                    revisions.get(row['doc_id']))
+                pending[future] = row['doc_id']
+
+            # Keep at most one prefetched window waiting for the workers
+            while len(pending) > MANIFEST_PREFETCH_SIZE:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _collect(future, pending.pop(future))
+
+        for future in as_completed(pending):
+            _collect(future, pending[future])
+
+    elapsed = time.perf_counter() - start_time
+    docs_per_minute = (len(rows) / elapsed * 60) if elapsed > 0 else 0.0
+
+    return {
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed_seconds": elapsed,
+        "docs_per_minute": docs_per_minute
+    }
+
+
+def _print_run_summary(batch_summary: Optional[Dict[str, Any]] = None) -> None:
+    """Print run-level statistics after all documents are processed."""
+    if batch_summary is not None:
+        total = len(batch_summary["succeeded"]) + len(batch_summary["failed"])
+        print(f"Batch complete: {len(batch_summary['succeeded'])}/{total} documents "
+              f"succeeded in {batch_summary['elapsed_seconds']:.1f}s "
+              f"({batch_summary['docs_per_minute']:.1f} docs/min)")
+        if batch_summary["failed"]:
+            print(f"Failed documents: {', '.join(batch_summary['failed'])}")
+
+    if revision_store is not None:
+        revision_stats = revision_store.stats()
+        print(f"Unchanged documents skipped: {revision_stats['unchanged']}"
+              f"/{revision_stats['checked']}")
+
+    scheduler_stats = google_scheduler.stats()
+    print(f"Google API: {scheduler_stats['calls']} calls, "
+          f"{scheduler_stats['waits']} waited for quota, "
+          f"{scheduler_stats['retries']} retried, "
+          f"{scheduler_stats['exhausted']} gave up after retries")
+
+    if google_pool is not None:
+        pool_stats = google_pool.stats()
+        print(f"Google connections: {pool_stats['created']}/{pool_stats['size']} opened, "
+              f"{pool_stats['waits']} of {pool_stats['checkouts']} requests waited for one")
+
+    if token_cache is not None:
+        token_stats = token_cache.stats()
+        print(f"Google access token: {token_stats['hits']} reused from cache, "
+              f"{token_stats['refreshes']} refreshed")
+
+    if snapshot_store is not None:
+        snapshot_stats = snapshot_store.stats()
+        print(f"Snapshots: {snapshot_stats['written']} written, "
+              f"{snapshot_stats['deduplicated']} already stored, "
+              f"{snapshot_stats['read']} read")
+
+    keyword_stats = keyword_cache.stats()
+    print(f"Keyword sheets: {keyword_stats['fetches']} read, "
+          f"{keyword_stats['disk_hits']} from disk cache, "
+          f"{keyword_stats['memory_hits']} reused in memory")
+
+    if openai_limiter is not None and openai_limiter.requests:
+        limiter_stats = openai_limiter.stats()
+        print(f"OpenAI: {limiter_stats['requests']} requests, "
+              f"{limiter_stats['throttled']} rate limited, "
+              f"{limiter_stats['retries']} retried, "
+              f"{limiter_stats['exhausted']} gave up within the page budget "
+              f"(concurrency limit now {limiter_stats['limit']})")
+
+    if openai_breaker is not None and (openai_breaker.calls or openai_breaker.rejected):
+        breaker_stats = openai_breaker.stats()
+        print(f"OpenAI circuit: {breaker_stats['state']}, "
+              f"{breaker_stats['failures']}/{breaker_stats['calls']} calls failed or slow, "
+              f"{breaker_stats['rejected']} sent straight to rule-based scoring")
+        for changed_at, old_state, new_state, reason in breaker_stats["transitions"]:
+            print(f"  {time.strftime('%H:%M:%S', time.localtime(changed_at))} "
+                  f"{old_state} -> {new_state} ({reason})")
+
+    if openai_single_flight is not None and openai_single_flight.shared:
+        flight_stats = openai_single_flight.stats()
+        print(f"Coalesced OpenAI requests: {flight_stats['shared']} calls saved by sharing "
+              f"{flight_stats['calls']} in-flight requests")
+
+    if request_hedger is not None and request_hedger.calls:
+        hedge_stats = request_hedger.stats()
+        print(f"Hedged requests: {hedge_stats['hedged']} duplicates for "
+              f"{hedge_stats['calls']} requests ({hedge_stats['extra_ratio']:.1%} extra, "
+              f"cap {request_hedger.max_extra_ratio:.0%}), "
+              f"{hedge_stats['hedge_wins']} answered first, "
+              f"{hedge_stats['denied']} not hedged over the cap")
+
+    if llm_cache is not None:
+        cache_stats = llm_cache.stats()
+        print(f"AI response cache: {cache_stats['hits']} hits, "
+              f"{cache_stats['misses']} misses")
+
+
+def _parse_seconds(value: str) -> float:
+    """Parse a duration argument such as "8", "8s", "1500ms" or "1m"."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = parse_duration(value.strip())
+        if seconds is None:
+            raise argparse.ArgumentTypeError(f"invalid duration: {value!r}")
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"duration must be positive: {value!r}")
+    return seconds
+
+
+def _print_startup_profile() -> None:
+    """Print lazy import and client initialisation timings."""
+    print("Startup profile:")
+    for label, seconds in _startup_timings.items():
+        print(f"  {label}: {seconds * 1000:.1f} ms")
+    print(f"  total: {(time.perf_counter() - _IMPORT_START) * 1000:.1f} ms")
+
+
 def main() -> None:
     """Main function to run the SEO proofreader."""
     parser = argparse.ArgumentParser(
         description='SEO Proofreader Tool with AI')
-    parser.add_argument('--doc_id', required=True, help='Google Doc ID')
+    parser.add_argument('--doc_id', help='Google Doc ID')
     parser.add_argument(
         '--keywords_sheet',
-        required=True,
         help='Google Sheet ID with keywords'
     )
+    parser.add_argument(
+        '--keywords_tab',
+        help='Tab of the keyword sheet to read (default: the first tab)'
+    )
+    parser.add_argument(
+        '--manifest',
+        help=('CSV or JSONL file of doc_id, keywords_sheet and optional '
+              'keywords_tab and page_type rows to evaluate in one run')
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help=('Number of manifest documents processed in parallel '
+              f'(default: {DEFAULT_BATCH_WORKERS})')
+    )
     parser.add_argument(
         '--page_type',
         choices=['cost', 'city'],
         help='Force page type (optional)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=('Maximum number of checklist evaluations run in parallel '
+              f'(default: {DEFAULT_MAX_CONCURRENCY})')
+    )
+    parser.add_argument(
+        '--combined',
+        action='store_true',
+        help='Score all checklist criteria with a single AI request per page'
+    )
+    parser.add_argument(
+        '--cache_path',
+        default=DEFAULT_CACHE_PATH,
+        help=f'SQLite file for cached AI responses (default: {DEFAULT_CACHE_PATH})'
+    )
+    parser.add_argument(
+        '--cache_max_mb',
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help='Size cap of the AI response cache in MB; least recently used entries are evicted'
+    )
+    parser.add_argument(
+        '--cache_ttl_hours',
+        type=float,
+        help='Expire cached AI responses after this many hours (optional)'
+    )
+    parser.add_argument(
+        '--no_cache',
+        action='store_true',
+        help='Disable the AI response cache'
+    )
+    parser.add_argument(
+        '--docs_reads_per_minute',
+        type=float,
+        default=DOCS_READS_PER_MINUTE,
+        help=('Google Docs read quota to pace requests to '
+              f'(default: {DOCS_READS_PER_MINUTE})')
+    )
+    parser.add_argument(
+        '--sheets_reads_per_minute',
+        type=float,
+        default=SHEETS_READS_PER_MINUTE,
+        help=('Google Sheets read quota to pace requests to '
+              f'(default: {SHEETS_READS_PER_MINUTE})')
+    )
+    parser.add_argument(
+        '--google_connections',
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=('Maximum number of Google API connections used in parallel '
+              f'(default: {DEFAULT_POOL_SIZE})')
+    )
+    parser.add_argument(
+        '--async_connections',
+        type=int,
+        help=('Read manifest documents and keyword sheets concurrently on one event '
+              'loop over this many connections instead of batched requests (optional)')
+    )
+    parser.add_argument(
+        '--openai_requests_per_minute',
+        type=float,
+        default=OPENAI_REQUESTS_PER_MINUTE,
+        help=('OpenAI request quota to pace calls to until the rate limit headers '
+              f'report the actual one (default: {OPENAI_REQUESTS_PER_MINUTE})')
+    )
+    parser.add_argument(
+        '--openai_tokens_per_minute',
+        type=float,
+        default=OPENAI_TOKENS_PER_MINUTE,
+        help=('OpenAI token quota to pace calls to until the rate limit headers '
+              f'report the actual one (default: {OPENAI_TOKENS_PER_MINUTE})')
+    )
+    parser.add_argument(
+        '--openai_page_budget',
+        type=float,
+        default=DEFAULT_PAGE_BUDGET_SECONDS,
+        help=('Seconds per page within which rate-limited OpenAI calls are retried '
+              f'before falling back to rule-based scoring (default: {DEFAULT_PAGE_BUDGET_SECONDS:.0f})')
+    )
+    parser.add_argument(
+        '--deadline',
+        type=_parse_seconds,
+        help=('Latency budget of each page\'s checklist evaluations (e.g. 8s), split '
+              'across the evaluation types; evaluations that miss their share are '
+              'scored rule-based (default: no deadline)')
+    )
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help=('Send a duplicate of an AI evaluation request that is slower than the '
+              'running latency percentile of its evaluation type; the first answer wins')
+    )
+    parser.add_argument(
+        '--hedge_percentile',
+        type=float,
+        default=DEFAULT_HEDGE_PERCENTILE,
+        help=('Latency percentile per evaluation type after which a request is hedged '
+              f'(default: {DEFAULT_HEDGE_PERCENTILE:.0f})')
+    )
+    parser.add_argument(
+        '--hedge_budget',
+        type=float,
+        default=DEFAULT_MAX_EXTRA_RATIO,
+        help=('Maximum duplicate requests as a fraction of AI evaluation requests '
+              f'(default: {DEFAULT_MAX_EXTRA_RATIO})')
+    )
+    parser.add_argument(
+        '--openai_breaker_failures',
+        type=int,
+        default=DEFAULT_FAILURE_THRESHOLD,
+        help=('Consecutive failed or slow OpenAI calls after which all evaluations '
+              f'use rule-based scoring until a probe succeeds (default: {DEFAULT_FAILURE_THRESHOLD})')
+    )
+    parser.add_argument(
+        '--openai_breaker_latency',
+        type=float,
+        default=DEFAULT_LATENCY_THRESHOLD_SECONDS,
+        help=('Seconds after which a successful OpenAI call counts as a failure '
+              f'(default: {DEFAULT_LATENCY_THRESHOLD_SECONDS:.0f})')
+    )
+    parser.add_argument(
+        '--openai_breaker_cooldown',
+        type=float,
+        default=DEFAULT_OPEN_SECONDS,
+        help=('Seconds the OpenAI circuit stays open before a probe request is sent '
+              f'(default: {DEFAULT_OPEN_SECONDS:.0f})')
+    )
+    parser.add_argument(
+        '--state_path',
+        default=DEFAULT_STATE_PATH,
+        help=('SQLite file recording the revision and keywords behind each report '
+              f'(default: {DEFAULT_STATE_PATH})')
+    )
+    parser.add_argument(
+        '--token_cache',
+        default=DEFAULT_TOKEN_CACHE_PATH,
+        help=('File sharing refreshed Google access tokens between runs and processes '
+              f'(default: {DEFAULT_TOKEN_CACHE_PATH})')
+    )
+    parser.add_argument(
+        '--stage',
+        choices=PIPELINE_STAGES,
+        default='all',
+        help=('fetch: store document snapshots without evaluating; evaluate: score '
+              'stored snapshots without Google API calls (default: all)')
+    )
+    parser.add_argument(
+        '--snapshot_dir',
+        default=DEFAULT_SNAPSHOT_DIR,
+        help=('Directory of the compressed document snapshots used by the fetch and '
+              f'evaluate stages (default: {DEFAULT_SNAPSHOT_DIR})')
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=('Re-evaluate every document even if it is unchanged since the last run '
+              '(the evaluate stage always re-scores, so it does not take this flag)')
+    )
+    parser.add_argument(
+        '--startup_profile', '--startup-profile',
+        action='store_true',
+        help='Print import and client initialisation timings before processing'
+    )
 
     args = parser.parse_args()
 
+    if (args.stage != 'evaluate' and not args.manifest
+            and not (args.doc_id and args.keywords_sheet)):
+        parser.error('either --manifest or both --doc_id and --keywords_sheet are required')
+    if args.stage == 'evaluate' and args.force:
+        parser.error('--force has no effect with --stage evaluate, which always re-scores')
+
+    manifest_rows = None
+    if args.manifest:
+        try:
+            manifest_rows = load_manifest(args.manifest)
+        except (OSError, SEOEvaluationError, ValueError) as e:
+            parser.error(f'cannot read manifest {args.manifest}: {e}')
+
     client = get_openai_client()
     if client and client.api_key:
         print("✓ OpenAI API key found - using AI-powered evaluation")
     else:
         print("⚠ OpenAI API key not found - using rule-based fallbacks")
 
-    docs_service, sheets_service = authenticate_google()
-    if not docs_service or not sheets_service:
+    if not args.no_cache:
+        configure_llm_cache(LLMCache(
+            args.cache_path,
+            max_bytes=int(args.cache_max_mb * 1024 * 1024),
+            ttl_seconds=(args.cache_ttl_hours * 3600
+                         if args.cache_ttl_hours else None)
+        ))
+
+    configure_openai_limiter(OpenAIRateLimiter(
+        args.openai_requests_per_minute,
+        args.openai_tokens_per_minute,
+        max_in_flight=max(1, args.workers) * max(1, args.concurrency),
+        page_budget=args.openai_page_budget
+    ))
+    configure_evaluation_deadline(args.deadline)
+    if args.hedge:
+        configure_request_hedger(RequestHedger(
+            args.hedge_percentile,
+            args.hedge_budget,
+            max_workers=2 * max(1, args.workers) * max(1, args.concurrency)
+        ))
+    configure_openai_breaker(CircuitBreaker(
+        "OpenAI",
+        failure_threshold=args.openai_breaker_failures,
+        latency_threshold=args.openai_breaker_latency,
+        open_seconds=args.openai_breaker_cooldown,
+        is_failure=_is_openai_outage,
+        is_ignored=_is_deadline_timeout
+    ))
+    configure_revision_store(RevisionStore(args.state_path))
+    configure_keyword_cache(KeywordSheetCache(args.state_path))
+    configure_google_scheduler(QuotaScheduler({
+        "docs": args.docs_reads_per_minute,
+        "sheets": args.sheets_reads_per_minute,
+        "drive": DRIVE_QUERIES_PER_MINUTE
+    }))
+
+    configure_async_google(args.async_connections)
+    configure_token_cache(TokenCache(args.token_cache))
+    if args.stage != 'all':
+        configure_snapshot_store(SnapshotStore(args.snapshot_dir))
+
+    if args.stage == 'evaluate':
+        if manifest_rows is not None:
+            rows = manifest_rows
+        elif args.doc_id:
+            rows = [{'doc_id': args.doc_id, 'keywords_sheet': None,
+                     'keywords_tab': None, 'page_type': None}]
+        else:
+            rows = [
+                {'doc_id': doc_id, 'keywords_sheet': None,
+                 'keywords_tab': None, 'page_type': None}
+                for doc_id in snapshot_store.doc_ids()
+            ]
+        for row in rows:
+            row['page_type'] = row['page_type'] or args.page_type
+        if args.startup_profile:
+            _print_startup_profile()
+        print(f"Evaluating {len(rows)} snapshots with {args.workers} workers...")
+        batch_summary = run_manifest(
+            rows, None, None, args.workers, args.concurrency, args.combined,
+            stage='evaluate'
+        )
+        _print_run_summary(batch_summary)
         return
 
-    try:
-        print("Reading document...")
-        text = read_document(args.doc_id, docs_service)
-        if not text:
-            print("Failed to read document")
-            return
-
-        print("Reading keywords...")
-        keywords = read_keyword_list(args.keywords_sheet, sheets_service)
-        if not keywords:
-            print("Failed to read keywords")
-            return
-
-        page_type = args.page_type or detect_page_type_ai(text, keywords)
-        print(f"Page type detected: {page_type}")
-
-        print("Evaluating content with AI...")
-        checklist_results = evaluate_checklist(text, keywords, page_type)
-
-        print("Generating AI-powered suggestions...")
-        suggestions = generate_ai_suggestions(
-            text, keywords, checklist_results, page_type)
+    docs_service, sheets_service, drive_service = authenticate_google(args.google_connections)
+    if args.startup_profile:
+        _print_startup_profile()
+    if not docs_service or not sheets_service:
+        return
 
-        print("Generating report...")
-        report = generate_report(
-            text, keywords, checklist_results, suggestions, page_type)
+    if manifest_rows is not None:
+        rows = manifest_rows
+        for row in rows:
+            row['page_type'] = row['page_type'] or args.page_type
+            row['keywords_tab'] = row['keywords_tab'] or args.keywords_tab
+        print(f"Processing {len(rows)} documents with {args.workers} workers...")
+        batch_summary = run_manifest(
+            rows, docs_service, sheets_service, args.workers,
+            args.concurrency, args.combined, args.force, drive_service, args.stage
+        )
+        _print_run_summary(batch_summary)
+        return
 
-        output_filename = f"report_{args.doc_id}.md"
-        with open(output_filename, 'w', encoding='utf-8') as output_file:
-            output_file.write(report)
+    if args.stage == 'fetch':
+        content_hash = fetch_snapshot(
+            args.doc_id, args.keywords_sheet, docs_service, sheets_service,
+            args.page_type, args.keywords_tab, drive_service=drive_service
+        )
+        if content_hash:
+            print(f"Snapshot of {args.doc_id} stored as {content_hash}")
+        _print_run_summary()
+        return
 
-        print(f"Report saved as {output_filename}")
+    try:
+        process_document(
+            args.doc_id, args.keywords_sheet, docs_service, sheets_service,
+            args.page_type, args.concurrency, args.combined, args.keywords_tab,
+            args.force, drive_service=drive_service
+        )
+        _print_run_summary()
 
     except Exception as e:
         print(f"Error during execution: {e}")
@@ -0,0 +1,94 @@
+"""
+Single Flight Module
+
+This module coalesces identical concurrent calls: while a call for a key
+is in flight, further calls for the same key wait for it and share its
+result instead of being made again. Errors are not shared: when a call
+fails, the callers waiting on it each make their own call at once, since
+the error may come from the first caller's own limits (e.g. its deadline).
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+
+# Constants
+# Result a waiter sees when the call it joined failed
+_FAILED = object()
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing of identical in-flight calls.
+
+    Only calls that overlap in time are shared; once a call finishes its
+    key is forgotten, so caching results is left to the caller.
+
+    Attributes:
+        calls: Calls actually made
+        shared: Calls answered by an in-flight call instead of being made
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        """
+        Make a call, or wait for the identical one already in flight.
+
+        Args:
+            key: Identity of the call (e.g. a hash of the request payload)
+            call: Call to make if none is in flight for the key
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: Whatever this caller's own call raised
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.calls += 1
+
+        if not leader:
+            result = future.result()
+            if result is not _FAILED:
+                with self._lock:
+                    self.shared += 1
+                return result
+            # Waiters of a failed call retry side by side, not one after another
+            with self._lock:
+                self.calls += 1
+            return call()
+
+        try:
+            result = call()
+        except BaseException:
+            result = _FAILED
+            raise
+        finally:
+            # Forget the key first, so callers arriving after a failure start
+            # a new call; waiters must never be left hanging, even on
+            # KeyboardInterrupt
+            with self._lock:
+                del self._in_flight[key]
+            future.set_result(result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters for this process.
+
+        Returns:
+            Dictionary with calls made and calls shared
+        """
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
@@ -0,0 +1,235 @@
+"""
+Snapshot Store Module
+
+This module keeps local snapshots of fetched documents so they can be
+evaluated again without Google API calls. Document content is stored once
+per distinct content as a zlib-compressed blob named by its SHA-256 hash;
+an SQLite index maps each document to its latest blob together with the
+revision ID, keywords and fetch time.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from document_model import DocumentModel
+
+
+# Constants
+DEFAULT_SNAPSHOT_DIR = "snapshots"
+INDEX_FILENAME = "index.sqlite3"
+BLOB_SUFFIX = ".json.z"
+COMPRESSION_LEVEL = 6
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+
+class Snapshot:
+    """
+    A stored document with the inputs it was fetched with.
+
+    Attributes:
+        doc_id: Google Document ID
+        document: Document content and structure
+        keywords: Keyword list of the document's keyword sheet tab
+        keywords_sheet: Google Sheet ID the keywords were read from
+        keywords_tab: Tab of the keyword sheet, or None for the first tab
+        page_type: Page type from the manifest, or None to detect it
+        fetched_at: Unix time the snapshot was taken
+        content_hash: SHA-256 of the stored document blob
+    """
+
+    def __init__(self, doc_id: str, document: DocumentModel, keywords: List[str],
+                 keywords_sheet: Optional[str], keywords_tab: Optional[str],
+                 page_type: Optional[str], fetched_at: float, content_hash: str):
+        self.doc_id = doc_id
+        self.document = document
+        self.keywords = keywords
+        self.keywords_sheet = keywords_sheet
+        self.keywords_tab = keywords_tab
+        self.page_type = page_type
+        self.fetched_at = fetched_at
+        self.content_hash = content_hash
+
+
+class SnapshotStore:
+    """
+    Content-addressed, compressed store of fetched documents.
+
+    Blobs are immutable and written atomically, so concurrent fetches of the
+    same content are harmless; the index keeps one row per document.
+    """
+
+    def __init__(self, root: str = DEFAULT_SNAPSHOT_DIR):
+        self.root = root
+        self.written = 0
+        self.deduplicated = 0
+        self.read = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " doc_id TEXT PRIMARY KEY,"
+                " content_hash TEXT NOT NULL,"
+                " revision_id TEXT,"
+                " keywords TEXT NOT NULL,"
+                " keywords_sheet TEXT,"
+                " keywords_tab TEXT,"
+                " page_type TEXT,"
+                " fetched_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's SQLite connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                os.path.join(self.root, INDEX_FILENAME), timeout=SQLITE_TIMEOUT_SECONDS)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _blob_path(self, content_hash: str) -> str:
+        """Get the path of a blob, fanned out over 256 directories."""
+        return os.path.join(
+            self.root, "objects", content_hash[:2], content_hash[2:] + BLOB_SUFFIX)
+
+    def _write_blob(self, data: bytes) -> str:
+        """Store a blob unless identical content is already stored."""
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(content_hash)
+
+        if os.path.exists(path):
+            with self._stats_lock:
+                self.deduplicated += 1
+            return content_hash
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as blob_file:
+            blob_file.write(zlib.compress(data, COMPRESSION_LEVEL))
+        os.replace(temp_path, path)
+
+        with self._stats_lock:
+            self.written += 1
+        return content_hash
+
+    def put(self, doc_id: str, document: DocumentModel, keywords: List[str],
+            keywords_sheet: Optional[str] = None, keywords_tab: Optional[str] = None,
+            page_type: Optional[str] = None) -> Optional[str]:
+        """
+        Store a snapshot of a fetched document.
+
+        Args:
+            doc_id: Google Document ID
+            document: Fetched document
+            keywords: Keyword list used for the document
+            keywords_sheet: Google Sheet ID the keywords were read from
+            keywords_tab: Tab of the keyword sheet, or None for the first tab
+            page_type: Page type to evaluate with, or None to detect it
+
+        Returns:
+            Content hash of the stored document, or None if storing failed
+        """
+        # The revision ID lives in the index, so identical content shares a blob
+        content = document.to_dict()
+        del content["revision_id"]
+        data = json.dumps(content, ensure_ascii=False).encode("utf-8")
+
+        try:
+            content_hash = self._write_blob(data)
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshots "
+                    "(doc_id, content_hash, revision_id, keywords, keywords_sheet, "
+                    "keywords_tab, page_type, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (doc_id, content_hash, document.revision_id,
+                     json.dumps(keywords, ensure_ascii=False), keywords_sheet,
+                     keywords_tab, page_type, time.time())
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f"Snapshot write failed for {doc_id}: {e}")
+            return None
+
+        return content_hash
+
+    def get(self, doc_id: str) -> Optional[Snapshot]:
+        """
+        Load the latest snapshot of a document.
+
+        Args:
+            doc_id: Google Document ID
+
+        Returns:
+            Snapshot or None if the document has not been fetched
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT content_hash, revision_id, keywords, keywords_sheet, "
+                "keywords_tab, page_type, fetched_at FROM snapshots WHERE doc_id = ?",
+                (doc_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Snapshot index read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        (content_hash, revision_id, keywords, keywords_sheet, keywords_tab,
+         page_type, fetched_at) = row
+        try:
+            with open(self._blob_path(content_hash), "rb") as blob_file:
+                data = zlib.decompress(blob_file.read())
+        except (OSError, zlib.error) as e:
+            print(f"Snapshot read failed for {doc_id}: {e}")
+            return None
+
+        with self._stats_lock:
+            self.read += 1
+
+        document = DocumentModel.from_dict(json.loads(data))
+        document.revision_id = revision_id
+        return Snapshot(
+            doc_id, document, json.loads(keywords),
+            keywords_sheet, keywords_tab, page_type, fetched_at, content_hash)
+
+    def doc_ids(self) -> List[str]:
+        """
+        List the documents with a snapshot.
+
+        Returns:
+            Document IDs in fetch order
+        """
+        try:
+            rows = self._connection().execute(
+                "SELECT doc_id FROM snapshots ORDER BY fetched_at").fetchall()
+        except sqlite3.Error as e:
+            print(f"Snapshot index read failed: {e}")
+            return []
+        return [row[0] for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get snapshot counters for this process.
+
+        Returns:
+            Dictionary with written, deduplicated and read counts
+        """
+        with self._stats_lock:
+            return {
+                "written": self.written,
+                "deduplicated": self.deduplicated,
+                "read": self.read
+            }
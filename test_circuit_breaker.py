@@ -0,0 +1,168 @@
+"""
+Tests for the OpenAI circuit breaker.
+
+The breaker opens after consecutive service failures, probes after its
+cool-down and closes or re-opens on the probe's outcome. Request errors
+(4xx, 429) count as answered calls, and timeouts set by an evaluation
+deadline count as neither failures nor successes.
+"""
+
+import time
+
+import httpx
+import openai
+import pytest
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from seo_proofreader import _evaluation_deadline, _is_deadline_timeout, _is_openai_outage
+
+
+FAILURE_THRESHOLD = 3
+OPEN_SECONDS = 0.05
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _breaker() -> CircuitBreaker:
+    """Breaker configured the way main configures the OpenAI one."""
+    return CircuitBreaker(
+        "OpenAI",
+        failure_threshold=FAILURE_THRESHOLD,
+        latency_threshold=None,
+        open_seconds=OPEN_SECONDS,
+        is_failure=_is_openai_outage,
+        is_ignored=_is_deadline_timeout
+    )
+
+
+def _status_error(status: int) -> openai.APIStatusError:
+    """OpenAI error for a response with the given status."""
+    return openai.APIStatusError(
+        f"status {status}", response=httpx.Response(status, request=REQUEST), body=None)
+
+
+def _fail_with(breaker: CircuitBreaker, error: Exception) -> None:
+    """Make a call through the breaker that raises error."""
+    def _call() -> None:
+        raise error
+
+    with pytest.raises(type(error)):
+        breaker.call(_call)
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    """Open the breaker with consecutive outage failures."""
+    for _ in range(FAILURE_THRESHOLD):
+        _fail_with(breaker, _status_error(503))
+    assert breaker.state == OPEN
+
+
+def test_opens_after_consecutive_outage_failures():
+    """N outage failures open the circuit; open calls are refused without being made."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD - 1):
+        _fail_with(breaker, openai.APIConnectionError(request=REQUEST))
+    assert breaker.state == CLOSED
+
+    _fail_with(breaker, _status_error(500))
+    assert breaker.state == OPEN
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: calls.append(1))
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert not calls
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_success_resets_consecutive_failures():
+    """Failures only open the circuit when no call succeeds in between."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD - 1):
+        _fail_with(breaker, _status_error(502))
+    breaker.call(lambda: "ok")
+    for _ in range(FAILURE_THRESHOLD - 1):
+        _fail_with(breaker, _status_error(502))
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 429])
+def test_request_errors_do_not_count(status):
+    """4xx answers, throttling included, mean the service is up."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD * 2):
+        _fail_with(breaker, _status_error(status))
+    assert breaker.state == CLOSED
+    assert breaker.stats()["failures"] == 0
+
+
+def test_half_open_probe_success_closes():
+    """After the cool-down one probe is let through; its success closes the circuit."""
+    breaker = _breaker()
+    _open(breaker)
+    time.sleep(OPEN_SECONDS)
+
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+    states = [new for _, _, new, _ in breaker.stats()["transitions"]]
+    assert states == [OPEN, HALF_OPEN, CLOSED]
+
+
+def test_half_open_probe_failure_reopens():
+    """A failed probe opens the circuit for another cool-down."""
+    breaker = _breaker()
+    _open(breaker)
+    time.sleep(OPEN_SECONDS)
+
+    _fail_with(breaker, openai.APITimeoutError(request=REQUEST))
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_half_open_admits_one_probe_at_a_time():
+    """While a probe is in flight, other calls are refused."""
+    breaker = _breaker()
+    _open(breaker)
+    time.sleep(OPEN_SECONDS)
+
+    def _probe() -> str:
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "second")
+        return "first"
+
+    assert breaker.call(_probe) == "first"
+    assert breaker.state == CLOSED
+
+
+def test_deadline_timeouts_are_ignored():
+    """Timeouts set by an evaluation deadline neither open nor close the circuit."""
+    breaker = _breaker()
+    token = _evaluation_deadline.set(time.monotonic() + 60)
+    try:
+        for _ in range(FAILURE_THRESHOLD * 2):
+            _fail_with(breaker, openai.APITimeoutError(request=REQUEST))
+        assert breaker.state == CLOSED
+        assert breaker.stats()["failures"] == 0
+
+        _evaluation_deadline.reset(token)
+        _open(breaker)
+        time.sleep(OPEN_SECONDS)
+        token = _evaluation_deadline.set(time.monotonic() + 60)
+
+        # The probe timed out on the caller's deadline: still half-open, and
+        # the next call is let through as a fresh probe
+        _fail_with(breaker, openai.APITimeoutError(request=REQUEST))
+        assert breaker.state == HALF_OPEN
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CLOSED
+    finally:
+        _evaluation_deadline.reset(token)
+
+
+def test_timeouts_without_deadline_count_as_outages():
+    """Without an evaluation deadline, a timeout means OpenAI is slow to answer."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD):
+        _fail_with(breaker, openai.APITimeoutError(request=REQUEST))
+    assert breaker.state == OPEN
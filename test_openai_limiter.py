@@ -0,0 +1,124 @@
+"""
+Tests for the shared OpenAI rate limiter.
+
+Quota reserved for a call that is never made is given back, the
+concurrency limit is halved on throttling and grown only by successes, and
+extra calls such as hedges are only admitted when they need not wait.
+"""
+
+import random
+import time
+
+import httpx
+import openai
+import pytest
+
+from openai_limiter import OpenAIRateLimiter, RateLimitBudgetExceeded
+
+
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+MAX_IN_FLIGHT = 8
+# One request per second, so waits are easy to reason about
+REQUESTS_PER_MINUTE = 60
+# Shorter than the first retry's backoff, so failed calls are not retried
+NO_RETRY_SECONDS = 0.1
+
+
+class _Response:
+    """Raw response stand-in without rate limit headers."""
+
+    headers = {}
+
+
+def _status_error(status: int) -> openai.APIStatusError:
+    """OpenAI error for a response with the given status."""
+    return openai.APIStatusError(
+        f"status {status}", response=httpx.Response(status, request=REQUEST), body=None)
+
+
+@pytest.fixture(autouse=True)
+def _longest_backoff(monkeypatch):
+    """Make the jittered backoff its ceiling, so retries are predictable."""
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+
+
+def _fail_once(limiter: OpenAIRateLimiter, error: Exception) -> None:
+    """Make a call that fails with error and is not retried before its deadline."""
+    def _call() -> None:
+        raise error
+
+    with pytest.raises(type(error)):
+        limiter.run(_call, 1, deadline=time.monotonic() + NO_RETRY_SECONDS)
+
+
+def _limiter() -> OpenAIRateLimiter:
+    """Limiter with plenty of token quota and MAX_IN_FLIGHT slots."""
+    return OpenAIRateLimiter(REQUESTS_PER_MINUTE, 10 ** 7, MAX_IN_FLIGHT)
+
+
+def test_rejected_calls_refund_their_quota():
+    """Calls refused for lack of quota do not push later calls further back."""
+    limiter = _limiter()
+    limiter.request_bucket.reserve(REQUESTS_PER_MINUTE)
+    calls = []
+
+    for _ in range(3):
+        with pytest.raises(RateLimitBudgetExceeded):
+            limiter.run(lambda: calls.append(1), 1,
+                        deadline=time.monotonic() + NO_RETRY_SECONDS)
+
+    assert not calls
+    assert limiter.stats()["exhausted"] == 3
+    # Only the next request's own token is owed, not the rejected calls' too
+    assert limiter.request_bucket.reserve(1) == pytest.approx(1.0, abs=0.1)
+
+
+def test_throttling_halves_the_limit_once_per_interval():
+    """A 429 halves the concurrency limit; a burst of them only halves it once."""
+    limiter = _limiter()
+
+    _fail_once(limiter, _status_error(429))
+    assert limiter.stats()["limit"] == MAX_IN_FLIGHT // 2
+    _fail_once(limiter, _status_error(429))
+    assert limiter.stats()["limit"] == MAX_IN_FLIGHT // 2
+    assert limiter.stats()["throttled"] == 2
+    assert limiter.in_flight == 0
+
+
+def test_only_successes_grow_the_limit():
+    """Server errors leave the limit alone; successes grow it additively."""
+    limiter = _limiter()
+    _fail_once(limiter, _status_error(429))
+    limit = limiter.limit
+
+    _fail_once(limiter, _status_error(500))
+    assert limiter.limit == limit
+
+    limiter.run(_Response, 1)
+    assert limiter.limit == pytest.approx(limit + 1 / limit)
+
+
+def test_extra_calls_take_quota_and_a_slot():
+    """An admitted extra call holds a slot and is counted like any request."""
+    limiter = _limiter()
+    in_flight = []
+
+    extra = limiter.try_extra(lambda: in_flight.append(limiter.in_flight) or _Response(), 1)
+    assert extra is not None
+    extra()
+
+    assert in_flight == [1]
+    assert limiter.in_flight == 0
+    assert limiter.stats()["requests"] == 1
+
+
+def test_extra_calls_are_refused_rather_than_waiting():
+    """Without free quota or a free slot, no extra call is admitted and no quota is lost."""
+    limiter = _limiter()
+    limiter.request_bucket.reserve(REQUESTS_PER_MINUTE)
+    assert limiter.try_extra(_Response, 1) is None
+    assert limiter.request_bucket.reserve(1) == pytest.approx(1.0, abs=0.1)
+
+    limiter = OpenAIRateLimiter(REQUESTS_PER_MINUTE, 10 ** 7, 1)
+    limiter.run(lambda: limiter.try_extra(_Response, 1) or _Response(), 1)
+    assert limiter.stats()["requests"] == 1
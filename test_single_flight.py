@@ -0,0 +1,101 @@
+"""
+Tests for coalescing identical in-flight calls.
+
+Identical callers share a successful result. When the shared call fails,
+each caller that waited on it makes its own call at once, so coalescing
+never makes callers slower than calling on their own.
+"""
+
+import threading
+import time
+from typing import List
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+CALL_SECONDS = 0.2
+CALLERS = 8
+
+
+def _run_callers(single_flight: SingleFlight, leader_call, waiter_call,
+                 outcomes: List[object]) -> float:
+    """Start a leader, then waiters on the same key; return the waiters' worst latency."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def _caller(call) -> None:
+        start = time.monotonic()
+        try:
+            outcome = single_flight.do("key", call)
+        except Exception as e:
+            outcome = e
+        with lock:
+            outcomes.append(outcome)
+            latencies.append(time.monotonic() - start)
+
+    leader = threading.Thread(target=_caller, args=(leader_call,))
+    leader.start()
+    time.sleep(CALL_SECONDS / 4)
+    waiters = [threading.Thread(target=_caller, args=(waiter_call,))
+               for _ in range(CALLERS - 1)]
+    for waiter in waiters:
+        waiter.start()
+    for thread in [leader] + waiters:
+        thread.join()
+    return max(latencies)
+
+
+def test_success_is_shared():
+    """Overlapping callers get the one call's result."""
+    single_flight = SingleFlight()
+    calls = []
+
+    def _call() -> str:
+        calls.append(1)
+        time.sleep(CALL_SECONDS)
+        return "result"
+
+    outcomes: List[object] = []
+    _run_callers(single_flight, _call, _call, outcomes)
+
+    assert outcomes == ["result"] * CALLERS
+    assert len(calls) == 1
+    assert single_flight.stats() == {"calls": 1, "shared": CALLERS - 1}
+
+
+def test_failure_is_not_shared_and_waiters_retry_in_parallel():
+    """Waiters of a failed call make their own calls side by side."""
+    single_flight = SingleFlight()
+
+    def _failing() -> str:
+        time.sleep(CALL_SECONDS)
+        raise TimeoutError("leader deadline")
+
+    def _succeeding() -> str:
+        time.sleep(CALL_SECONDS)
+        return "fresh"
+
+    outcomes: List[object] = []
+    worst = _run_callers(single_flight, _failing, _succeeding, outcomes)
+
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    assert len(errors) == 1 and str(errors[0]) == "leader deadline"
+    assert outcomes.count("fresh") == CALLERS - 1
+    assert single_flight.stats() == {"calls": CALLERS, "shared": 0}
+    # One failed call plus one retry, not one retry after another
+    assert worst < CALL_SECONDS * 3
+
+
+def test_key_is_forgotten_after_failure():
+    """A call after a failure starts afresh instead of seeing the old error."""
+    single_flight = SingleFlight()
+
+    def _failing() -> str:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", _failing)
+
+    assert single_flight.do("key", lambda: "ok") == "ok"
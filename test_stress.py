@@ -0,0 +1,120 @@
+"""
+Stress tests for the rule-based evaluators.
+
+Every rule is timed on adversarial inputs of growing size. Run time has to
+grow roughly linearly with the input, so no rule can go quadratic on large
+pasted CMS exports or hostile markup.
+"""
+
+import time
+from typing import Callable, Dict
+
+import pytest
+
+from seo_proofreader import (
+    _calculate_keyword_density,
+    _detect_page_type_fallback,
+    _evaluate_formatting,
+    _evaluate_grammar_spelling_fallback,
+    _evaluate_internal_linking,
+    _evaluate_local_relevance_fallback,
+    _evaluate_pricing_focus_fallback,
+    _evaluate_readability_fallback,
+    _evaluate_structure_fallback,
+    extract_city_name
+)
+from text_analysis import TextAnalysis
+
+
+SMALL_SIZE = 16 * 1024
+SCALE_FACTOR = 8
+# Linear rules grow ~8x between sizes, quadratic ones ~64x
+MAX_GROWTH = SCALE_FACTOR * 3
+# Runs faster than this at the large size are too quick to matter
+MIN_SIGNIFICANT_SECONDS = 0.002
+REPEATS = 3
+
+KEYWORDS = ["house cleaning", "price", "cleaning cost amsterdam", "aa aa"]
+
+ADVERSARIAL_UNITS = {
+    "price_without_digits": "price ",
+    "unclosed_anchors": '<a href="x">',
+    "nested_anchor_openers": "<a ",
+    "anchor_without_close": '<a href="/x">Top 10 ',
+    "unclosed_headings": "<h1 ",
+    "blank_lines": "\n",
+    "indented_blank_lines": " \n",
+    "bullet_lookalikes": "\n 1",
+    "capitalised_words": "Aa ",
+    "prepositions": "in ",
+    "currency_signs": "€ ",
+    "long_digit_run": "1",
+    "double_spaces": "  ",
+    "space_before_punctuation": " .",
+    "joined_sentences": "a.B",
+    "repeated_keyword": "aa ",
+}
+
+EVALUATORS: Dict[str, Callable[[TextAnalysis], object]] = {
+    "grammar_spelling": lambda analysis: _evaluate_grammar_spelling_fallback(
+        analysis, KEYWORDS, "cost", None),
+    "readability": lambda analysis: _evaluate_readability_fallback(
+        analysis, KEYWORDS, "cost", None),
+    "keyword_density": lambda analysis: _calculate_keyword_density(analysis, KEYWORDS),
+    "content_structure": _evaluate_structure_fallback,
+    "local_relevance": lambda analysis: _evaluate_local_relevance_fallback(
+        analysis, "Amsterdam"),
+    "pricing_focus": _evaluate_pricing_focus_fallback,
+    "internal_linking": _evaluate_internal_linking,
+    "formatting": _evaluate_formatting,
+    "page_type": lambda analysis: _detect_page_type_fallback(analysis, KEYWORDS),
+    "city_name": lambda analysis: extract_city_name(analysis.text, []),
+}
+
+
+def _build_input(unit: str, size: int) -> str:
+    """Repeat a unit until the text is at least size characters long."""
+    return unit * (size // len(unit) + 1)
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    """Best wall-clock time of several runs."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _assert_linear(name: str, func_for_text: Callable[[str], Callable[[], object]]) -> None:
+    """Assert that a rule scales roughly linearly on every adversarial input."""
+    for input_name, unit in ADVERSARIAL_UNITS.items():
+        small = _best_time(func_for_text(_build_input(unit, SMALL_SIZE)))
+        large = _best_time(func_for_text(_build_input(unit, SMALL_SIZE * SCALE_FACTOR)))
+
+        if large < MIN_SIGNIFICANT_SECONDS:
+            continue
+
+        growth = large / max(small, 1e-9)
+        assert growth < MAX_GROWTH, (
+            f"{name} grew {growth:.1f}x on '{input_name}' for a "
+            f"{SCALE_FACTOR}x larger input ({small * 1000:.2f} ms -> {large * 1000:.2f} ms)"
+        )
+
+
+def test_text_analysis_scales_linearly():
+    """Building the shared analysis (tokens, links, fused rule scan) is linear."""
+    _assert_linear("TextAnalysis", lambda text: lambda: TextAnalysis(text))
+
+
+@pytest.mark.parametrize("rule_name", sorted(EVALUATORS))
+def test_rule_scales_linearly(rule_name):
+    """Every evaluator is linear on top of a prebuilt analysis."""
+    evaluator = EVALUATORS[rule_name]
+
+    def _prepare(text: str) -> Callable[[], object]:
+        analysis = TextAnalysis(text)
+        return lambda: evaluator(analysis)
+
+    _assert_linear(rule_name, _prepare)
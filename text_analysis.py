@@ -0,0 +1,181 @@
+"""
+Text Analysis Module
+
+This module pre-processes document text once so that every rule-based
+evaluator can share the lowered text, word and sentence boundaries,
+paragraphs, links and rule hits instead of re-scanning the full document
+per rule.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from document_model import DocumentModel
+from rule_scanner import ForwardFinder, scan_rules
+
+
+# Patterns
+WORD_PATTERN = re.compile(r'\S+')
+SENTENCE_PATTERN = re.compile(r'[^.!?]+')
+PARAGRAPH_PATTERN = re.compile(r'[^\n]+')
+LINK_OPEN_PATTERN = re.compile(r'<a', re.IGNORECASE)
+LINK_CLOSE_PATTERN = re.compile(r'</a>', re.IGNORECASE)
+HREF_PATTERN = re.compile(r'href="', re.IGNORECASE)
+
+Span = Tuple[int, int]
+
+
+class TextAnalysis:
+    """
+    Pre-computed view of a document shared by the rule-based evaluators.
+
+    Attributes:
+        text: Original content text
+        lower: Lower-cased content text
+        words: (start, end) offsets of whitespace-separated word tokens
+        sentences: (start, end) offsets of non-empty sentences, stripped
+        sentence_word_counts: Number of words in each sentence
+        paragraphs: (start, end) offsets of non-empty lines, stripped
+        links: (href, link_text) pairs of the document's links, or of HTML
+            anchors in the text when there is no document model
+        rule_hits: Hits of the fused grammar, pricing, structure and
+            formatting rules (see rule_scanner)
+        heading_counts: Number of headings by level, from the document model
+            when there is one and from <h1>-<h3> tags otherwise
+        has_lists: Whether the content has bullet or numbered list items
+        document: Structured Google Docs model the text came from, if any
+    """
+
+    def __init__(self, text: str, document: Optional[DocumentModel] = None):
+        self.text = text
+        self.document = document
+        self.lower = text.lower()
+        self.words = [match.span() for match in WORD_PATTERN.finditer(text)]
+        self.sentences = _strip_spans(text, SENTENCE_PATTERN)
+        self.sentence_word_counts = [
+            len(text[start:end].split()) for start, end in self.sentences
+        ]
+        self.paragraphs = _strip_spans(text, PARAGRAPH_PATTERN)
+        self.rule_hits = scan_rules(text, self.lower)
+
+        self.links: List[Tuple[str, str]]
+        self.heading_counts: Dict[int, int]
+        if document is not None:
+            # Docs text carries no markup, so structure comes from the model
+            self.links = document.links
+            self.heading_counts = document.heading_counts
+            self.has_lists = bool(document.list_items) or self.rule_hits.bullets
+        else:
+            self.links = extract_links(text)
+            self.heading_counts = self.rule_hits.heading_counts
+            self.has_lists = self.rule_hits.bullets
+
+    @property
+    def word_count(self) -> int:
+        """Number of word tokens in the text."""
+        return len(self.words)
+
+    def word(self, index: int) -> str:
+        """Get the word token at an index."""
+        start, end = self.words[index]
+        return self.text[start:end]
+
+    def sentence(self, index: int) -> str:
+        """Get the sentence at an index."""
+        start, end = self.sentences[index]
+        return self.text[start:end]
+
+    def paragraph(self, index: int) -> str:
+        """Get the paragraph at an index."""
+        start, end = self.paragraphs[index]
+        return self.text[start:end]
+
+
+def extract_links(text: str) -> List[Tuple[str, str]]:
+    """
+    Extract HTML anchors in linear time.
+
+    Matches what the pattern <a[^>]*href="([^"]*)"[^>]*>(.*?)</a> finds in
+    well-formed markup, without its backtracking: every delimiter lookup
+    resumes from the previous one, so hostile input with many unclosed tags
+    costs one pass instead of one pass per tag.
+
+    Args:
+        text: Content text
+
+    Returns:
+        List of (href, link_text) pairs
+    """
+    links = []
+    tag_closes = ForwardFinder(text, '>')
+    value_tag_closes = ForwardFinder(text, '>')
+    quotes = ForwardFinder(text, '"')
+    newlines = ForwardFinder(text, '\n')
+    link_closes = ForwardFinder(text, LINK_CLOSE_PATTERN)
+    href_tag_close = -1
+    last_href: Optional[Span] = None
+    resume = 0
+
+    for open_match in LINK_OPEN_PATTERN.finditer(text):
+        start = open_match.start()
+        if start < resume:
+            continue
+
+        tag_close = tag_closes.find(open_match.end())
+        if tag_close == -1:
+            break
+
+        # Like the greedy [^>]*, use the last href in the tag; anchors opened
+        # inside the same tag share that lookup
+        if tag_close != href_tag_close:
+            href_tag_close = tag_close
+            last_href = None
+            for href_match in HREF_PATTERN.finditer(text, open_match.end(), tag_close):
+                last_href = href_match.span()
+        if last_href is None or last_href[0] < open_match.end():
+            continue
+
+        value_start = last_href[1]
+        value_end = quotes.find(value_start)
+        if value_end == -1:
+            break
+
+        tag_end = value_tag_closes.find(value_end + 1)
+        if tag_end == -1:
+            break
+
+        close = link_closes.find(tag_end + 1)
+        if close == -1:
+            break
+
+        newline = newlines.find(tag_end + 1)
+        if newline != -1 and newline < close:
+            continue
+
+        links.append((text[value_start:value_end], text[tag_end + 1:close]))
+        resume = close + len('</a>')
+
+    return links
+
+
+def _strip_spans(text: str, pattern: re.Pattern) -> List[Span]:
+    """
+    Get stripped, non-empty spans of every match of a pattern.
+
+    Args:
+        text: Content text
+        pattern: Compiled pattern whose matches delimit the spans
+
+    Returns:
+        List of (start, end) offsets
+    """
+    spans = []
+
+    for match in pattern.finditer(text):
+        segment = match.group()
+        stripped = segment.strip()
+        if stripped:
+            start = match.start() + (len(segment) - len(segment.lstrip()))
+            spans.append((start, start + len(stripped)))
+
+    return spans
@@ -0,0 +1,156 @@
+"""
+Token Cache Module
+
+This module persists refreshed OAuth access tokens with their expiry in a
+file shared by concurrent processes, so a run starts with a cached token
+instead of refreshing it, and parallel workers refresh it only once.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked reads and atomic writes
+    fcntl = None
+
+
+# Constants
+DEFAULT_TOKEN_CACHE_PATH = "proofreader_token.json"
+# Tokens expiring sooner than this are refreshed rather than reused
+MIN_REMAINING_SECONDS = 300
+
+
+class TokenCache:
+    """
+    File-backed cache of OAuth access tokens keyed by client and refresh token.
+
+    Refreshes are serialised by an exclusive lock on a side file, and the
+    cache is re-read once the lock is held, so when several processes find
+    the token expired only the first one refreshes it.
+    """
+
+    def __init__(self, path: str = DEFAULT_TOKEN_CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _key(credentials: Any) -> str:
+        """Identify the account and client a token belongs to."""
+        identity = f"{credentials.client_id}:{credentials.refresh_token}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold a shared or exclusive lock on the cache's lock file."""
+        if fcntl is None:
+            yield
+            return
+
+        with open(f"{self.path}.lock", "a", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        """Read every cached token; a missing or corrupt file reads as empty."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Token cache read failed: {e}")
+            return {}
+
+    def _write(self, tokens: Dict[str, Dict[str, str]]) -> None:
+        """Replace the cache file atomically, readable by the owner only."""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(tokens, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Token cache write failed: {e}")
+
+    def _apply(self, credentials: Any, tokens: Dict[str, Dict[str, str]]) -> bool:
+        """Load a cached token into credentials if it is valid for long enough."""
+        entry = tokens.get(self._key(credentials))
+        if not entry:
+            return False
+
+        try:
+            expiry = datetime.datetime.fromisoformat(entry["expiry"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        remaining = expiry - datetime.datetime.utcnow()
+        if remaining.total_seconds() < MIN_REMAINING_SECONDS:
+            return False
+
+        credentials.token = entry["token"]
+        credentials.expiry = expiry
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def load(self, credentials: Any) -> bool:
+        """
+        Load a still-valid cached access token into credentials.
+
+        Args:
+            credentials: google.oauth2.credentials.Credentials
+
+        Returns:
+            True if a cached token was loaded
+        """
+        with self._file_lock(exclusive=False):
+            tokens = self._read()
+        return self._apply(credentials, tokens)
+
+    def refresh(self, credentials: Any, request: Any) -> None:
+        """
+        Refresh credentials, unless another process already has.
+
+        Args:
+            credentials: google.oauth2.credentials.Credentials
+            request: google.auth transport request used for the refresh
+        """
+        with self._refresh_lock, self._file_lock(exclusive=True):
+            tokens = self._read()
+            if self._apply(credentials, tokens):
+                return
+
+            credentials.refresh(request)
+            with self._lock:
+                self.refreshes += 1
+            if credentials.token and credentials.expiry:
+                tokens[self._key(credentials)] = {
+                    "token": credentials.token,
+                    "expiry": credentials.expiry.isoformat()
+                }
+                self._write(tokens)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get token counters for this process.
+
+        Returns:
+            Dictionary with hits (cached tokens used) and refreshes
+        """
+        with self._lock:
+            return {"hits": self.hits, "refreshes": self.refreshes}